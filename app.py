@@ -1,12 +1,28 @@
+import time
+
 import streamlit as st
 import pandas as pd
 from pathlib import Path
 
-from src.preprocessing import load_csv
-from src.categorize import categorize_transactions
+from src.cache import content_hash
+from src.dedup import DedupResult, deduplicate
 from src.analysis import monthly_totals, category_totals, net_balance
-from src.visualization import plot_expenses_by_category, plot_monthly_trend
-from src.budget import check_budget, BudgetError
+from src.anomaly import FLAG_COLUMN, SCORE_COLUMN, score_anomalies
+from src.pagination import page_count, paginate
+from src.visualization import (
+    plot_daily_trend,
+    plot_expenses_by_category,
+    plot_monthly_trend,
+    plot_transactions,
+)
+from src.budget import BudgetError, evaluate_budget, format_budget_alerts
+from src.jobs import UploadJob
+
+# Uploads kept per cached stage; older ones are evicted first.
+CACHE_ENTRIES = 8
+# How often the progress panel of a running upload refreshes.
+PROGRESS_REFRESH_SECONDS = 0.5
+RAW_DATA_PAGE_SIZES = [50, 200, 1000, 5000]
 
 # ----------------------------
 # STREAMLIT APP CONFIG
@@ -20,6 +36,124 @@ st.set_page_config(
 st.title("💰 Finance Expense Analyzer")
 st.caption("Analyze your expenses, visualize trends, and track budgets.")
 
+# ----------------------------
+# CACHED PIPELINE STAGES
+# ----------------------------
+# Stages are keyed on the upload's content hash; arguments starting with "_"
+# are not hashed by Streamlit. Each stage records when its body actually runs
+# so the timing panel can tell cache hits from recomputation.
+executed_stages: set[str] = set()
+stage_timings: list[dict[str, object]] = []
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES, show_spinner=False)
+def dedup_stage(digest: str, window_days: int, _df: pd.DataFrame) -> DedupResult:
+    executed_stages.add("deduplicate")
+    return deduplicate(_df, window_days=window_days)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES, show_spinner=False)
+def summary_stage(digest: str, _df: pd.DataFrame) -> dict[str, object]:
+    executed_stages.add("aggregate")
+    return {
+        "net_balance": net_balance(_df),
+        "categories": _df["category"].nunique(),
+        "transactions": len(_df),
+        "category_totals": category_totals(_df),
+    }
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES, show_spinner=False)
+def anomaly_stage(digest: str, _df: pd.DataFrame) -> pd.DataFrame:
+    executed_stages.add("anomalies")
+    # Score a column subset so the cached upload frame is not modified.
+    columns = [c for c in ("category", "amount", "amount_cents") if c in _df.columns]
+    return score_anomalies(_df[columns])[[SCORE_COLUMN, FLAG_COLUMN]]
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES, show_spinner=False)
+def charts_stage(digest: str, _df: pd.DataFrame):
+    executed_stages.add("charts")
+    # Daily and per-transaction charts are downsampled to a fixed point budget.
+    return (
+        plot_expenses_by_category(_df),
+        plot_monthly_trend(_df),
+        plot_daily_trend(_df),
+        plot_transactions(_df),
+    )
+
+
+def run_stage(name: str, func, *args, cached: bool = True):
+    executed_stages.discard(name)
+    start = time.perf_counter()
+    result = func(*args)
+    stage_timings.append(
+        {
+            "stage": name,
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+            "source": "cache" if cached and name not in executed_stages else "computed",
+        }
+    )
+    return result
+
+
+def upload_digest(upload) -> str:
+    # Hash each upload once; reruns reuse the digest stored for its file_id.
+    digests = st.session_state.setdefault("upload_digests", {})
+    file_id = getattr(upload, "file_id", None)
+    if file_id is None or file_id not in digests:
+        executed_stages.add("hash upload")
+        digest = content_hash(upload)
+        if file_id is None:
+            return digest
+        digests.clear()
+        digests[file_id] = digest
+    return digests[file_id]
+
+
+def upload_job(upload, digest: str) -> UploadJob:
+    # Load & categorize in the background; a different upload cancels the
+    # job still working on the previous one.
+    job = st.session_state.get("upload_job")
+    if job is None or job.digest != digest:
+        if job is not None:
+            job.cancel()
+        job = UploadJob(upload, digest=digest).start()
+        st.session_state["upload_job"] = job
+    return job
+
+
+def cancel_upload_job() -> None:
+    job = st.session_state.pop("upload_job", None)
+    if job is not None:
+        job.cancel()
+
+
+@st.fragment(run_every=PROGRESS_REFRESH_SECONDS)
+def upload_progress(job: UploadJob) -> None:
+    # Only this fragment reruns while the job works; the full app reruns once it is done.
+    if job.done():
+        st.rerun()
+    progress = job.progress()
+    st.progress(
+        progress.fraction or 0.0,
+        text=f"⏳ Parsed {progress.rows_parsed:,} rows · categorized {progress.rows_categorized:,} "
+        f"({progress.seconds:.1f}s)",
+    )
+    partial = job.partial_summary()
+    if partial is None:
+        return
+    st.caption("Partial summary of the rows processed so far")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Net Balance (€)", f"{partial['net_balance']:.2f}")
+    with col2:
+        st.metric("Total Categories", partial["categories"])
+    with col3:
+        st.metric("Transactions", partial["transactions"])
+    st.dataframe(partial["category_totals"])
+
+
 # ----------------------------
 # SIDEBAR: Budget settings
 # ----------------------------
@@ -31,6 +165,16 @@ budgets = {
     "Entertainment": st.sidebar.number_input("Entertainment budget (€)", value=100),
 }
 
+st.sidebar.header("🧹 Duplicates")
+drop_duplicates = st.sidebar.checkbox(
+    "Remove duplicate transactions",
+    value=False,
+    help="For uploads that merge overlapping exports; a single ledger can repeat legitimately.",
+)
+window_days = st.sidebar.number_input(
+    "Near-duplicate window (days)", min_value=0, max_value=7, value=0, disabled=not drop_duplicates
+)
+
 # ----------------------------
 # MAIN APP: Upload CSV
 # ----------------------------
@@ -38,9 +182,33 @@ uploaded_file = st.file_uploader("📂 Upload your CSV file", type=["csv"])
 
 if uploaded_file is not None:
     try:
-        # Load & categorize
-        df = load_csv(uploaded_file)
-        df = categorize_transactions(df)
+        digest = run_stage("hash upload", upload_digest, uploaded_file)
+
+        # Load & categorize (served from the columnar cache on re-upload)
+        job = upload_job(uploaded_file, digest)
+        if not job.done():
+            upload_progress(job)
+            st.stop()
+        df = job.result()
+        loaded = job.progress()
+        stage_timings.append(
+            {
+                "stage": "load & categorize",
+                "ms": round(loaded.seconds * 1000, 1),
+                "source": "cache" if loaded.from_cache else "computed",
+            }
+        )
+        if drop_duplicates:
+            deduped = run_stage("deduplicate", dedup_stage, digest, int(window_days), df)
+            df = deduped.frame
+            # Downstream stages depend on which rows survived.
+            digest = f"{digest}:dedup{int(window_days)}"
+            if deduped.removed:
+                st.info(
+                    f"🧹 Removed {deduped.removed} duplicate transactions "
+                    f"({deduped.exact_duplicates} exact, {deduped.near_duplicates} near)."
+                )
+        summary = run_stage("aggregate", summary_stage, digest, df)
 
         # Tabs navigation
         tab1, tab2, tab3, tab4 = st.tabs(["📊 Summary", "📈 Charts", "🚨 Budget Alerts", "📂 Raw Data"])
@@ -50,33 +218,38 @@ if uploaded_file is not None:
             st.subheader("📊 Expense Summary")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Net Balance (€)", f"{net_balance(df):.2f}")
+                st.metric("Net Balance (€)", f"{summary['net_balance']:.2f}")
             with col2:
-                st.metric("Total Categories", df["category"].nunique())
+                st.metric("Total Categories", summary["categories"])
             with col3:
-                st.metric("Transactions", len(df))
+                st.metric("Transactions", summary["transactions"])
 
             st.write("### Category Totals (€)")
-            st.dataframe(category_totals(df))
+            st.dataframe(summary["category_totals"])
 
         # --- Tab 2: Charts
         with tab2:
             st.subheader("📈 Charts")
+            category_fig, monthly_fig, daily_fig, transactions_fig = run_stage(
+                "charts", charts_stage, digest, df
+            )
             col1, col2 = st.columns(2)
             with col1:
-                fig = plot_expenses_by_category(df)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(category_fig, use_container_width=True)
             with col2:
-                fig = plot_monthly_trend(df)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(monthly_fig, use_container_width=True)
+            st.plotly_chart(daily_fig, use_container_width=True)
+            st.plotly_chart(transactions_fig, use_container_width=True)
 
         # --- Tab 3: Budget Alerts
         with tab3:
             st.subheader("🚨 Budget Alerts")
             try:
-                alerts = check_budget(df, budgets)
-                for alert in alerts:
-                    if "⚠️" in alert:
+                # Budgets only need the precomputed per-category totals.
+                totals = summary["category_totals"].rename(columns={"total_amount": "amount"})
+                result = run_stage("budget", evaluate_budget, totals, budgets, cached=False)
+                for alert, exceeded in zip(format_budget_alerts(result), result["exceeded"]):
+                    if exceeded:
                         st.error(alert)
                     else:
                         st.success(alert)
@@ -86,10 +259,30 @@ if uploaded_file is not None:
         # --- Tab 4: Raw Data
         with tab4:
             st.subheader("📂 Raw Data")
-            st.dataframe(df)
+            scores = run_stage("anomalies", anomaly_stage, digest, df)
+            rows = df
+            if st.checkbox(f"Show only unusual transactions ({int(scores[FLAG_COLUMN].sum())})"):
+                flagged = scores.loc[scores[FLAG_COLUMN], SCORE_COLUMN].sort_values(ascending=False)
+                rows = df.loc[flagged.index]
+
+            # Only the visible page is sliced and sent to the browser.
+            col1, col2 = st.columns(2)
+            with col1:
+                page_size = st.selectbox("Rows per page", RAW_DATA_PAGE_SIZES, index=1)
+            with col2:
+                page_number = st.number_input(
+                    "Page", min_value=1, max_value=page_count(len(rows), page_size), value=1
+                )
+            page = paginate(rows, page_number, page_size)
+            st.dataframe(page.frame.join(scores))
+            st.caption(f"Rows {page.start + 1:,}–{page.stop:,} of {page.total_rows:,} · page {page.number} of {page.pages}")
+
+        with st.sidebar.expander("⏱️ Pipeline timings", expanded=False):
+            st.dataframe(pd.DataFrame(stage_timings), hide_index=True)
 
     except Exception as e:
         st.error(f"❌ Error: {e}")
 
 else:
+    cancel_upload_job()
     st.info("Please upload a CSV file to start the analysis.")
@@ -0,0 +1,112 @@
+"""Compare the compiled keyword matcher against the original per-row loop.
+
+The ``pipeline`` column times ``categorize_transactions`` end to end, which
+factorizes descriptions and serves repeated merchants from the shared memo.
+
+Usage:
+    python benchmarks/bench_categorize.py                 # 10k, 1M and 10M rows
+    python benchmarks/bench_categorize.py --sizes 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.categorize import (  # noqa: E402
+    CATEGORY_RULES,
+    KeywordMatcher,
+    categorize_transactions,
+    clear_category_cache,
+)
+
+MERCHANTS = [
+    "Fresh Mart Supermarket",
+    "Green Market Groceries",
+    "City Transport - Metro",
+    "Airport Taxi",
+    "Downtown Fuel Station",
+    "Home Rent",
+    "Home Utilities Bill",
+    "Netflix Subscription",
+    "Spotify Premium",
+    "Cinema Night",
+    "Corner Coffee Bar",
+    "Online Bookstore",
+]
+
+
+def build_descriptions(rows: int, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    merchants = pd.Series(rng.choice(MERCHANTS, rows))
+    # Bank feeds tag a minority of rows with a unique reference number.
+    references = pd.Series(rng.integers(0, 100_000, rows)).astype(str)
+    tagged = rng.random(rows) < 0.2
+    merchants[tagged] = merchants[tagged] + " #" + references[tagged]
+    return merchants.str.lower()
+
+
+def pipeline_categorize(descriptions: pd.Series) -> pd.Series:
+    clear_category_cache()
+    frame = pd.DataFrame({"description": descriptions})
+    return categorize_transactions(frame)["category"]
+
+
+def legacy_categorize(descriptions: pd.Series) -> list[str]:
+    categories = []
+    for desc in descriptions:
+        assigned = "Other"
+        for keyword, cat in CATEGORY_RULES.items():
+            if keyword in desc:
+                assigned = cat
+                break
+        categories.append(assigned)
+    return categories
+
+
+def _timed(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 1_000_000, 10_000_000],
+        help="Row counts to benchmark.",
+    )
+    args = parser.parse_args(argv)
+
+    matcher = KeywordMatcher(CATEGORY_RULES)
+    print(
+        f"{'rows':>12} {'loop (s)':>10} {'matcher (s)':>12} "
+        f"{'pipeline (s)':>13} {'speedup':>8}"
+    )
+    for rows in args.sizes:
+        descriptions = build_descriptions(rows)
+        loop_seconds, expected = _timed(legacy_categorize, descriptions)
+        matcher_seconds, result = _timed(matcher.categorize, descriptions)
+        pipeline_seconds, categories = _timed(pipeline_categorize, descriptions)
+        if list(result) != expected or categories.tolist() != expected:
+            raise SystemExit(f"Matcher disagrees with the reference loop at {rows} rows.")
+        print(
+            f"{rows:>12,} {loop_seconds:>10.3f} {matcher_seconds:>12.3f} "
+            f"{pipeline_seconds:>13.3f} {loop_seconds / pipeline_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure date-parse throughput before and after format-driven parsing.
+
+"before" is the original ``pd.to_datetime(..., errors="coerce")`` call that
+infers the format; "after" is ``preprocessing.parse_dates``, which uses
+``DEFAULT_CONFIG["date_format"]`` and parses each unique string once.
+
+Usage:
+    python benchmarks/bench_dates.py
+    python benchmarks/bench_dates.py --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.preprocessing import parse_dates  # noqa: E402
+
+
+def build_dates(rows: int, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    days = np.datetime64("2020-01-01") + rng.integers(0, 5 * 365, rows)
+    return pd.Series(days.astype(str))
+
+
+def _throughput(func, values: pd.Series) -> tuple[float, pd.Series]:
+    start = time.perf_counter()
+    result = func(values)
+    return len(values) / (time.perf_counter() - start), result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 1_000_000, 10_000_000],
+        help="Row counts to benchmark.",
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>12} {'before (rows/s)':>16} {'after (rows/s)':>16} {'speedup':>8}")
+    for rows in args.sizes:
+        values = build_dates(rows)
+        before, expected = _throughput(lambda s: pd.to_datetime(s, errors="coerce"), values)
+        after, result = _throughput(parse_dates, values)
+        if not result.equals(expected):
+            raise SystemExit(f"parse_dates disagrees with pd.to_datetime at {rows} rows.")
+        print(f"{rows:>12,} {before:>16,.0f} {after:>16,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
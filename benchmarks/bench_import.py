@@ -0,0 +1,95 @@
+"""Measure cold import time of the src modules with ``python -X importtime``.
+
+Each module is imported in a fresh interpreter. The script reports the
+cumulative self+children time the interpreter logs for it, the slowest
+dependencies it pulled in, and fails when a module exceeds its budget.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --modules src.analysis --budget-ms 800
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_MODULES = [
+    "src",
+    "src.preprocessing",
+    "src.analysis",
+    "src.budget",
+    "src.utils_io",
+    "src.visualization",
+]
+
+# Modules that must never be imported just by importing src.*.
+FORBIDDEN = ["plotly.express", "kaleido", "streamlit"]
+
+
+def import_profile(module: str) -> tuple[dict[str, int], set[str]]:
+    """Cumulative import time (µs) of every module loaded by ``import module``."""
+    code = (
+        f"import sys, {module}; "
+        "print('\\n'.join(sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        timings[name.strip()] = int(cumulative)
+    return timings, set(completed.stdout.split())
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES, help="Modules to import.")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=1500.0,
+        help="Fail when a module's cumulative import time exceeds this.",
+    )
+    parser.add_argument("--top", type=int, default=5, help="Slowest dependencies to list per module.")
+    args = parser.parse_args(argv)
+
+    failures: list[str] = []
+    print(f"{'module':<22} {'import (ms)':>12}  slowest dependencies")
+    for module in args.modules:
+        timings, loaded = import_profile(module)
+        total_ms = timings.get(module, 0) / 1000
+        slowest = sorted(
+            ((name, us) for name, us in timings.items() if name != module and "." not in name),
+            key=lambda item: item[1],
+            reverse=True,
+        )[: args.top]
+        listing = ", ".join(f"{name} {us / 1000:.0f}" for name, us in slowest)
+        print(f"{module:<22} {total_ms:>12.1f}  {listing}")
+
+        if total_ms > args.budget_ms:
+            failures.append(f"{module} took {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+        leaked = [name for name in FORBIDDEN if name in loaded]
+        if leaked:
+            failures.append(f"{module} imported {', '.join(leaked)}")
+
+    if failures:
+        raise SystemExit("Import budget exceeded:\n  " + "\n  ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
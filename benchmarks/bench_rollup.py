@@ -0,0 +1,87 @@
+"""Measure drill-down latency from the rollup cube against raw-row groupbys.
+
+"raw" answers totals per month, per category, per month and category, and
+the net balance with a separate groupby over the rows each time; "cube"
+builds ``rollup.RollupCube`` once and reads every aggregate from it.
+
+Usage:
+    python benchmarks/bench_rollup.py
+    python benchmarks/bench_rollup.py --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.categorize import CATEGORY_RULES  # noqa: E402
+from src.rollup import RollupCube  # noqa: E402
+
+
+def build_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    categories = np.array([*CATEGORY_RULES, "Other"])
+    dates = np.datetime64("2020-01-01") + rng.integers(0, 5 * 365, rows)
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(dates),
+            "amount": rng.normal(-40, 60, rows).round(2),
+            "category": categories[rng.integers(0, len(categories), rows)],
+        }
+    )
+
+
+def raw_drilldown(df: pd.DataFrame) -> None:
+    month = df["date"].dt.to_period("M")
+    df.groupby(month)["amount"].sum()
+    df.groupby("category")["amount"].sum()
+    df.groupby([month, "category"])["amount"].sum().unstack(fill_value=0)
+    df["amount"].sum()
+
+
+def cube_drilldown(cube: RollupCube) -> None:
+    cube.monthly_totals()
+    cube.category_totals()
+    cube.month_category_totals()
+    cube.net_balance()
+
+
+def _seconds(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 1_000_000, 10_000_000],
+        help="Row counts to benchmark.",
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>12} {'raw (ms)':>10} {'build (ms)':>11} {'cube (ms)':>10}")
+    for rows in args.sizes:
+        df = build_frame(rows)
+        raw = _seconds(raw_drilldown, df)
+        start = time.perf_counter()
+        cube = RollupCube.from_frame(df)
+        build = time.perf_counter() - start
+        drill = _seconds(cube_drilldown, cube)
+        print(f"{rows:>12,} {raw * 1000:>10.1f} {build * 1000:>11.1f} {drill * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Throughput suite for the pipeline stages, with baseline regression checks.
+
+Every case runs on a seeded synthetic ledger (``src.synthetic``) and is timed
+on a fresh shallow copy of its input, so derived-column and rollup caches
+start cold each repeat. The best of ``--repeat`` runs is reported as rows per
+second and written as JSON. With ``--baseline`` the run is compared against an
+earlier results file and exits with status 1 when any case is more than
+``--tolerance`` slower.
+
+Usage:
+    python benchmarks/run_suite.py                          # 10k, 100k and 1M rows
+    python benchmarks/run_suite.py --sizes 10000000 50000000 --data-dir /tmp/ledgers
+    python benchmarks/run_suite.py --baseline benchmarks/results/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.analysis import (  # noqa: E402
+    category_totals,
+    monthly_category_totals,
+    monthly_totals,
+    net_balance,
+)
+from src.budget import check_budget  # noqa: E402
+from src.categorize import categorize_transactions, clear_category_cache  # noqa: E402
+from src.preprocessing import load_csv  # noqa: E402
+from src.synthetic import write_ledger_csv  # noqa: E402
+from src.visualization import plot_expenses_by_category, plot_monthly_trend  # noqa: E402
+
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "latest.json"
+
+
+@dataclass
+class Ledger:
+    """Inputs shared by every case at one size."""
+
+    csv_path: Path
+    loaded: pd.DataFrame
+    categorized: pd.DataFrame
+    budgets: dict[str, float]
+
+
+@dataclass
+class Case:
+    """A timed call: ``prepare`` builds the argument untimed, ``run`` is measured."""
+
+    name: str
+    prepare: Callable[[Ledger], Any]
+    run: Callable[[Any], Any]
+
+
+def _fresh(frame_of: Callable[[Ledger], pd.DataFrame]) -> Callable[[Ledger], pd.DataFrame]:
+    # A new frame object misses every id()-keyed cache.
+    return lambda ledger: frame_of(ledger).copy(deep=False)
+
+
+def _uncached_raw(ledger: Ledger) -> pd.DataFrame:
+    clear_category_cache()
+    return ledger.loaded.copy(deep=False)
+
+
+CASES = [
+    Case("preprocessing.load_csv", lambda ledger: ledger.csv_path, load_csv),
+    Case("categorize.categorize_transactions", _uncached_raw, categorize_transactions),
+    Case("analysis.monthly_totals", _fresh(lambda ledger: ledger.categorized), monthly_totals),
+    Case("analysis.category_totals", _fresh(lambda ledger: ledger.categorized), category_totals),
+    Case(
+        "analysis.monthly_category_totals",
+        _fresh(lambda ledger: ledger.categorized),
+        monthly_category_totals,
+    ),
+    Case("analysis.net_balance", _fresh(lambda ledger: ledger.categorized), net_balance),
+    Case(
+        "budget.check_budget",
+        lambda ledger: (ledger.categorized.copy(deep=False), ledger.budgets),
+        lambda args: check_budget(*args),
+    ),
+    Case(
+        "visualization.plot_expenses_by_category",
+        _fresh(lambda ledger: ledger.categorized),
+        plot_expenses_by_category,
+    ),
+    Case(
+        "visualization.plot_monthly_trend",
+        _fresh(lambda ledger: ledger.categorized),
+        plot_monthly_trend,
+    ),
+]
+
+
+def prepare_ledger(rows: int, seed: int, data_dir: Path) -> Ledger:
+    """Write (or reuse) the ledger CSV for ``rows`` and load it once."""
+    csv_path = data_dir / f"ledger-{rows}-seed{seed}.csv"
+    if not csv_path.exists():
+        write_ledger_csv(csv_path, rows, seed=seed)
+    loaded = load_csv(csv_path)
+    categorized = categorize_transactions(loaded.copy(deep=False))
+    spending = categorized.loc[categorized["amount"] < 0].groupby("category", observed=True)["amount"].sum()
+    # Half the categories end up over budget so alerts are built too.
+    budgets = {
+        str(category): float(-total) * (0.9 if position % 2 else 1.1)
+        for position, (category, total) in enumerate(spending.items())
+    }
+    return Ledger(csv_path, loaded, categorized, budgets)
+
+
+def time_case(case: Case, ledger: Ledger, repeat: int) -> float:
+    """Best wall time of ``repeat`` runs, excluding ``prepare``."""
+    best = float("inf")
+    for _ in range(repeat):
+        argument = case.prepare(ledger)
+        start = time.perf_counter()
+        case.run(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(
+    sizes: list[int],
+    *,
+    seed: int = 0,
+    repeat: int = 3,
+    data_dir: Path,
+    only: list[str] | None = None,
+) -> dict[str, Any]:
+    cases = [case for case in CASES if not only or any(part in case.name for part in only)]
+    results = []
+    print(f"{'case':<42} {'rows':>12} {'seconds':>10} {'rows/s':>14}")
+    for rows in sizes:
+        ledger = prepare_ledger(rows, seed, data_dir)
+        for case in cases:
+            seconds = time_case(case, ledger, repeat)
+            rows_per_second = rows / seconds if seconds > 0 else float("inf")
+            results.append(
+                {"case": case.name, "rows": rows, "seconds": seconds, "rows_per_second": rows_per_second}
+            )
+            print(f"{case.name:<42} {rows:>12,} {seconds:>10.4f} {rows_per_second:>14,.0f}")
+        del ledger
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Describe every case whose throughput fell more than ``tolerance`` below the baseline."""
+    previous = {(item["case"], item["rows"]): item["rows_per_second"] for item in baseline["results"]}
+    regressions = []
+    for item in current["results"]:
+        reference = previous.get((item["case"], item["rows"]))
+        if not reference:
+            continue
+        ratio = item["rows_per_second"] / reference
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{item['case']} at {item['rows']:,} rows: "
+                f"{item['rows_per_second']:,.0f} rows/s vs {reference:,.0f} ({ratio - 1:+.0%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Row counts to benchmark (up to tens of millions).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic ledger.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best one counts.")
+    parser.add_argument("--cases", nargs="+", help="Only run cases whose name contains one of these.")
+    parser.add_argument("--data-dir", type=Path, help="Keep generated ledger CSVs here for reuse.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results.")
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare against.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed throughput drop against the baseline (0.2 = 20%%).",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        data_dir = args.data_dir or Path(scratch)
+        report = run_suite(args.sizes, seed=args.seed, repeat=args.repeat, data_dir=data_dir, only=args.cases)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(report, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        return 1
+    print(f"No case is more than {args.tolerance:.0%} slower than {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
 """Utility script to generate screenshot assets for the README gallery."""
 
 from pathlib import Path
-import importlib.util
+import importlib
+import sys
 
 import matplotlib
 
@@ -13,15 +14,13 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 
 def load_module(module_name: str):
-    module_path = ROOT / "src" / f"{module_name}.py"
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
+    # Modules use package-relative imports, so load them through ``src``.
+    return importlib.import_module(f"src.{module_name}")
 
 
 analysis = load_module("analysis")
@@ -31,8 +30,9 @@ visualization = load_module("visualization")
 net_balance = analysis.net_balance
 category_totals = analysis.category_totals
 categorize_transactions = categorize.categorize_transactions
-plot_expenses_by_category = visualization.plot_expenses_by_category
-plot_monthly_trend = visualization.plot_monthly_trend
+category_chart_job = visualization.category_chart_job
+monthly_chart_job = visualization.monthly_chart_job
+render_charts = visualization.render_charts
 DOCS_IMAGES = ROOT / "docs" / "images"
 DOCS_IMAGES.mkdir(parents=True, exist_ok=True)
 
@@ -167,18 +167,18 @@ def main() -> None:
     df_for_charts = df.copy()
     df_for_charts["amount"] = df_for_charts["amount"].abs()
 
-    pie_path = plot_expenses_by_category(df_for_charts, filename="category-pie.png", to_file=True)
-    bar_path = plot_monthly_trend(df_for_charts, filename="monthly-bar.png", to_file=True)
-
-    # Move generated charts into docs/images
+    # Render both charts straight into docs/images in one export session;
+    # charts whose data did not change since the last run are skipped.
+    report = render_charts(
+        [
+            category_chart_job(df_for_charts, "category-pie.png"),
+            monthly_chart_job(df_for_charts, "monthly-bar.png"),
+        ],
+        DOCS_IMAGES,
+    )
+    print(f"Rendered {len(report.rendered)} charts, {len(report.skipped)} unchanged")
     pie_dest = DOCS_IMAGES / "category-pie.png"
     bar_dest = DOCS_IMAGES / "monthly-bar.png"
-    pie_dest.write_bytes(pie_path.read_bytes())
-    bar_dest.write_bytes(bar_path.read_bytes())
-    if pie_path.exists():
-        pie_path.unlink()
-    if bar_path.exists():
-        bar_path.unlink()
 
     dashboard_path = DOCS_IMAGES / "dashboard-preview.png"
     create_dashboard_preview(df_for_charts, pie_dest, bar_dest, dashboard_path)
@@ -0,0 +1,19 @@
+"""Run the headless batch pipeline over a directory or glob of CSV exports.
+
+Example:
+    python3 scripts/run_batch.py "ledger/*.csv" --output results/batch --budgets budgets.json
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.cli import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
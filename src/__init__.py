@@ -1,9 +1,19 @@
 """Finance Expense Analyzer package."""
 
-from . import analysis, categorize, preprocessing
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = [
     "analysis",
     "categorize",
     "preprocessing",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Submodules load on first access, so "import src" costs nothing extra.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,18 @@
+from __future__ import annotations
+
 import pandas as pd
 
+from .compact import has_amount, sum_amounts
+from .instrumentation import instrument
+from .rollup import RollupCube, cached_rollup, category_sums, rollup
+
 class AnalysisError(Exception):
     """Raised when analysis cannot be performed."""
 
+def _totals_frame(sums: pd.Series, key: str) -> pd.DataFrame:
+    return sums.sort_index().rename_axis(key).reset_index(name="total_amount")
+
+@instrument()
 def monthly_totals(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate total expenses per month.
@@ -11,14 +21,12 @@ def monthly_totals(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         raise AnalysisError("Input DataFrame is empty or None.")
 
-    if "date" not in df.columns or "amount" not in df.columns:
+    if "date" not in df.columns or not has_amount(df):
         raise AnalysisError("Missing required columns: date or amount")
 
-    df["month"] = pd.to_datetime(df["date"]).dt.to_period("M").astype(str)
-    result = df.groupby("month")["amount"].sum().reset_index()
-    result = result.rename(columns={"amount": "total_amount"})
-    return result
+    return _totals_frame(rollup(df).monthly_totals(), "month")
 
+@instrument()
 def category_totals(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate total expenses per category.
@@ -27,13 +35,26 @@ def category_totals(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         raise AnalysisError("Input DataFrame is empty or None.")
 
-    if "category" not in df.columns or "amount" not in df.columns:
+    if "category" not in df.columns or not has_amount(df):
         raise AnalysisError("Missing required columns: category or amount")
 
-    result = df.groupby("category")["amount"].sum().reset_index()
-    result = result.rename(columns={"amount": "total_amount"})
-    return result
+    return _totals_frame(category_sums(df), "category")
+
+@instrument()
+def monthly_category_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate total expenses per month and category.
+    Returns a DataFrame indexed by 'month' with one column per category.
+    """
+    if df is None or df.empty:
+        raise AnalysisError("Input DataFrame is empty or None.")
+
+    if not {"date", "category"}.issubset(df.columns) or not has_amount(df):
+        raise AnalysisError("Missing required columns: date, category or amount")
 
+    return rollup(df).month_category_totals()
+
+@instrument()
 def net_balance(df: pd.DataFrame) -> float:
     """
     Calculate net balance (income - expenses).
@@ -42,7 +63,72 @@ def net_balance(df: pd.DataFrame) -> float:
     if df is None or df.empty:
         raise AnalysisError("Input DataFrame is empty or None.")
 
-    if "amount" not in df.columns:
+    if not has_amount(df):
         raise AnalysisError("Missing required column: amount")
 
-    return float(df["amount"].sum())
+    cube = cached_rollup(df)
+    if cube is not None:
+        return cube.net_balance()
+    return float(sum_amounts(df))
+
+class TotalsAccumulator:
+    """
+    Incremental monthly_totals, category_totals and net_balance over a RollupCube.
+
+    Feed it one chunk at a time with update() (or combine partitions with
+    merge()) and read the same DataFrames the one-shot functions return.
+    Appending transactions costs O(new rows) instead of O(all rows).
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.cube = RollupCube()
+        self._has_category = True
+
+    def update(self, df: pd.DataFrame) -> TotalsAccumulator:
+        """Add a chunk with at least ["date", "amount"] (and ideally "category")."""
+        if df is None:
+            raise AnalysisError("Input DataFrame is None.")
+        if "date" not in df.columns or not has_amount(df):
+            raise AnalysisError("Missing required columns: date or amount")
+        if df.empty:
+            return self
+
+        self.rows += len(df)
+        self.cube.append(df)
+        self._has_category = self._has_category and "category" in df.columns
+        return self
+
+    def merge(self, other: TotalsAccumulator) -> TotalsAccumulator:
+        """Fold another accumulator (e.g. from a parallel partition) into this one."""
+        if other.rows == 0:
+            return self
+        if self.rows == 0:
+            self._has_category = other._has_category
+        else:
+            self._has_category = self._has_category and other._has_category
+
+        self.rows += other.rows
+        self.cube.merge(other.cube)
+        return self
+
+    def _require_rows(self) -> None:
+        if self.rows == 0:
+            raise AnalysisError("No transactions have been accumulated.")
+
+    def monthly_totals(self) -> pd.DataFrame:
+        """Same result as monthly_totals() over every accumulated row."""
+        self._require_rows()
+        return _totals_frame(self.cube.monthly_totals(), "month")
+
+    def category_totals(self) -> pd.DataFrame:
+        """Same result as category_totals() over every accumulated row."""
+        self._require_rows()
+        if not self._has_category:
+            raise AnalysisError("Missing required columns: category or amount")
+        return _totals_frame(self.cube.category_totals(), "category")
+
+    def net_balance(self) -> float:
+        """Same result as net_balance() over every accumulated row."""
+        self._require_rows()
+        return self.cube.net_balance()
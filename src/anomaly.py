@@ -0,0 +1,152 @@
+"""Per-category anomaly scoring for transactions.
+
+Two scorers share the same output columns:
+
+- ``score_anomalies`` uses robust statistics (median and MAD per category)
+  computed in one grouped pass over an in-memory frame.
+- ``AnomalyStats`` keeps mergeable per-category count/mean/M2 moments, so a
+  history can be folded in chunk by chunk and a new month scored against it
+  without holding the full history in memory.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .compact import AMOUNT_CENTS, has_amount
+from .config import DEFAULT_CONFIG
+
+SCORE_COLUMN = "anomaly_score"
+FLAG_COLUMN = "is_anomaly"
+
+# Scales MAD (and the mean absolute deviation fallback) to a normal sigma.
+_MAD_SCALE = 1.4826
+_MEAN_AD_SCALE = 1.2533
+
+
+class AnomalyError(Exception):
+    """Raised when anomaly scores cannot be computed."""
+
+
+def _validate(df: pd.DataFrame) -> None:
+    if df is None or df.empty:
+        raise AnomalyError("Input DataFrame is empty or None.")
+    if "category" not in df.columns or not has_amount(df):
+        raise AnomalyError("Missing required columns: category or amount")
+
+
+def _amounts(df: pd.DataFrame) -> pd.Series:
+    if AMOUNT_CENTS in df.columns:
+        return df[AMOUNT_CENTS].astype("float64") / 100
+    return df["amount"].astype("float64")
+
+
+def _threshold(threshold: float | None) -> float:
+    return float(DEFAULT_CONFIG["anomaly_threshold"] if threshold is None else threshold)
+
+
+def _assign_scores(df: pd.DataFrame, scores: np.ndarray, threshold: float) -> pd.DataFrame:
+    scores = np.nan_to_num(np.abs(scores), nan=0.0, posinf=np.inf)
+    df[SCORE_COLUMN] = scores
+    df[FLAG_COLUMN] = scores > threshold
+    return df
+
+
+def score_anomalies(df: pd.DataFrame, *, threshold: float | None = None) -> pd.DataFrame:
+    """
+    Score how unusual each amount is within its category.
+
+    The score is the robust z-score |amount - median| / (1.4826 * MAD) of the
+    row's category. When a category's MAD is 0 the mean absolute deviation is
+    used instead, and a category whose amounts never vary scores 0.
+
+    args:
+        df (pd.DataFrame): must contain columns ["category", "amount"]
+        threshold: score above which a row is flagged
+            (default: DEFAULT_CONFIG["anomaly_threshold"])
+
+    returns:
+        pd.DataFrame: same dataframe with extra "anomaly_score" and
+        "is_anomaly" columns
+    """
+    _validate(df)
+    amounts = _amounts(df)
+    groups = amounts.groupby(df["category"], observed=True, sort=False)
+    median = groups.transform("median")
+    deviation = (amounts - median).abs()
+    by_deviation = deviation.groupby(df["category"], observed=True, sort=False)
+    scale = by_deviation.transform("median") * _MAD_SCALE
+    fallback = by_deviation.transform("mean") * _MEAN_AD_SCALE
+    scale = scale.where(scale > 0, fallback)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(scale > 0, deviation / scale, 0.0)
+    return _assign_scores(df, scores, _threshold(threshold))
+
+
+class AnomalyStats:
+    """
+    Mergeable per-category moments for streamed anomaly scoring.
+
+    update() folds a chunk in with one grouped aggregation; merge() combines
+    partitions using the parallel variance formula; score() adds the same
+    columns as score_anomalies(), using |amount - mean| / std as the score.
+    """
+
+    def __init__(self) -> None:
+        self.moments = pd.DataFrame(
+            {"count": pd.Series(dtype="int64"), "mean": pd.Series(dtype="float64"), "m2": pd.Series(dtype="float64")}
+        )
+
+    @property
+    def rows(self) -> int:
+        return int(self.moments["count"].sum())
+
+    def update(self, df: pd.DataFrame) -> AnomalyStats:
+        """Fold a chunk with at least ["category", "amount"] into the moments."""
+        _validate(df)
+        amounts = _amounts(df)
+        grouped = amounts.groupby(df["category"].astype(str), observed=True)
+        chunk = grouped.agg(["count", "mean", "var"])
+        chunk["m2"] = chunk.pop("var").fillna(0.0) * (chunk["count"] - 1)
+        return self._combine(chunk)
+
+    def merge(self, other: AnomalyStats) -> AnomalyStats:
+        """Fold another partition's moments into this one."""
+        return self._combine(other.moments)
+
+    def _combine(self, other: pd.DataFrame) -> AnomalyStats:
+        left, right = self.moments.align(other, join="outer", fill_value=0)
+        count = left["count"] + right["count"]
+        delta = right["mean"] - left["mean"]
+        safe = count.where(count > 0, 1)
+        self.moments = pd.DataFrame(
+            {
+                "count": count.astype("int64"),
+                "mean": left["mean"] + delta * right["count"] / safe,
+                "m2": left["m2"] + right["m2"] + delta**2 * left["count"] * right["count"] / safe,
+            }
+        )
+        return self
+
+    def std(self) -> pd.Series:
+        """Sample standard deviation per category."""
+        counts = self.moments["count"]
+        return np.sqrt(self.moments["m2"] / (counts - 1).where(counts > 1))
+
+    def score(self, df: pd.DataFrame, *, threshold: float | None = None) -> pd.DataFrame:
+        """Score ``df`` against the accumulated moments.
+
+        Categories seen fewer than twice (or never) score 0.
+        """
+        _validate(df)
+        if self.rows == 0:
+            raise AnomalyError("No transactions have been accumulated.")
+        keys = df["category"].astype(str)
+        mean = keys.map(self.moments["mean"]).astype("float64")
+        std = keys.map(self.std()).astype("float64")
+        # A category that never varied makes any different amount infinitely unusual.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = (_amounts(df) - mean) / std
+        return _assign_scores(df, scores, _threshold(threshold))
@@ -1,31 +1,62 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Mapping
+
+import numpy as np
 import pandas as pd
 
+from .compact import has_amount, sum_amounts
+from .derived import month_period
+from .instrumentation import instrument
+from .rollup import category_sums
 from .utils_logging import log_error, log_info
 
 
 class BudgetError(Exception):
     """Raised when budget check cannot be performed."""
 
-def check_budget(df: pd.DataFrame, budget_dict: dict) -> list[str]:
+BUDGET_COLUMNS = ["category", "spent", "budget", "remaining", "utilisation", "exceeded"]
+
+def _validate_frame(df: pd.DataFrame) -> None:
+    if df is None or df.empty:
+        raise BudgetError("Input DataFrame is empty or None.")
+    if "category" not in df.columns or not has_amount(df):
+        raise BudgetError("Missing required columns: category or amount")
+
+def _raise_invalid(invalid_entries: dict) -> None:
+    message = (
+        "Budget values must be non-negative numbers. Invalid entries: "
+        f"{invalid_entries}"
+    )
+    log_error(message)
+    raise BudgetError(message)
+
+def budget_table(budgets: Mapping[str, object] | pd.DataFrame) -> pd.DataFrame:
     """
-    Check if expenses exceed category budgets.
+    Validate budgets and return them as a ["category", "budget"] table.
 
     Args:
-        df (pd.DataFrame): DataFrame with at least ["category", "amount"]
-        budget_dict (dict): e.g. {"Groceries": 300, "Transport": 100}
+        budgets: {"Groceries": 300, ...} or a DataFrame with
+            "category" and "budget" columns (extra key columns are kept).
 
     Returns:
-        list of alert strings
+        DataFrame with a float "budget" column.
     """
-    if df is None or df.empty:
-        raise BudgetError("Input DataFrame is empty or None.")
-    if "category" not in df.columns or "amount" not in df.columns:
-        raise BudgetError("Missing required columns: category or amount")
-    if not budget_dict:
+    if budgets is None or len(budgets) == 0:
         raise BudgetError("Budget dictionary is empty or None.")
 
+    if isinstance(budgets, pd.DataFrame):
+        if not {"category", "budget"}.issubset(budgets.columns):
+            raise BudgetError("Budget table must contain columns: category and budget")
+        values = pd.to_numeric(budgets["budget"], errors="coerce")
+        invalid = values.isna() | (values < 0)
+        if invalid.any():
+            bad = budgets.loc[invalid]
+            _raise_invalid(dict(zip(bad["category"], bad["budget"])))
+        return budgets.assign(budget=values.astype("float64"))
+
     invalid_entries: dict[str, object] = {}
-    for category, budget in budget_dict.items():
+    for category, budget in budgets.items():
         if not isinstance(budget, (int, float)):
             invalid_entries[category] = budget
             continue
@@ -33,30 +64,154 @@ def check_budget(df: pd.DataFrame, budget_dict: dict) -> list[str]:
             invalid_entries[category] = budget
 
     if invalid_entries:
-        message = (
-            "Budget values must be non-negative numbers. Invalid entries: "
-            f"{invalid_entries}"
+        _raise_invalid(invalid_entries)
+
+    return pd.DataFrame(
+        {"category": list(budgets.keys()), "budget": np.asarray(list(budgets.values()), dtype="float64")}
+    )
+
+def _add_utilisation(result: pd.DataFrame) -> pd.DataFrame:
+    result["spent"] = result["spent"].fillna(0.0)
+    result["remaining"] = result["budget"] - result["spent"]
+    result["utilisation"] = _utilisation(result["spent"], result["budget"])
+    result["exceeded"] = result["spent"] > result["budget"]
+    return result
+
+def _utilisation(spent: pd.Series, budget: pd.Series) -> np.ndarray:
+    # 0 / 0 counts as unused; spending against a zero budget is infinite.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = spent.to_numpy() / budget.to_numpy()
+    return np.where((budget.to_numpy() == 0) & (spent.to_numpy() == 0), 0.0, ratio)
+
+@instrument()
+def evaluate_budget(
+    df: pd.DataFrame, budgets: Mapping[str, object] | pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Compare category spending with budgets in one vectorized join.
+
+    Args:
+        df (pd.DataFrame): DataFrame with at least ["category", "amount"]
+        budgets: e.g. {"Groceries": 300, "Transport": 100}, or a budgets table
+
+    Returns:
+        DataFrame with one row per budget (in input order) and columns
+        category, spent, budget, remaining, utilisation and exceeded.
+    """
+    _validate_frame(df)
+    table = budget_table(budgets)
+
+    categories = ", ".join(sorted(map(str, table["category"].unique())))
+    log_info(f"Checking budgets for categories: {categories}", hot=True)
+
+    # spent is negative if expenses are stored as negatives → take abs()
+    totals = category_sums(df).abs().rename("spent")
+    result = table[["category", "budget"]].join(totals.astype("float64"), on="category")
+    return _add_utilisation(result)[BUDGET_COLUMNS].reset_index(drop=True)
+
+def format_budget_alerts(result: pd.DataFrame) -> list[str]:
+    """Render evaluate_budget() rows as the dashboard's alert strings."""
+    return [
+        f"⚠️ {category} exceeded budget: {spent:.2f}€ / {budget:.2f}€"
+        if exceeded
+        else f"✅ {category}: {spent:.2f}€ / {budget:.2f}€ (within budget)"
+        for category, spent, budget, exceeded in zip(
+            result["category"], result["spent"], result["budget"], result["exceeded"]
         )
-        log_error(message)
-        raise BudgetError(message)
-
-    categories = ", ".join(sorted(budget_dict.keys()))
-    log_info(f"Checking budgets for categories: {categories}")
-
-    alerts = []
-    totals = df.groupby("category")["amount"].sum()
-
-    for category, budget in budget_dict.items():
-        spent = totals.get(category, 0)
-        # spent is negative if expenses are stored as negatives → take abs()
-        spent_abs = abs(spent)
-        if spent_abs > budget:
-            alerts.append(
-                f"⚠️ {category} exceeded budget: {spent_abs:.2f}€ / {budget:.2f}€"
-            )
-        else:
-            alerts.append(
-                f"✅ {category}: {spent_abs:.2f}€ / {budget:.2f}€ (within budget)"
-            )
-
-    return alerts
+    ]
+
+@instrument()
+def check_budget(df: pd.DataFrame, budget_dict: dict) -> list[str]:
+    """
+    Check if expenses exceed category budgets.
+
+    Args:
+        df (pd.DataFrame): DataFrame with at least ["category", "amount"]
+        budget_dict (dict): e.g. {"Groceries": 300, "Transport": 100}
+
+    Returns:
+        list of alert strings
+    """
+    return format_budget_alerts(evaluate_budget(df, budget_dict))
+
+@instrument()
+def evaluate_budgets_batch(
+    transactions: pd.DataFrame,
+    budgets: pd.DataFrame,
+    *,
+    user_column: str = "user_id",
+    period_column: str = "period",
+) -> pd.DataFrame:
+    """
+    Evaluate budgets for many users and periods in one grouped aggregation.
+
+    Args:
+        transactions (pd.DataFrame): rows with [user_column, "category",
+            "amount"] plus either period_column or "date" (grouped by month).
+        budgets (pd.DataFrame): long-format table with [user_column,
+            "category", "budget"] and optionally period_column. Budgets
+            without a period apply to every period the user has spending in.
+
+    Returns:
+        DataFrame with one row per (user, period, budgeted category) and
+        columns user, period, category, spent, budget, remaining,
+        utilisation and exceeded. Periods are "YYYY-MM" style strings.
+    """
+    _validate_frame(transactions)
+    if user_column not in transactions.columns:
+        raise BudgetError(f"Missing required column: {user_column}")
+    if period_column in transactions.columns:
+        period = transactions[period_column]
+    elif "date" in transactions.columns:
+        period = month_period(transactions)
+    else:
+        raise BudgetError(f"Missing required columns: {period_column} or date")
+
+    table = budget_table(budgets)
+    if user_column not in table.columns:
+        raise BudgetError(f"Budget table must contain column: {user_column}")
+
+    keys = [user_column, period_column, "category"]
+    spent = sum_amounts(transactions, [transactions[user_column], period, transactions["category"]])
+    spent = spent.abs().astype("float64").rename("spent")
+    spent.index = spent.index.set_names(keys)
+    spent = spent.reset_index()
+    # Only the aggregated keys are stringified, never the raw rows.
+    spent[period_column] = spent[period_column].astype(str)
+    spent["category"] = spent["category"].astype(str)
+    log_info(
+        f"Checking {len(table)} budgets against {len(transactions)} transactions "
+        f"in {len(spent)} (user, period, category) groups"
+    )
+
+    if period_column in table.columns:
+        scoped = table.assign(**{period_column: table[period_column].astype(str)})
+    else:
+        user_periods = spent[[user_column, period_column]].drop_duplicates()
+        scoped = table.merge(user_periods, on=user_column)
+
+    result = scoped[keys + ["budget"]].merge(spent, on=keys, how="left")
+    result = _add_utilisation(result)
+    return result[keys + BUDGET_COLUMNS[1:]].reset_index(drop=True)
+
+def iter_budget_alerts(
+    transactions: pd.DataFrame,
+    budgets: pd.DataFrame,
+    *,
+    user_column: str = "user_id",
+    period_column: str = "period",
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream exceeded budgets from evaluate_budgets_batch() as alert records.
+
+    Each record carries the user, period, category, spent and budget values
+    plus the dashboard-style "message".
+    """
+    result = evaluate_budgets_batch(
+        transactions, budgets, user_column=user_column, period_column=period_column
+    )
+    exceeded = result.loc[result["exceeded"]]
+    messages = format_budget_alerts(exceeded)
+    for record, message in zip(exceeded.to_dict("records"), messages):
+        record["message"] = message
+        yield record
@@ -0,0 +1,150 @@
+"""Content-addressed columnar cache for cleaned and categorized transactions."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from . import categorize
+from .config import DEFAULT_CONFIG
+from .preprocessing import _is_path_like, load_csv
+from .utils_io import _PYARROW_AVAILABLE, export_dataframe, read_dataframe
+from .utils_logging import log_error, log_info
+
+# Bump when the cleaning/categorization output changes shape.
+_CACHE_VERSION = "1"
+_HASH_BLOCK_BYTES = 1024 * 1024
+# DEFAULT_CONFIG entries that change how load_csv parses a source.
+_CLEANING_SETTINGS = ("date_format",)
+
+
+class CacheError(Exception):
+    """Raised when the transaction cache cannot be used."""
+
+
+def content_hash(source: Any) -> str:
+    """Return the SHA-256 of a path's or file-like object's content."""
+    digest = hashlib.sha256()
+    if _is_path_like(source):
+        with open(source, "rb") as handle:
+            while block := handle.read(_HASH_BLOCK_BYTES):
+                digest.update(block)
+        return digest.hexdigest()
+
+    if not hasattr(source, "read"):
+        raise TypeError("Cache source must be a path or a file-like object with read().")
+    if hasattr(source, "seek"):
+        source.seek(0)
+    while block := source.read(_HASH_BLOCK_BYTES):
+        digest.update(block.encode("utf-8") if isinstance(block, str) else block)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return digest.hexdigest()
+
+
+def _pipeline_fingerprint() -> str:
+    # Everything besides the source bytes that shapes the cached frame: the
+    # category rules and the settings load_csv cleans with.
+    settings = {key: DEFAULT_CONFIG.get(key) for key in _CLEANING_SETTINGS}
+    pipeline = repr((tuple(categorize.CATEGORY_RULES.items()), sorted(settings.items())))
+    return hashlib.sha256(pipeline.encode("utf-8")).hexdigest()[:16]
+
+
+def transactions_key(digest: str) -> str:
+    """Cache key of a source's categorized frame, given its content hash."""
+    return f"{digest}-{_pipeline_fingerprint()}-v{_CACHE_VERSION}"
+
+
+class FrameCache:
+    """Directory of Feather files keyed by content hash, capped in total size.
+
+    When the cap is exceeded the oldest entries are evicted first.
+    """
+
+    def __init__(self, directory: Path | str | None = None, max_bytes: int | None = None):
+        if not _PYARROW_AVAILABLE:
+            raise CacheError(
+                "The transaction cache requires the 'pyarrow' package. Install it via 'pip install pyarrow'."
+            )
+        self.directory = Path(directory or DEFAULT_CONFIG["cache_dir"])
+        self.max_bytes = int(max_bytes if max_bytes is not None else DEFAULT_CONFIG["cache_max_bytes"])
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.feather"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob("*.feather"), key=lambda path: path.stat().st_mtime)
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Return the cached frame for ``key`` or None on a miss."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return read_dataframe(path)
+        except Exception as exc:
+            log_error(f"Discarding unreadable cache entry {path}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, df: pd.DataFrame) -> Path:
+        """Store ``df`` under ``key`` and evict old entries beyond the size cap."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp.feather")
+        export_dataframe(df, tmp_path)
+        os.replace(tmp_path, path)
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Delete oldest entries until the cache fits ``max_bytes``; return the count."""
+        entries = self._entries()
+        total = sum(path.stat().st_size for path in entries)
+        removed = 0
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self._entries())
+
+    def clear(self) -> None:
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+
+def load_transactions(source: Any, cache: FrameCache | None = None) -> pd.DataFrame:
+    """Load and categorize a CSV, reusing a cached columnar copy when possible.
+
+    Args:
+        source: Path-like string or a file-like object with a ``read`` method.
+        cache: Cache to use; defaults to a FrameCache from DEFAULT_CONFIG.
+            Without pyarrow the source is simply loaded and categorized.
+
+    Returns:
+        The cleaned DataFrame with a "category" column.
+    """
+    if cache is None and _PYARROW_AVAILABLE:
+        cache = FrameCache()
+    if cache is None:
+        return categorize.categorize_transactions(load_csv(source))
+
+    key = transactions_key(content_hash(source))
+    df = cache.get(key)
+    if df is not None:
+        log_info(f"Loaded {len(df)} cached rows for {key[:12]}", hot=True)
+        return df
+
+    df = categorize.categorize_transactions(load_csv(source))
+    cache.put(key, df)
+    return df
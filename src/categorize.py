@@ -1,5 +1,24 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Mapping, NamedTuple
+
+import numpy as np
 import pandas as pd
 
+from .config import DEFAULT_CONFIG
+from .derived import normalized_description
+from .instrumentation import instrument
+
+try:
+    # Arrow's RE2 engine scans a whole string column in a single native pass.
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
 class CategorizationError(Exception):
     """Raised when categorization cannot be performed."""
 
@@ -21,33 +40,217 @@ CATEGORY_RULES = {
     "cinema": "Entertainment",
 }
 
+DEFAULT_CATEGORY = "Other"
+
+
+def _hidden_overlaps(keywords: list[str]) -> dict[int, list[str]]:
+    """Map keyword ranks to the text that would hide a better keyword.
+
+    A left-to-right scan consumes the leftmost keyword it finds, so a
+    higher-priority keyword that *starts inside* that match is never seen.
+    For every such pair the overlapping text (e.g. ``"cinemarket"``) is
+    recorded so that only rows containing it need an exact re-check.
+    """
+    overlaps: dict[int, list[str]] = {}
+    for rank, keyword in enumerate(keywords):
+        for better in keywords[:rank]:
+            for offset in range(1, len(keyword)):
+                tail = keyword[offset:]
+                if tail[: len(better)] == better[: len(tail)]:
+                    overlap = keyword[:offset] + better
+                    if len(better) < len(tail):
+                        overlap = keyword
+                    overlaps.setdefault(rank, []).append(overlap)
+    return overlaps
+
+
+class KeywordMatcher:
+    """Compiled keyword matcher built once from a rule table.
+
+    The first rule (in dict order) whose keyword occurs in a description
+    wins; descriptions without any keyword fall back to ``DEFAULT_CATEGORY``.
+    """
+
+    def __init__(self, rules: Mapping[str, str]):
+        self.keywords = list(rules.keys())
+        self.categories = np.array(
+            list(rules.values()) + [DEFAULT_CATEGORY], dtype=object
+        )
+        self.no_match = len(self.keywords)
+        self._rank = {keyword: rank for rank, keyword in enumerate(self.keywords)}
+
+        alternation = "|".join(re.escape(keyword) for keyword in self.keywords)
+        # Lookahead finds every keyword start, including overlapping ones.
+        self._all_matches = re.compile(f"(?=({alternation}))")
+        # Leftmost keyword plus whether any further keyword follows it.
+        self._scan_pattern = f"(?s)(?P<kw>{alternation})(?P<more>.*(?:{alternation}))?"
+        overlaps = _hidden_overlaps(self.keywords)
+        self._exposed = np.zeros(self.no_match + 1, dtype=bool)
+        self._exposed[list(overlaps)] = True
+        self._overlap_pattern = "|".join(
+            re.escape(text) for texts in overlaps.values() for text in texts
+        )
+        # An empty keyword matches everywhere, which defeats the fast scan.
+        self._exact_only = "" in self._rank
+
+    def _exact_rank(self, description: str) -> int:
+        ranks = [self._rank[keyword] for keyword in self._all_matches.findall(description)]
+        return min(ranks, default=self.no_match)
+
+    def _scan_ranks(self, descriptions: pd.Series) -> np.ndarray:
+        values = pa.array(descriptions, from_pandas=True)
+        scan = pc.extract_regex(values, self._scan_pattern)
+        leftmost = pc.index_in(scan.field("kw"), value_set=pa.array(self.keywords))
+        ranks = pc.fill_null(leftmost, self.no_match).to_numpy(zero_copy_only=False)
+        ranks = ranks.astype(np.int64, copy=False)
+
+        more = pc.fill_null(pc.greater(pc.utf8_length(scan.field("more")), 0), False)
+        ambiguous = more.to_numpy(zero_copy_only=False)
+        exposed = np.flatnonzero(self._exposed[ranks] & ~ambiguous)
+        if exposed.size:
+            hidden = pc.match_substring_regex(values.take(exposed), self._overlap_pattern)
+            ambiguous[exposed[hidden.to_numpy(zero_copy_only=False)]] = True
+        for position in np.flatnonzero(ambiguous):
+            ranks[position] = self._exact_rank(descriptions.iat[position])
+        return ranks
+
+    def ranks(self, descriptions: pd.Series) -> np.ndarray:
+        """Return the winning rule index per description (``no_match`` if none)."""
+        if not self.keywords:
+            return np.full(len(descriptions), self.no_match, dtype=np.int64)
+        if _PYARROW_AVAILABLE and not self._exact_only:
+            return self._scan_ranks(descriptions)
+        return np.fromiter(
+            (self._exact_rank(description) for description in descriptions),
+            dtype=np.int64,
+            count=len(descriptions),
+        )
+
+    def categorize(self, descriptions: pd.Series) -> np.ndarray:
+        """Return the category for every (already lowercased) description."""
+        return self.categories[self.ranks(descriptions)]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _CategoryCache:
+    """Bounded LRU memo of normalized description -> category.
+
+    Shared across calls so repeated uploads in one process skip rule
+    evaluation entirely. The memo (and the compiled matcher) is dropped as
+    soon as ``CATEGORY_RULES`` no longer matches the rules it was built from.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._rules: tuple[tuple[str, str], ...] | None = None
+        self._matcher: KeywordMatcher | None = None
+        self._lock = threading.Lock()
+
+    def _sync_rules(self) -> KeywordMatcher:
+        rules = tuple(CATEGORY_RULES.items())
+        if self._matcher is None or rules != self._rules:
+            self._entries.clear()
+            self._matcher = KeywordMatcher(CATEGORY_RULES)
+            self._rules = rules
+        return self._matcher
+
+    def categorize(self, descriptions: pd.Index) -> np.ndarray:
+        """Return the category of every unique normalized description.
+
+        The lock only guards the memo lookups and inserts; matching runs
+        outside it, so concurrent callers categorize in parallel.
+        """
+        values = descriptions.tolist()
+        with self._lock:
+            matcher = self._sync_rules()
+            entries = self._entries
+            cached = [entries.get(value) for value in values]
+            missing = [position for position, category in enumerate(cached) if category is None]
+            for value, category in zip(values, cached):
+                if category is not None:
+                    entries.move_to_end(value)
+
+            self.hits += len(values) - len(missing)
+            self.misses += len(missing)
+        result = np.array(cached, dtype=object)
+        if not missing:
+            return result
+
+        unseen = pd.Series(descriptions[missing])
+        result[missing] = matcher.categorize(unseen)
+        if self.maxsize > 0:
+            keep = missing[-self.maxsize:]
+            with self._lock:
+                # Rules changed meanwhile: these results belong to the old memo.
+                if self._matcher is matcher:
+                    entries.update((values[position], result[position]) for position in keep)
+                    while len(entries) > self.maxsize:
+                        entries.popitem(last=False)
+        return result
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_CATEGORY_CACHE = _CategoryCache(int(DEFAULT_CONFIG["category_cache_size"]))
+
+
+def category_cache_info() -> CacheInfo:
+    """Report hits, misses and size of the shared description -> category memo."""
+    return _CATEGORY_CACHE.info()
+
+
+def clear_category_cache() -> None:
+    """Empty the shared description -> category memo and reset its counters."""
+    _CATEGORY_CACHE.clear()
+
+
+@instrument()
 def categorize_transactions(df: pd.DataFrame) -> pd.DataFrame:
     """
     Categorize transactions based on keywords in the description column.
-    
+
     args:
         df (pd.DataFrame): must contain columns ["date", "description", "amount"]
-        
+
     returns:
-        pd.DataFrame: same dataframe with an extra "category column
+        pd.DataFrame: same dataframe with an extra "category" column; the
+        description column itself is left untouched
     """
     if df is None or df.empty:
         raise CategorizationError("Input DataFrame is empty or None.")
-    
+
     if "description" not in df.columns:
         raise CategorizationError("Missing required column: description")
-    
-    # Normalize description 
-    df["description"] = df["description"].astype(str).str.lower()
-
-    categories = []
-    for desc in df["description"]:
-        assigned = "Other"
-        for keyword, cat in CATEGORY_RULES.items():
-            if keyword in desc:
-                assigned = cat
-                break
-        categories.append(assigned)
-
-    df["category"] = categories
-    return df
\ No newline at end of file
+
+    normalized = normalized_description(df)
+    if isinstance(normalized.dtype, pd.CategoricalDtype):
+        # Compact frames: categorize the dictionary, keep the codes.
+        categories = _CATEGORY_CACHE.categorize(normalized.cat.categories)
+        category_codes, uniques = pd.factorize(categories)
+        codes = category_codes[normalized.cat.codes.to_numpy()]
+        df["category"] = pd.Categorical.from_codes(codes, categories=uniques)
+        return df
+
+    # Merchant strings repeat heavily: categorize each unique one only once.
+    codes, uniques = pd.factorize(normalized)
+    # Missing descriptions get code -1, which picks the appended default.
+    categories = np.append(_CATEGORY_CACHE.categorize(uniques), DEFAULT_CATEGORY)
+    df["category"] = categories[codes]
+    return df
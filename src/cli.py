@@ -0,0 +1,288 @@
+"""Headless batch runner: load → categorize → aggregate → budget → export.
+
+Every input CSV is processed in its own worker process. Per-file results are
+exported as soon as they are ready and announced as one JSON line on stdout.
+The combined totals and budget check are written once every file is done,
+followed by a machine-readable summary with rows per second and per-stage
+timings.
+
+Exit codes:
+    0  every file was processed
+    1  nothing was processed (no matching input, or every file failed)
+    2  invalid arguments
+    3  some files failed
+    4  a budget was exceeded and --fail-on-budget was given
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, TextIO
+
+import pandas as pd
+
+from .analysis import TotalsAccumulator
+from .budget import BudgetError, budget_table, evaluate_budget
+from .categorize import categorize_transactions
+from .preprocessing import load_csv
+from .utils_io import COLUMNAR_SUFFIXES, SOURCE_COLUMN, export_dataframe
+from .utils_logging import log_error, log_info
+
+EXIT_OK = 0
+EXIT_NO_RESULTS = 1
+EXIT_USAGE = 2
+EXIT_PARTIAL = 3
+EXIT_BUDGET = 4
+
+FORMATS = ["parquet", "feather", "csv"]
+
+
+def resolve_inputs(patterns: Iterable[str]) -> list[Path]:
+    """Expand files, directories (their *.csv files) and glob patterns, without repeats."""
+    paths: dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(path.glob("*.csv"))
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = sorted(Path(match) for match in glob.glob(pattern, recursive=True))
+        for match in matches:
+            paths.setdefault(match, None)
+    return list(paths)
+
+
+def load_budgets(path: Path) -> dict[str, object] | pd.DataFrame:
+    """Read budgets from JSON ({"Groceries": 300, ...}) or a category,budget CSV."""
+    if path.suffix.lower() == ".json":
+        return json.loads(path.read_text(encoding="utf-8"))
+    return pd.read_csv(path)
+
+
+def output_names(inputs: list[Path]) -> dict[Path, str]:
+    """Name each input's export after its path relative to the inputs' common directory.
+
+    ``a/jan.csv`` and ``b/jan.csv`` become "a/jan" and "b/jan"; a single
+    directory of files keeps the plain file stems.
+
+    Raises:
+        ValueError: if two inputs would still be written to the same file.
+    """
+    resolved = {path: path.resolve() for path in inputs}
+    if not resolved:
+        return {}
+    root = Path(os.path.commonpath([path.parent for path in resolved.values()]))
+    names: dict[Path, str] = {}
+    claimed: dict[str, Path] = {}
+    for path, absolute in resolved.items():
+        name = absolute.relative_to(root).with_suffix("").as_posix()
+        if name in claimed:
+            raise ValueError(f"{claimed[name]} and {path} would both be exported as '{name}'.")
+        claimed[name] = path
+        names[path] = name
+    return names
+
+
+def process_file(source: str, output_dir: str, fmt: str, name: str | None = None) -> dict[str, Any]:
+    """Run the pipeline over one CSV and export its categorized rows.
+
+    The export is written to ``<output_dir>/transactions/<name>.<fmt>``;
+    ``name`` defaults to the file stem.
+
+    Returns the per-stage timings, the row count, the output path and a
+    TotalsAccumulator for the combined aggregates.
+    """
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    df = load_csv(source)
+    timings["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df = categorize_transactions(df)
+    df[SOURCE_COLUMN] = source
+    timings["categorize"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    totals = TotalsAccumulator().update(df)
+    timings["aggregate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    output = Path(output_dir) / "transactions" / f"{name or Path(source).stem}.{fmt}"
+    export_dataframe(df, output)
+    timings["export"] = time.perf_counter() - start
+
+    return {"rows": len(df), "output": str(output), "timings": timings, "totals": totals}
+
+
+def _emit(stream: TextIO, record: dict[str, Any]) -> None:
+    stream.write(json.dumps(record, default=str) + "\n")
+    stream.flush()
+
+
+def run_batch(
+    inputs: list[Path],
+    output_dir: Path,
+    *,
+    fmt: str = "parquet",
+    budgets: dict[str, object] | pd.DataFrame | None = None,
+    workers: int | None = None,
+    use_threads: bool = False,
+    stream: TextIO = sys.stdout,
+) -> dict[str, Any]:
+    """Process ``inputs`` in parallel and write per-file and combined outputs.
+
+    Returns the summary that is also emitted as the last JSON line.
+
+    Raises:
+        ValueError: if two inputs would be exported to the same file
+            (see output_names()); nothing is processed then.
+    """
+    names = output_names(inputs)
+    started = time.perf_counter()
+    pool: type[Executor] = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    stage_seconds: Counter[str] = Counter()
+    failures: dict[str, str] = {}
+    combined = TotalsAccumulator()
+    outputs: list[str] = []
+
+    log_info(f"Batch processing {len(inputs)} files with {workers or os.cpu_count()} workers")
+    with pool(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_file, str(path), str(output_dir), fmt, names[path]): str(path)
+            for path in inputs
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                log_error(f"Skipping {source}: {exc}")
+                failures[source] = str(exc)
+                _emit(stream, {"event": "file_failed", "source": source, "error": str(exc)})
+                continue
+            stage_seconds.update(result["timings"])
+            combined.merge(result["totals"])
+            outputs.append(result["output"])
+            _emit(
+                stream,
+                {
+                    "event": "file_done",
+                    "source": source,
+                    "rows": result["rows"],
+                    "output": result["output"],
+                },
+            )
+
+    budget_exceeded: list[str] = []
+    if combined.rows:
+        start = time.perf_counter()
+        category_totals = combined.category_totals()
+        export_dataframe(combined.monthly_totals(), output_dir / f"monthly_totals.{fmt}")
+        export_dataframe(category_totals, output_dir / f"category_totals.{fmt}")
+        stage_seconds["aggregate"] += time.perf_counter() - start
+
+        if budgets is not None:
+            start = time.perf_counter()
+            spending = category_totals.rename(columns={"total_amount": "amount"})
+            report = evaluate_budget(spending, budgets)
+            export_dataframe(report, output_dir / f"budget.{fmt}")
+            budget_exceeded = report.loc[report["exceeded"], "category"].astype(str).tolist()
+            stage_seconds["budget"] += time.perf_counter() - start
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "event": "summary",
+        "files": len(inputs),
+        "files_processed": len(outputs),
+        "files_failed": len(failures),
+        "rows": combined.rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_second": round(combined.rows / elapsed, 1) if elapsed > 0 else None,
+        "stage_seconds": {stage: round(seconds, 4) for stage, seconds in stage_seconds.items()},
+        "net_balance": combined.net_balance() if combined.rows else None,
+        "budget_exceeded": budget_exceeded,
+        "failures": failures,
+        "output_dir": str(output_dir),
+    }
+    _emit(stream, summary)
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="finance-batch",
+        description="Categorize, aggregate and budget-check CSV exports without the dashboard.",
+    )
+    parser.add_argument("inputs", nargs="+", help="CSV files, directories or glob patterns.")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Output directory.")
+    parser.add_argument("--format", choices=FORMATS, default="parquet", help="Output file format.")
+    parser.add_argument("--budgets", type=Path, help="Budgets as JSON or a category,budget CSV.")
+    parser.add_argument("--workers", type=int, help="Worker count (default: all cores).")
+    parser.add_argument("--threads", action="store_true", help="Use threads instead of processes.")
+    parser.add_argument("--summary", type=Path, help="Also write the summary JSON to this file.")
+    parser.add_argument(
+        "--fail-on-budget", action="store_true", help=f"Exit with {EXIT_BUDGET} when a budget is exceeded."
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if f".{args.format}" in COLUMNAR_SUFFIXES:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error(f"--format {args.format} requires the 'pyarrow' package.")
+
+    budgets = None
+    if args.budgets is not None:
+        try:
+            budgets = load_budgets(args.budgets)
+            budget_table(budgets)
+        except (OSError, ValueError, BudgetError) as exc:
+            parser.error(f"invalid --budgets file: {exc}")
+
+    inputs = resolve_inputs(args.inputs)
+    if not inputs:
+        log_error(f"No CSV files match: {' '.join(args.inputs)}")
+        return EXIT_NO_RESULTS
+    try:
+        output_names(inputs)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    summary = run_batch(
+        inputs,
+        args.output,
+        fmt=args.format,
+        budgets=budgets,
+        workers=args.workers,
+        use_threads=args.threads,
+    )
+    if args.summary is not None:
+        args.summary.parent.mkdir(parents=True, exist_ok=True)
+        args.summary.write_text(json.dumps(summary, indent=2, default=str), encoding="utf-8")
+
+    if summary["files_processed"] == 0:
+        return EXIT_NO_RESULTS
+    if summary["files_failed"]:
+        return EXIT_PARTIAL
+    if args.fail_on_budget and summary["budget_exceeded"]:
+        return EXIT_BUDGET
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Compact in-memory representation for large transaction frames."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+
+AMOUNT_CENTS = "amount_cents"
+
+# Dictionary-encode descriptions when at most this share of them is unique.
+_DESCRIPTION_UNIQUE_RATIO = 0.5
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a memory-lean copy of a transaction frame.
+
+    - ``category`` becomes a categorical.
+    - ``description`` becomes a categorical when its values repeat enough.
+    - ``amount`` is replaced by ``amount_cents``, an integer number of cents,
+      so totals are exact instead of accumulating float drift.
+
+    Other columns are left as they are.
+    """
+    data: dict[str, Any] = {}
+    for column in df.columns:
+        values = df[column]
+        if column == "category":
+            values = values.astype("category")
+        elif column == "description":
+            if values.nunique(dropna=False) <= _DESCRIPTION_UNIQUE_RATIO * len(values):
+                values = values.astype("category")
+        elif column == "amount":
+            cents = (values * 100).round()
+            column = AMOUNT_CENTS
+            values = cents.astype("Int64" if cents.isna().any() else "int64")
+        data[column] = values
+    return pd.DataFrame(data, index=df.index)
+
+
+def has_amount(df: pd.DataFrame) -> bool:
+    """Whether ``df`` carries amounts, either as ``amount`` or ``amount_cents``."""
+    return "amount" in df.columns or AMOUNT_CENTS in df.columns
+
+
+def sum_amounts(df: pd.DataFrame, by: Any = None) -> Any:
+    """Sum amounts in currency units, overall or grouped ``by`` a key.
+
+    Compact frames are summed in integer cents and converted once at the
+    end, so the result carries no float rounding drift.
+    """
+    column = AMOUNT_CENTS if AMOUNT_CENTS in df.columns else "amount"
+    values = df[column] if by is None else df.groupby(by, observed=True)[column]
+    total = values.sum()
+    if column != AMOUNT_CENTS:
+        return total
+    total = total / 100
+    return total.rename("amount") if isinstance(total, pd.Series) else total
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Bytes per column before and after compaction (``after`` defaults to compact_frame(before))."""
+    if after is None:
+        after = compact_frame(before)
+    report = pd.DataFrame(
+        {
+            "before_bytes": before.memory_usage(index=False, deep=True),
+            # Line amount_cents up with the amount column it replaces.
+            "after_bytes": after.memory_usage(index=False, deep=True).rename(
+                {AMOUNT_CENTS: "amount"}
+            ),
+        }
+    )
+    report = report.fillna(0).astype("int64")
+    report.loc["total"] = report.sum()
+    report["saved_pct"] = (1 - report["after_bytes"] / report["before_bytes"]).mul(100).round(1)
+    return report
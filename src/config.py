@@ -5,4 +5,17 @@ from __future__ import annotations
 DEFAULT_CONFIG: dict[str, object] = {
     "currency": "USD",
     "date_format": "%Y-%m-%d",
+    "category_cache_size": 100_000,
+    "cache_dir": ".cache/transactions",
+    "cache_max_bytes": 512 * 1024 * 1024,
+    "duplicate_window_days": 0,
+    "anomaly_threshold": 3.5,
+    "log_dir": "logs",
+    "log_queue": True,
+    "log_json": False,
+    "log_sample_every": 10,
+    "upload_chunk_rows": 100_000,
+    "upload_workers": 2,
+    "chart_max_points": 2_000,
+    "raw_data_page_size": 200,
 }
@@ -0,0 +1,179 @@
+"""Duplicate-transaction detection for overlapping bank exports."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .compact import AMOUNT_CENTS
+from .config import DEFAULT_CONFIG
+from .derived import normalized_description
+from .preprocessing import parse_dates
+from .utils_logging import log_info
+
+KEY_COLUMNS = ("date", "description", "amount")
+
+
+class DeduplicationError(Exception):
+    """Raised when duplicates cannot be detected."""
+
+
+@dataclass
+class DedupResult:
+    """The deduplicated frame plus how many rows each pass removed."""
+
+    frame: pd.DataFrame
+    exact_duplicates: int = 0
+    near_duplicates: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.exact_duplicates + self.near_duplicates
+
+
+def _description_codes(df: pd.DataFrame) -> np.ndarray:
+    # Normalize only the unique descriptions, then map the codes back.
+    codes, uniques = pd.factorize(normalized_description(df), use_na_sentinel=False)
+    cleaned = pd.Index(uniques).astype(str).str.split().str.join(" ")
+    merged, _ = pd.factorize(cleaned)
+    return merged[codes]
+
+
+def _amount_cents(df: pd.DataFrame) -> np.ndarray:
+    cents = df[AMOUNT_CENTS] if AMOUNT_CENTS in df.columns else (df["amount"] * 100).round()
+    return cents.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _near_duplicates(
+    days: np.ndarray,
+    descriptions: np.ndarray,
+    cents: np.ndarray,
+    sources: np.ndarray | None,
+    window: int,
+) -> np.ndarray:
+    """Flag rows within ``window`` days of a kept row with the same description and amount.
+
+    Rows sharing description and amount form a run sorted by day. Its first
+    row is kept; each kept row absorbs the following rows up to ``window``
+    days later (from other sources only, when ``sources`` is given), and the
+    first row past that is kept next. Those "next kept" links are followed
+    for every run at once, so the loop runs once per kept row of the longest
+    run rather than once per row.
+    """
+    flags = np.zeros(len(days), dtype=bool)
+    valid = np.flatnonzero(days != np.iinfo(np.int64).min)
+    if valid.size == 0:
+        return flags
+
+    # Sort once by (description, amount, day) so each run is contiguous.
+    order = valid[np.lexsort((days[valid], cents[valid], descriptions[valid]))]
+    day, desc, amount = days[order], descriptions[order], cents[order]
+    n = len(order)
+    boundary = np.ones(n, dtype=bool)
+    boundary[1:] = (desc[1:] != desc[:-1]) | (amount[1:] != amount[:-1])
+    run = np.cumsum(boundary) - 1
+    starts = np.flatnonzero(boundary)
+    run_end = np.append(starts[1:], n)[run]
+
+    # First row of the same run dated more than ``window`` days later.
+    offset = day - day.min()
+    key = run * (int(offset.max()) + window + 1) + offset
+    successor = np.searchsorted(key, key + window, side="right")
+    if sources is not None:
+        # A repeat from the same source is never a duplicate, so it is kept next.
+        source = sources[order]
+        by_source = np.lexsort((np.arange(n), source, run))
+        group_run, group_source = run[by_source], source[by_source]
+        same_group = (group_run[1:] == group_run[:-1]) & (group_source[1:] == group_source[:-1])
+        next_same = np.full(n, n)
+        next_same[by_source[:-1][same_group]] = by_source[1:][same_group]
+        successor = np.minimum(successor, next_same)
+
+    kept = np.zeros(n, dtype=bool)
+    frontier = starts
+    while frontier.size:
+        kept[frontier] = True
+        following = successor[frontier]
+        frontier = following[following < run_end[frontier]]
+
+    flags[order] = ~kept
+    return flags
+
+
+def deduplicate(
+    df: pd.DataFrame,
+    *,
+    window_days: int | None = None,
+    source_column: str | None = None,
+) -> DedupResult:
+    """
+    Drop duplicate transactions, keeping the first occurrence.
+
+    Exact duplicates share the same day, amount (to the cent) and description
+    (case and whitespace insensitive); they are found by hashing those keys.
+    Near duplicates also match on description and amount but are dated up to
+    ``window_days`` apart (default: DEFAULT_CONFIG["duplicate_window_days"]);
+    they are found in one sorted pass, so the whole check is O(n log n).
+
+    With ``source_column`` (e.g. "source_file"), only rows repeated across
+    different sources count: a file that lists the same coffee twice keeps
+    both, while an overlapping export of that file adds nothing.
+
+    Returns:
+        DedupResult with the remaining rows (original index kept) and the
+        number of exact and near duplicates removed.
+    """
+    if df is None:
+        raise DeduplicationError("Input DataFrame is None.")
+    columns = set(df.columns) | ({"amount"} if AMOUNT_CENTS in df.columns else set())
+    missing = [column for column in KEY_COLUMNS if column not in columns]
+    if missing:
+        raise DeduplicationError(f"Missing required columns: {missing}")
+    if source_column is not None and source_column not in df.columns:
+        raise DeduplicationError(f"Missing required column: {source_column}")
+    if df.empty:
+        return DedupResult(frame=df)
+
+    window = int(DEFAULT_CONFIG["duplicate_window_days"] if window_days is None else window_days)
+    if window < 0:
+        raise DeduplicationError("window_days must be non-negative.")
+
+    # Whole days since the epoch; NaT becomes the int64 minimum.
+    days = parse_dates(df["date"]).to_numpy(dtype="datetime64[D]").view("int64")
+    descriptions = _description_codes(df)
+    cents = _amount_cents(df)
+
+    keys = pd.DataFrame({"day": days, "description": descriptions, "cents": cents})
+    hashed = pd.util.hash_pandas_object(keys, index=False)
+    if source_column is None:
+        exact = hashed.duplicated().to_numpy()
+        sources = None
+    else:
+        # The n-th copy of a key is a duplicate only if another source already had an n-th copy.
+        sources = pd.factorize(df[source_column])[0]
+        occurrence = hashed.groupby([sources, hashed.to_numpy()]).cumcount()
+        exact = pd.DataFrame({"key": hashed.to_numpy(), "n": occurrence.to_numpy()}).duplicated().to_numpy()
+
+    near = np.zeros(len(df), dtype=bool)
+    if window > 0:
+        kept = np.flatnonzero(~exact)
+        near[kept] = _near_duplicates(
+            days[kept],
+            descriptions[kept],
+            cents[kept],
+            None if sources is None else sources[kept],
+            window,
+        )
+
+    result = DedupResult(
+        frame=df.loc[~(exact | near)],
+        exact_duplicates=int(exact.sum()),
+        near_duplicates=int(near.sum()),
+    )
+    log_info(
+        f"Removed {result.removed} duplicate transactions "
+        f"({result.exact_duplicates} exact, {result.near_duplicates} within {window} days)"
+    )
+    return result
@@ -0,0 +1,125 @@
+"""Derived columns computed once per frame, without copying or mutating it.
+
+Several stages need the same helper columns (lowercased descriptions for
+categorization, month periods for every monthly aggregate). Instead of
+writing them into the caller's DataFrame or working on a defensive copy,
+they are kept here, next to the frame, and rebuilt when one of the source
+columns (or the index) is replaced or edited through pandas.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Callable
+
+import pandas as pd
+
+from .preprocessing import parse_dates
+
+_CACHE: dict[int, dict[str, tuple[tuple[Any, ...], tuple[Any, ...], Any]]] = {}
+_LOCK = threading.Lock()
+
+
+def _column_token(series: pd.Series) -> Any:
+    """Identify the buffer behind a column in O(1)."""
+    array = series.array
+    arrow = getattr(array, "_pa_array", None)
+    if arrow is not None:
+        # Arrow data is immutable: pandas swaps in a new array on every edit.
+        return id(arrow)
+    values = getattr(array, "_ndarray", None)
+    if values is None:
+        values = getattr(array, "_data", None)
+    if values is None:
+        return id(array)
+    return values.__array_interface__["data"][0], values.shape, values.strides
+
+
+def _tokens(df: pd.DataFrame, sources: tuple[str, ...]) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
+    # The source columns are held alongside their tokens: with copy-on-write,
+    # an in-place edit of ``df`` (``df.loc[...] = ...``) then has to copy the
+    # edited column to a new buffer, which changes its token. Holding them also
+    # keeps the old buffers (and ids) from being reused while the entry lives.
+    columns = tuple(df[column] for column in sources)
+    tokens = (id(df.index), *(_column_token(column) for column in columns))
+    return tokens, (df.index, *columns)
+
+
+def _forget(key: int) -> None:
+    with _LOCK:
+        _CACHE.pop(key, None)
+
+
+def cached_value(df: pd.DataFrame, name: str, sources: tuple[str, ...]) -> Any:
+    """The value ``derived_column`` holds for ``df``, or None if it would have to be built."""
+    with _LOCK:
+        cached = _CACHE.get(id(df), {}).get(name)
+    if cached is None or cached[0] != _tokens(df, sources)[0]:
+        return None
+    return cached[2]
+
+
+def derived_column(
+    df: pd.DataFrame,
+    name: str,
+    sources: tuple[str, ...],
+    build: Callable[[pd.DataFrame], Any],
+) -> Any:
+    """Return ``build(df)``, cached for as long as ``df`` and its ``sources`` columns live.
+
+    A hit checks only which buffers back the index and source columns, so it
+    costs the same at any size. Replacing a column or editing it through
+    pandas (``df.loc[0, "amount"] = ...``) moves it to a new buffer and
+    rebuilds the entry; after writing into the underlying arrays directly,
+    call ``invalidate(df)``.
+    """
+    tokens, held = _tokens(df, sources)
+    key = id(df)
+    with _LOCK:
+        entries = _CACHE.get(key)
+        if entries is None:
+            entries = _CACHE[key] = {}
+            weakref.finalize(df, _forget, key)
+        cached = entries.get(name)
+    if cached is not None and cached[0] == tokens:
+        return cached[2]
+
+    value = build(df)
+    with _LOCK:
+        entries[name] = (tokens, held, value)
+    return value
+
+
+def invalidate(df: pd.DataFrame) -> None:
+    """Drop every derived value cached for ``df``."""
+    with _LOCK:
+        entries = _CACHE.get(id(df))
+        if entries is not None:
+            entries.clear()
+
+
+def _normalize_descriptions(df: pd.DataFrame) -> pd.Series:
+    descriptions = df["description"]
+    if not isinstance(descriptions.dtype, pd.CategoricalDtype):
+        return descriptions.astype(str).str.lower()
+
+    # Dictionary-encoded (compact) frames: lowercase the dictionary only.
+    if descriptions.isna().any():
+        descriptions = descriptions.cat.add_categories("nan").fillna("nan")
+    lowered_codes, uniques = pd.factorize(descriptions.cat.categories.astype(str).str.lower())
+    codes = lowered_codes[descriptions.cat.codes.to_numpy()]
+    normalized = pd.Categorical.from_codes(codes, categories=uniques)
+    return pd.Series(normalized, index=df.index, name="description")
+
+
+def normalized_description(df: pd.DataFrame) -> pd.Series:
+    """Lowercased descriptions (categorical for compact frames)."""
+    return derived_column(df, "normalized_description", ("description",), _normalize_descriptions)
+
+
+def month_period(df: pd.DataFrame) -> pd.Series:
+    """Monthly ``Period`` of every transaction date."""
+    return derived_column(
+        df, "month_period", ("date",), lambda frame: parse_dates(frame["date"]).dt.to_period("M")
+    )
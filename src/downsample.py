@@ -0,0 +1,89 @@
+"""Reduce long series to a fixed point budget before they are plotted.
+
+Both methods return the positions of the points to keep, in order, so the
+caller can slice whatever frame the series came from. The first and last
+points are always kept.
+
+- ``lttb`` (Largest-Triangle-Three-Buckets) keeps, per bucket, the point
+  that forms the largest triangle with its neighbours; lines keep their
+  visual shape.
+- ``minmax`` keeps the lowest and highest point of every bucket, so no
+  spike or outlier disappears; suited to scatter plots.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def _everything(n: int, points: int) -> bool:
+    if points < 4:
+        raise ValueError("Downsampling needs a budget of at least 4 points.")
+    return n <= points
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Positions of ``points`` samples of the x-sorted series chosen by LTTB."""
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(y)
+    if _everything(n, points):
+        return np.arange(n)
+
+    # points - 2 buckets over the interior; the ends are fixed.
+    edges = np.linspace(1, n - 1, points - 1).astype("int64")
+    selected = np.empty(points, dtype="int64")
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_stop = n - 1, n
+        next_x = x[next_start:next_stop].mean()
+        next_y = y[next_start:next_stop].mean()
+        ax, ay = x[previous], y[previous]
+        areas = np.abs((ax - next_x) * (y[start:stop] - ay) - (ax - x[start:stop]) * (next_y - ay))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def _extreme_positions(y: np.ndarray, starts: np.ndarray, sizes: np.ndarray, reduce: np.ufunc) -> np.ndarray:
+    extremes = reduce.reduceat(y, starts)
+    hits = np.flatnonzero(y == np.repeat(extremes, sizes))
+    # The first hit at or after each bucket start lies inside that bucket.
+    return hits[np.searchsorted(hits, starts)]
+
+
+def minmax(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Positions of the minimum and maximum of equal-count buckets, plus both ends.
+
+    ``x`` is unused; it is accepted so both methods share a signature.
+    """
+    y = np.asarray(y, dtype="float64")
+    n = len(y)
+    if _everything(n, points):
+        return np.arange(n)
+
+    bounds = np.linspace(0, n, (points - 2) // 2 + 1).astype("int64")
+    starts, sizes = bounds[:-1], np.diff(bounds)
+    lows = _extreme_positions(y, starts, sizes, np.minimum)
+    highs = _extreme_positions(y, starts, sizes, np.maximum)
+    return np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+
+
+def downsample(x: np.ndarray, y: np.ndarray, points: int, method: str = "lttb") -> np.ndarray:
+    """Positions to keep so that at most ``points`` remain (``y`` must not contain NaN)."""
+    reducers: dict[str, Callable[[np.ndarray, np.ndarray, int], np.ndarray]] = {
+        "lttb": lttb,
+        "minmax": minmax,
+    }
+    if method not in reducers:
+        raise ValueError(f"Unknown downsampling method: {method!r} (expected one of {METHODS}).")
+    return reducers[method](x, y, points)
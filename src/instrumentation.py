@@ -0,0 +1,211 @@
+"""Per-stage timing, throughput and memory instrumentation.
+
+Public pipeline functions are wrapped with ``@instrument()``; ad-hoc blocks
+can use ``with stage("name") as record: record.rows = ...``. Measurements
+accumulate in an in-process registry that can be exported as JSON or in the
+Prometheus text format.
+
+Instrumentation is off by default. When off, a wrapped call costs one flag
+check. Turn it on with ``enable()`` or by setting the
+``FINANCE_ANALYZER_PROFILE`` environment variable to ``1`` (``memory`` also
+traces peak memory, which slows the traced code down noticeably).
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterator, TypeVar
+
+import pandas as pd
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+METRIC_PREFIX = "finance_analyzer_stage"
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements of one stage."""
+
+    calls: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    peak_memory_bytes: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class StageRecord:
+    """Mutable handle yielded by stage(); set ``rows`` when they are known."""
+
+    rows: int = 0
+    # Highest absolute traced-memory peak seen while the stage was open.
+    _peak: int = 0
+
+
+class _State(threading.local):
+    def __init__(self) -> None:
+        self.stack: list[StageRecord] = []
+
+
+_ENABLED = False
+_TRACE_MEMORY = False
+_REGISTRY: dict[str, StageStats] = {}
+_LOCK = threading.Lock()
+_LOCAL = _State()
+
+
+def enable(*, memory: bool = False) -> None:
+    """Start recording; ``memory`` also traces peak memory with tracemalloc."""
+    global _ENABLED, _TRACE_MEMORY
+    _ENABLED = True
+    _TRACE_MEMORY = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable() -> None:
+    """Stop recording (the registry is kept)."""
+    global _ENABLED, _TRACE_MEMORY
+    _ENABLED = False
+    if _TRACE_MEMORY and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _TRACE_MEMORY = False
+
+
+def is_enabled() -> bool:
+    return _ENABLED
+
+
+def reset() -> None:
+    """Forget every recorded measurement."""
+    with _LOCK:
+        _REGISTRY.clear()
+
+
+def _record(name: str, record: StageRecord, seconds: float, memory: int) -> None:
+    with _LOCK:
+        stats = _REGISTRY.setdefault(name, StageStats())
+        stats.calls += 1
+        stats.rows += record.rows
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.peak_memory_bytes = max(stats.peak_memory_bytes, memory)
+
+
+@contextmanager
+def stage(name: str, rows: int = 0) -> Iterator[StageRecord]:
+    """Measure the enclosed block as stage ``name`` (no-op while disabled).
+
+    Peak memory is the largest traced allocation above what was in use when
+    the stage started; nested stages are accounted to their parents too.
+    """
+    record = StageRecord(rows=rows)
+    if not _ENABLED:
+        yield record
+        return
+
+    trace = _TRACE_MEMORY and tracemalloc.is_tracing()
+    stack = _LOCAL.stack
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            # reset_peak() below would hide the parent's peak so far.
+            stack[-1]._peak = max(stack[-1]._peak, peak)
+        tracemalloc.reset_peak()
+        start_memory = current
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        seconds = time.perf_counter() - start
+        stack.pop()
+        memory = 0
+        if trace:
+            peak = max(tracemalloc.get_traced_memory()[1], record._peak)
+            memory = max(peak - start_memory, 0)
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+        _record(name, record, seconds, memory)
+
+
+def _count_rows(args: tuple[Any, ...], kwargs: dict[str, Any], result: Any) -> int:
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return len(value)
+    return len(result) if isinstance(result, pd.DataFrame) else 0
+
+
+def instrument(name: str | None = None) -> Callable[[F], F]:
+    """Decorate a function so each call is recorded as a stage.
+
+    The stage defaults to "<module>.<function>" (e.g. "analysis.monthly_totals").
+    Rows are the length of the first DataFrame (or Series) argument, or of a
+    returned DataFrame when the function takes none (e.g. load_csv).
+    """
+
+    def decorate(func: F) -> F:
+        stage_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            with stage(stage_name) as record:
+                result = func(*args, **kwargs)
+                record.rows = _count_rows(args, kwargs, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Copy of the registry: stage name -> measurements incl. rows_per_second."""
+    with _LOCK:
+        return {
+            name: {**asdict(stats), "rows_per_second": stats.rows_per_second}
+            for name, stats in sorted(_REGISTRY.items())
+        }
+
+
+def to_json(indent: int | None = 2) -> str:
+    """The registry as a JSON document."""
+    return json.dumps(snapshot(), indent=indent)
+
+
+def to_prometheus() -> str:
+    """The registry in the Prometheus text exposition format."""
+    metrics = [
+        ("calls_total", "counter", "Calls per stage.", "calls"),
+        ("rows_total", "counter", "Rows processed per stage.", "rows"),
+        ("seconds_total", "counter", "Wall time spent per stage.", "seconds"),
+        ("seconds_max", "gauge", "Slowest single call per stage.", "max_seconds"),
+        ("peak_memory_bytes", "gauge", "Largest peak memory delta per stage.", "peak_memory_bytes"),
+    ]
+    stats = snapshot()
+    lines: list[str] = []
+    for suffix, kind, help_text, key in metrics:
+        metric = f"{METRIC_PREFIX}_{suffix}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, values in stats.items():
+            lines.append(f'{metric}{{stage="{name}"}} {values[key]}')
+    return "\n".join(lines) + "\n"
+
+
+if os.environ.get("FINANCE_ANALYZER_PROFILE", "") in {"1", "memory"}:
+    enable(memory=os.environ["FINANCE_ANALYZER_PROFILE"] == "memory")
@@ -0,0 +1,274 @@
+"""Background processing of uploads with progress reporting and cancellation.
+
+An ``UploadJob`` streams a CSV through ``load_csv_chunks`` on a worker
+thread, categorizes each chunk and folds its aggregates into a
+``TotalsAccumulator``. The caller keeps its own thread free and polls
+``progress()`` and ``partial_summary()`` while the job runs; ``cancel()``
+stops the job before its next chunk.
+
+Finished frames are stored in the transaction cache (see ``cache``), so
+uploading the same content again is served without re-parsing.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .analysis import TotalsAccumulator
+from .cache import FrameCache, content_hash, transactions_key
+from .categorize import categorize_transactions
+from .config import DEFAULT_CONFIG
+from .instrumentation import stage
+from .preprocessing import _is_path_like, load_csv_chunks
+from .utils_io import _PYARROW_AVAILABLE
+from .utils_logging import log_error, log_info
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+class JobCancelled(Exception):
+    """Raised by UploadJob.result() when the job was cancelled."""
+
+
+@dataclass(frozen=True)
+class JobProgress:
+    """Point-in-time view of an UploadJob."""
+
+    state: str
+    rows_parsed: int = 0
+    rows_categorized: int = 0
+    chunks: int = 0
+    # Share of the input bytes consumed so far; None when the size is unknown.
+    fraction: float | None = None
+    seconds: float = 0.0
+    from_cache: bool = False
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=int(DEFAULT_CONFIG["upload_workers"]), thread_name_prefix="upload"
+            )
+        return _EXECUTOR
+
+
+def _private_reader(source: Any) -> tuple[Any, int | None]:
+    """A reader with its own cursor over ``source`` and the byte size, if known."""
+    if _is_path_like(source):
+        path = Path(source)
+        if not path.exists():
+            return source, None
+        return path.open("rb"), path.stat().st_size
+    if hasattr(source, "getvalue"):
+        # Uploads are in-memory buffers; a second buffer over the same bytes
+        # keeps the caller's read position untouched.
+        data = source.getvalue()
+        reader = io.BytesIO(data) if isinstance(data, bytes) else io.StringIO(data)
+        return reader, len(data)
+    return source, None
+
+
+def _summary(totals: TotalsAccumulator) -> dict[str, object]:
+    category_totals = totals.category_totals()
+    return {
+        "net_balance": totals.net_balance(),
+        "categories": len(category_totals),
+        "transactions": totals.rows,
+        "category_totals": category_totals,
+    }
+
+
+class UploadJob:
+    """
+    Load and categorize one CSV in the background.
+
+    Args:
+        source: Path-like string or a file-like object with a ``read`` method.
+        digest: Content hash of ``source`` when the caller already has it.
+        chunksize: Rows per chunk (default: DEFAULT_CONFIG["upload_chunk_rows"]).
+        cache: Transaction cache; defaults to a FrameCache when pyarrow is
+            installed. Pass ``False`` to disable caching.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        *,
+        digest: str | None = None,
+        chunksize: int | None = None,
+        cache: FrameCache | None | bool = None,
+    ) -> None:
+        self.source = source
+        self.digest = digest
+        self.chunksize = int(chunksize or DEFAULT_CONFIG["upload_chunk_rows"])
+        if cache is None and _PYARROW_AVAILABLE:
+            cache = FrameCache()
+        self.cache = cache or None
+
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._future: Future[pd.DataFrame] | None = None
+        self._state = PENDING
+        self._progress = JobProgress(PENDING)
+        self._summary: dict[str, object] | None = None
+        self._started = 0.0
+        self._finished: float | None = None
+
+    def start(self, executor: Executor | None = None) -> UploadJob:
+        """Submit the job to ``executor`` (default: a shared thread pool)."""
+        if self._future is not None:
+            raise RuntimeError("UploadJob has already been started.")
+        self._started = time.perf_counter()
+        self._future = (executor or _executor()).submit(self._run)
+        return self
+
+    def cancel(self) -> None:
+        """Stop the job before its next chunk; a job not yet running never starts."""
+        self._cancel.set()
+        if self._future is not None and self._future.cancel():
+            self._set_state(CANCELLED)
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def done(self) -> bool:
+        return self._state in (DONE, CANCELLED, FAILED)
+
+    def progress(self) -> JobProgress:
+        with self._lock:
+            progress, state, finished = self._progress, self._state, self._finished
+        seconds = (finished or time.perf_counter()) - self._started if self._started else 0.0
+        return replace(progress, state=state, seconds=seconds)
+
+    def partial_summary(self) -> dict[str, object] | None:
+        """Totals over every row categorized so far (None before the first chunk).
+
+        Same keys as the dashboard summary: "net_balance", "categories",
+        "transactions" and "category_totals".
+        """
+        with self._lock:
+            return self._summary
+
+    def result(self, timeout: float | None = None) -> pd.DataFrame:
+        """Wait for and return the categorized frame.
+
+        Raises:
+            JobCancelled: if the job was cancelled.
+            Exception: whatever loading or categorizing raised.
+        """
+        if self._future is None:
+            raise RuntimeError("UploadJob has not been started.")
+        if self._state == CANCELLED:
+            raise JobCancelled("Upload processing was cancelled.")
+        try:
+            return self._future.result(timeout)
+        except Exception as exc:
+            if self._state == CANCELLED:
+                raise JobCancelled("Upload processing was cancelled.") from exc
+            raise
+
+    def _set_state(self, state: str) -> None:
+        with self._lock:
+            self._state = state
+            if state in (DONE, CANCELLED, FAILED):
+                self._finished = time.perf_counter()
+
+    def _publish(self, totals: TotalsAccumulator, **progress: Any) -> None:
+        summary = _summary(totals)
+        with self._lock:
+            self._progress = JobProgress(RUNNING, **progress)
+            self._summary = summary
+
+    def _check_cancelled(self) -> None:
+        if self._cancel.is_set():
+            raise JobCancelled("Upload processing was cancelled.")
+
+    def _run(self) -> pd.DataFrame:
+        self._set_state(RUNNING)
+        try:
+            with stage("jobs.upload") as record:
+                df = self._load()
+                record.rows = len(df)
+        except JobCancelled:
+            log_info(f"Cancelled upload job after {self._progress.rows_parsed} rows")
+            self._set_state(CANCELLED)
+            raise
+        except Exception as exc:
+            log_error(f"Upload job failed: {exc}")
+            self._set_state(FAILED)
+            raise
+        self._set_state(DONE)
+        return df
+
+    def _load(self) -> pd.DataFrame:
+        key = None
+        if self.cache is not None:
+            key = transactions_key(self.digest or content_hash(self.source))
+            cached = self.cache.get(key)
+            if cached is not None:
+                log_info(f"Loaded {len(cached)} cached rows for {key[:12]}", hot=True)
+                rows = len(cached)
+                self._publish(
+                    TotalsAccumulator().update(cached),
+                    rows_parsed=rows,
+                    rows_categorized=rows,
+                    chunks=1,
+                    fraction=1.0,
+                    from_cache=True,
+                )
+                return cached
+
+        reader, size = _private_reader(self.source)
+        totals = TotalsAccumulator()
+        frames: list[pd.DataFrame] = []
+        parsed = 0
+        try:
+            chunks = load_csv_chunks(reader, chunksize=self.chunksize)
+            try:
+                for chunk in chunks:
+                    self._check_cancelled()
+                    parsed += len(chunk)
+                    with self._lock:
+                        self._progress = replace(self._progress, rows_parsed=parsed)
+                    chunk = categorize_transactions(chunk)
+                    frames.append(chunk)
+                    totals.update(chunk)
+                    position = reader.tell() if size and hasattr(reader, "tell") else None
+                    self._publish(
+                        totals,
+                        rows_parsed=parsed,
+                        rows_categorized=totals.rows,
+                        chunks=len(frames),
+                        fraction=min(position / size, 1.0) if position is not None else None,
+                    )
+            finally:
+                chunks.close()
+        finally:
+            if reader is not self.source:
+                reader.close()
+
+        self._check_cancelled()
+        df = frames[0] if len(frames) == 1 else pd.concat(frames)
+        with self._lock:
+            self._progress = replace(self._progress, fraction=1.0)
+        if key is not None:
+            self.cache.put(key, df)
+        return df
@@ -0,0 +1,56 @@
+"""Server-side paging for table views of large frames.
+
+Only the requested page is sliced out (``iloc``, no copy of the rest), so
+what a table widget serializes is bounded by the page size, not by the
+dataset.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .config import DEFAULT_CONFIG
+
+
+@dataclass
+class Page:
+    """One page of a frame; ``number`` is 1-based."""
+
+    frame: pd.DataFrame
+    number: int
+    pages: int
+    total_rows: int
+    start: int
+
+    @property
+    def stop(self) -> int:
+        return self.start + len(self.frame)
+
+
+def _page_size(page_size: int | None) -> int:
+    size = int(DEFAULT_CONFIG["raw_data_page_size"] if page_size is None else page_size)
+    if size <= 0:
+        raise ValueError("page_size must be a positive integer.")
+    return size
+
+
+def page_count(total_rows: int, page_size: int | None = None) -> int:
+    """Number of pages needed for ``total_rows`` (at least 1)."""
+    size = _page_size(page_size)
+    return max(-(-total_rows // size), 1)
+
+
+def paginate(df: pd.DataFrame, page: int = 1, page_size: int | None = None) -> Page:
+    """
+    Slice page ``page`` out of ``df``.
+
+    Out-of-range page numbers are clamped to the first or last page, so a
+    stale page number (e.g. after filtering) still returns rows.
+    """
+    size = _page_size(page_size)
+    pages = page_count(len(df), size)
+    number = min(max(int(page), 1), pages)
+    start = (number - 1) * size
+    return Page(df.iloc[start : start + size], number, pages, len(df), start)
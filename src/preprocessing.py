@@ -2,23 +2,58 @@
 
 from __future__ import annotations
 
+import codecs
 import os
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 import pandas as pd
 
+from .compact import compact_frame
+from .config import DEFAULT_CONFIG
 from .exceptions import DatasetNotFoundError, EmptyDatasetError
+from .instrumentation import instrument
 from .utils_logging import log_error, log_info
 
+REQUIRED_COLUMNS = {"date", "description", "amount"}
+
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Formats pandas can hand to its native ISO 8601 parser.
+_ISO_FORMATS = {"%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"}
+
 
 def _is_path_like(obj: Any) -> bool:
     return isinstance(obj, (str, os.PathLike)) or hasattr(obj, "__fspath__")
 
 
-def _read_csv(reader: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+def _detect_encoding(sample: bytes | str) -> str:
+    """Pick utf-8 or latin1 from a leading sample of the source."""
+    if isinstance(sample, str):
+        return "utf-8"
+    try:
+        # Incremental decoding tolerates a multi-byte character cut at the end.
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "latin1"
+    return "utf-8"
+
+
+def _sample_source(source: Any) -> bytes | str:
+    if _is_path_like(source):
+        with open(source, "rb") as handle:
+            return handle.read(_ENCODING_SAMPLE_BYTES)
+    sample = source.read(_ENCODING_SAMPLE_BYTES)
+    source.seek(0)
+    return sample
+
+
+def _read_csv(
+    reader: Callable[[str], pd.DataFrame],
+    encodings: tuple[str, ...] = ("utf-8", "latin1"),
+) -> pd.DataFrame:
     last_error: Exception | None = None
-    for encoding in ("utf-8", "latin1"):
+    for encoding in encodings:
         try:
             return reader(encoding)
         except UnicodeDecodeError as exc:
@@ -37,18 +72,73 @@ def _source_repr(source: Any) -> str:
     return f"<file-like {hex(id(source))}>"
 
 
-def load_csv(source: Any) -> pd.DataFrame:
+@instrument()
+def parse_dates(values: pd.Series, date_format: str | None = None) -> pd.Series:
+    """Parse a column of date strings using the configured format.
+
+    Columns that already hold datetimes are returned untouched, so later
+    stages can call this freely without re-parsing. Otherwise only the
+    unique strings are parsed (bank exports repeat the same dates many
+    times), with ``DEFAULT_CONFIG["date_format"]`` as the explicit format and
+    a native fast path for ISO dates. Strings that do not match the format
+    fall back to pandas' inference; anything unparseable becomes NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    date_format = date_format or str(DEFAULT_CONFIG["date_format"])
+    codes, uniques = pd.factorize(values)
+    explicit = "ISO8601" if date_format in _ISO_FORMATS else date_format
+    parsed = pd.to_datetime(uniques, format=explicit, errors="coerce")
+
+    unmatched = parsed.isna()
+    if unmatched.any():
+        fallback = pd.to_datetime(pd.Series(uniques[unmatched]), errors="coerce")
+        merged = parsed.to_numpy(copy=True)
+        merged[unmatched] = fallback.to_numpy()
+        parsed = pd.DatetimeIndex(merged)
+
+    dates = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(dates, index=values.index, name=values.name)
+
+
+def _clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize columns, coerce types and drop rows without date or amount."""
+    df.columns = df.columns.str.lower().str.strip()
+    if not REQUIRED_COLUMNS.issubset(df.columns):
+        error_msg = f"CSV must contain columns: {REQUIRED_COLUMNS}"
+        log_error(error_msg)
+        raise ValueError(error_msg)
+
+    df["date"] = parse_dates(df["date"])
+    df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
+    df["description"] = df["description"].astype(str)
+
+    return df.dropna(subset=["date", "amount"])
+
+
+def _candidate_encodings(source: Any) -> tuple[str, ...]:
+    # latin1 decodes any byte sequence, so a failed utf-8 sample settles it.
+    if _detect_encoding(_sample_source(source)) == "latin1":
+        return ("latin1",)
+    return ("utf-8", "latin1")
+
+
+@instrument()
+def load_csv(source: Any, compact: bool = False) -> pd.DataFrame:
     """Load and sanitize a CSV file containing expenses.
 
     Args:
         source: Path-like string or a file-like object with a ``read`` method.
+        compact: Return the memory-lean layout from ``compact.compact_frame``
+            (dictionary-encoded descriptions, integer ``amount_cents``).
 
     Returns:
         A cleaned DataFrame with the expected columns.
     """
 
     descriptor = _source_repr(source)
-    log_info(f"Loading CSV from {descriptor}")
+    log_info(f"Loading CSV from {descriptor}", hot=True)
 
     try:
         if _is_path_like(source):
@@ -59,7 +149,7 @@ def load_csv(source: Any) -> pd.DataFrame:
             def reader(encoding: str) -> pd.DataFrame:
                 return pd.read_csv(file_path, encoding=encoding)
 
-            df = _read_csv(reader)
+            df = _read_csv(reader, _candidate_encodings(file_path))
 
         elif hasattr(source, "read"):
             file_like = source
@@ -70,7 +160,12 @@ def load_csv(source: Any) -> pd.DataFrame:
                 return pd.read_csv(file_like, encoding=encoding)
 
             try:
-                df = _read_csv(reader)
+                encodings = (
+                    _candidate_encodings(file_like)
+                    if hasattr(file_like, "seek")
+                    else ("utf-8", "latin1")
+                )
+                df = _read_csv(reader, encodings)
             finally:
                 if hasattr(file_like, "seek"):
                     try:
@@ -85,22 +180,76 @@ def load_csv(source: Any) -> pd.DataFrame:
         log_error(f"Failed to load CSV from {descriptor}: {exc}")
         raise
 
-    df.columns = df.columns.str.lower().str.strip()
-    required_cols = {"date", "description", "amount"}
-    if not required_cols.issubset(df.columns):
-        error_msg = f"CSV must contain columns: {required_cols}"
+    df = _clean_frame(df)
+    if df.empty:
+        error_msg = "CSV does not contain valid rows after cleaning."
         log_error(error_msg)
-        raise ValueError(error_msg)
+        raise EmptyDatasetError(error_msg)
 
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
-    df["description"] = df["description"].astype(str)
+    log_info(f"Loaded {len(df)} rows from {descriptor}")
+    return compact_frame(df) if compact else df
 
-    df = df.dropna(subset=["date", "amount"])
-    if df.empty:
+
+def load_csv_chunks(source: Any, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Stream a CSV of expenses as cleaned DataFrame chunks.
+
+    Each chunk gets the same cleaning as :func:`load_csv`, but only
+    ``chunksize`` rows are held in memory at a time. The encoding is detected
+    once from a leading byte sample instead of by failing a full parse.
+
+    Args:
+        source: Path-like string or a file-like object with a ``read`` method.
+        chunksize: Number of raw CSV rows parsed per chunk.
+
+    Yields:
+        Cleaned, non-empty DataFrame chunks.
+    """
+
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer.")
+
+    descriptor = _source_repr(source)
+    log_info(f"Streaming CSV from {descriptor} in chunks of {chunksize} rows")
+
+    try:
+        if _is_path_like(source):
+            if not Path(source).exists():
+                raise DatasetNotFoundError(f"File not found: {source}")
+        elif hasattr(source, "read"):
+            if hasattr(source, "seek"):
+                source.seek(0)
+        else:
+            raise TypeError("CSV source must be a path or a file-like object with read().")
+
+        encoding = (
+            _detect_encoding(_sample_source(source))
+            if _is_path_like(source) or hasattr(source, "seek")
+            else "utf-8"
+        )
+        chunks = pd.read_csv(source, encoding=encoding, chunksize=chunksize)
+    except Exception as exc:
+        log_error(f"Failed to load CSV from {descriptor}: {exc}")
+        raise
+
+    total_rows = 0
+    with chunks:
+        try:
+            for chunk in chunks:
+                chunk = _clean_frame(chunk)
+                if chunk.empty:
+                    continue
+                total_rows += len(chunk)
+                yield chunk
+        except UnicodeDecodeError as exc:
+            error_msg = (
+                f"Unable to decode {descriptor} as {encoding} past the sampled header."
+            )
+            log_error(error_msg)
+            raise ValueError(error_msg) from exc
+
+    if total_rows == 0:
         error_msg = "CSV does not contain valid rows after cleaning."
         log_error(error_msg)
         raise EmptyDatasetError(error_msg)
 
-    log_info(f"Loaded {len(df)} rows from {descriptor}")
-    return df
+    log_info(f"Streamed {total_rows} rows from {descriptor}")
@@ -0,0 +1,146 @@
+"""Recurring-payment and subscription detection.
+
+Transactions are grouped by a normalized merchant key, sorted by date and
+differenced; a merchant is recurring when its intervals sit close to a known
+cadence and its amounts barely move. Every step is a sort, a diff or a
+grouped aggregation, so there are no Python loops over merchants.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .analysis import AnalysisError
+from .compact import AMOUNT_CENTS, has_amount
+from .derived import derived_column, normalized_description
+from .preprocessing import parse_dates
+
+# Cadence name -> (typical interval in days, calendar offset for the next date).
+CADENCES: dict[str, tuple[float, pd.DateOffset]] = {
+    "weekly": (7.0, pd.DateOffset(weeks=1)),
+    "biweekly": (14.0, pd.DateOffset(weeks=2)),
+    "monthly": (30.44, pd.DateOffset(months=1)),
+    "quarterly": (91.31, pd.DateOffset(months=3)),
+    "yearly": (365.25, pd.DateOffset(years=1)),
+}
+
+RECURRING_COLUMNS = [
+    "merchant",
+    "category",
+    "cadence",
+    "interval_days",
+    "typical_amount",
+    "occurrences",
+    "last_date",
+    "next_expected_date",
+]
+
+
+def _merchant_keys(df: pd.DataFrame) -> tuple[np.ndarray, pd.Index]:
+    """Merchant codes per row plus the merchant names they point into.
+
+    A merchant name is the lowercased description without digits or
+    punctuation ("NETFLIX.COM 0423" -> "netflix com").
+    """
+
+    def build(frame: pd.DataFrame) -> tuple[np.ndarray, pd.Index]:
+        codes, uniques = pd.factorize(normalized_description(frame), use_na_sentinel=False)
+        keys = pd.Index(uniques).astype(str).str.replace(r"[^a-z]+", " ", regex=True).str.split().str.join(" ")
+        merged, names = pd.factorize(keys)
+        return merged[codes], pd.Index(names)
+
+    return derived_column(df, "merchant_key", ("description",), build)
+
+
+def detect_recurring(
+    df: pd.DataFrame,
+    *,
+    min_occurrences: int = 3,
+    interval_tolerance: float = 0.2,
+    amount_tolerance: float = 0.1,
+) -> pd.DataFrame:
+    """
+    Find recurring charges (and recurring income) in a transaction history.
+
+    Args:
+        df (pd.DataFrame): DataFrame with at least ["date", "description", "amount"]
+        min_occurrences: Fewest dated charges a merchant needs.
+        interval_tolerance: Largest relative gap between the median interval
+            and the cadence, which is also the share of intervals that may
+            stray further than that from the median.
+        amount_tolerance: Largest median relative deviation of the amounts.
+
+    Returns:
+        DataFrame with one row per subscription (merchant, category, cadence,
+        interval_days, typical_amount, occurrences, last_date and
+        next_expected_date), sorted by merchant.
+    """
+    if df is None or df.empty:
+        raise AnalysisError("Input DataFrame is empty or None.")
+    if not {"date", "description"}.issubset(df.columns) or not has_amount(df):
+        raise AnalysisError("Missing required columns: date, description or amount")
+
+    amounts = df[AMOUNT_CENTS] / 100 if AMOUNT_CENTS in df.columns else df["amount"]
+    codes, names = _merchant_keys(df)
+    frame = pd.DataFrame(
+        {
+            "merchant": codes,
+            "day": parse_dates(df["date"]).dt.normalize().to_numpy(),
+            "amount": amounts.to_numpy(dtype="float64", na_value=np.nan),
+            "category": df["category"].astype(object).to_numpy() if "category" in df.columns else None,
+        }
+    )
+    # Charges and refunds from one merchant are separate streams.
+    frame["sign"] = np.sign(frame["amount"])
+    frame = frame.dropna(subset=["day", "amount"])
+    blank = np.flatnonzero(names == "")
+    frame = frame.loc[~frame["merchant"].isin(blank)]
+    frame = frame.sort_values(["merchant", "sign", "day"], kind="stable")
+    frame = frame.drop_duplicates(["merchant", "sign", "day"])
+
+    keys = ["merchant", "sign"]
+    grouped = frame.groupby(keys, sort=False)
+    frame["interval"] = grouped["day"].diff().dt.days
+    frame["interval_median"] = grouped["interval"].transform("median")
+    frame["amount_median"] = grouped["amount"].transform("median")
+    off = (frame["interval"] - frame["interval_median"]).abs() > interval_tolerance * frame["interval_median"]
+    # The first charge of each merchant has no interval and is not counted.
+    frame["interval_off"] = off.astype("float64").where(frame["interval"].notna())
+    frame["amount_dev"] = (frame["amount"] - frame["amount_median"]).abs() / frame["amount_median"].abs()
+
+    summary = frame.groupby(keys, sort=True).agg(
+        category=("category", "first"),
+        occurrences=("day", "size"),
+        last_date=("day", "max"),
+        interval_days=("interval_median", "first"),
+        irregular=("interval_off", "mean"),
+        typical_amount=("amount_median", "first"),
+        amount_dev=("amount_dev", "median"),
+    )
+    summary = summary.loc[
+        (summary["occurrences"] >= min_occurrences)
+        & (summary["irregular"] <= interval_tolerance)
+        & (summary["amount_dev"] <= amount_tolerance)
+    ]
+
+    # Snap each median interval to the nearest cadence, if one is close enough.
+    cadences = np.array(list(CADENCES))
+    periods = np.array([days for days, _ in CADENCES.values()])
+    error = np.abs(summary["interval_days"].to_numpy()[:, None] / periods - 1)
+    nearest = error.argmin(axis=1)
+    summary = summary.assign(cadence=cadences[nearest]).loc[
+        error[np.arange(len(summary)), nearest] <= interval_tolerance
+    ]
+
+    next_dates = pd.Series(pd.NaT, index=summary.index, dtype=summary["last_date"].dtype)
+    for name, (_, offset) in CADENCES.items():
+        rows = summary["cadence"] == name
+        if rows.any():
+            next_dates[rows] = summary.loc[rows, "last_date"] + offset
+    summary["next_expected_date"] = next_dates
+
+    result = summary.reset_index()
+    result["merchant"] = np.asarray(names, dtype=object)[result["merchant"].to_numpy()]
+    result["typical_amount"] = result["typical_amount"].round(2)
+    return result[RECURRING_COLUMNS].reset_index(drop=True)
@@ -0,0 +1,157 @@
+"""Pre-aggregated (month × category) rollups.
+
+A dataset is reduced once to one row per (month, category) cell holding the
+amount sum and the transaction count. Totals per month, per category, per
+category per month and the net balance are then read from those few cells
+instead of regrouping the raw rows. Cubes can be appended to and merged, so
+new transactions only cost a pass over the new rows.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from .compact import AMOUNT_CENTS, has_amount, sum_amounts
+from .derived import cached_value, derived_column, month_period
+
+KEYS = ["month", "category"]
+
+
+def _cells(df: pd.DataFrame) -> tuple[pd.DataFrame, bool]:
+    """Group ``df`` into (month, category) cells; missing keys are kept as NaN."""
+    cents = AMOUNT_CENTS in df.columns
+    column = AMOUNT_CENTS if cents else "amount"
+    month = month_period(df) if "date" in df.columns else pd.Series(pd.NaT, index=df.index)
+    category = df["category"] if "category" in df.columns else pd.Series(None, index=df.index, dtype=object)
+
+    grouped = df[column].groupby([month.rename("month"), category.rename("category")], observed=True, dropna=False)
+    cells = grouped.agg(["sum", "size"]).set_axis(["amount", "count"], axis=1).reset_index()
+    # Only the (few) cell keys are turned into strings.
+    for key in KEYS:
+        cells[key] = pd.Series([None if pd.isna(value) else str(value) for value in cells[key]], dtype=object)
+    return cells, cents
+
+
+class RollupCube:
+    """
+    (month × category) amount sums and counts for one dataset.
+
+    Amounts are kept in integer cents while every appended frame is compact,
+    so totals stay exact; otherwise they are kept in currency units.
+    """
+
+    def __init__(self) -> None:
+        self.cells = pd.DataFrame({"month": [], "category": [], "amount": [], "count": []})
+        self.cells = self.cells.astype({"month": object, "category": object, "count": "int64"})
+        self._cents: bool | None = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> RollupCube:
+        """Build a cube from a frame with an amount column (date/category optional)."""
+        return cls().append(df)
+
+    @property
+    def rows(self) -> int:
+        return int(self.cells["count"].sum())
+
+    @property
+    def empty(self) -> bool:
+        return self.cells.empty
+
+    def _combine(self, cells: pd.DataFrame, cents: bool | None) -> None:
+        if cents is None:
+            return
+        if self._cents is None:
+            self._cents = cents
+        elif self._cents != cents:
+            # Mixed sources: fall back to currency units for everything.
+            if self._cents:
+                self.cells = self.cells.assign(amount=self.cells["amount"] / 100)
+            else:
+                cells = cells.assign(amount=cells["amount"] / 100)
+            self._cents = False
+        if self.cells.empty:
+            # ``cells`` may belong to another (possibly cached) cube.
+            self.cells = cells.copy()
+            return
+        combined = pd.concat([self.cells, cells], ignore_index=True)
+        self.cells = combined.groupby(KEYS, dropna=False, sort=False, as_index=False).sum()
+
+    def append(self, df: pd.DataFrame) -> RollupCube:
+        """Fold new transactions into the cube in O(len(df))."""
+        if df is None or df.empty:
+            return self
+        if not has_amount(df):
+            raise ValueError("Cannot build a rollup without an amount column.")
+        self._combine(*_cells(df))
+        return self
+
+    def merge(self, other: RollupCube) -> RollupCube:
+        """Fold another cube (e.g. from a parallel partition) into this one."""
+        self._combine(other.cells, other._cents)
+        return self
+
+    def _amounts(self, values: pd.Series) -> pd.Series:
+        values = values / 100 if self._cents else values
+        return values.rename("amount")
+
+    def _sums_by(self, key: str) -> pd.Series:
+        cells = self.cells.loc[self.cells[key].notna()]
+        return self._amounts(cells.groupby(key)["amount"].sum())
+
+    def monthly_totals(self) -> pd.Series:
+        """Amount per month ("YYYY-MM"); rows without a valid date are left out."""
+        return self._sums_by("month")
+
+    def category_totals(self) -> pd.Series:
+        """Amount per category; rows without a category are left out."""
+        return self._sums_by("category")
+
+    def month_category_totals(self) -> pd.DataFrame:
+        """Amounts as a month × category table (missing cells are 0)."""
+        cells = self.cells.dropna(subset=KEYS)
+        table = cells.pivot_table(index="month", columns="category", values="amount", aggfunc="sum", fill_value=0)
+        return table / 100 if self._cents else table
+
+    def counts(self, key: str = "category") -> pd.Series:
+        """Transaction count per "month" or "category"."""
+        cells = self.cells.loc[self.cells[key].notna()]
+        return cells.groupby(key)["count"].sum()
+
+    def net_balance(self) -> float:
+        """Sum of every amount in the cube."""
+        total = self.cells["amount"].sum()
+        return float(total / 100 if self._cents else total)
+
+
+def _sources(df: pd.DataFrame) -> tuple[str, ...]:
+    return tuple(column for column in ("date", "category", "amount", AMOUNT_CENTS) if column in df.columns)
+
+
+def rollup(df: pd.DataFrame) -> RollupCube:
+    """The cube for ``df``, built once and reused until its key columns change.
+
+    The cube is shared between callers; append to a ``RollupCube.from_frame``
+    copy instead of this one.
+    """
+    return derived_column(df, "rollup", _sources(df), RollupCube.from_frame)
+
+
+def cached_rollup(df: pd.DataFrame) -> RollupCube | None:
+    """The cube ``rollup(df)`` would return if it is already built, else None."""
+    return cached_value(df, "rollup", _sources(df))
+
+
+def category_sums(df: pd.DataFrame) -> pd.Series:
+    """Amount per category, like ``RollupCube.category_totals``.
+
+    Read from the cached cube when there is one; otherwise a single groupby
+    over the category column is cheaper than building the cube (which also
+    has to parse every date).
+    """
+    cube = cached_rollup(df)
+    if cube is not None:
+        return cube.category_totals()
+    sums = sum_amounts(df, df["category"])
+    sums.index = pd.Index([str(category) for category in sums.index], dtype=object, name="category")
+    return sums.rename("amount").sort_index()
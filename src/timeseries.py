@@ -0,0 +1,142 @@
+"""Resample-based time series over a transaction frame.
+
+The engine groups the raw rows once into a dense daily table (one column per
+category). Every granularity, rolling window and period-over-period view is
+then derived from that table, and each view is cached per window spec, so
+switching between them never regroups the transactions.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pandas as pd
+
+from .analysis import AnalysisError
+from .compact import has_amount, sum_amounts
+from .derived import derived_column
+from .preprocessing import parse_dates
+
+# Friendly granularities; anything else is passed to pandas as an offset alias.
+GRANULARITIES = {"D": "D", "W": "W-SUN", "M": "MS"}
+_AGGREGATIONS = {"sum", "mean", "min", "max"}
+
+
+def _day(df: pd.DataFrame) -> pd.Series:
+    return derived_column(
+        df, "day", ("date",), lambda frame: parse_dates(frame["date"]).dt.normalize()
+    )
+
+
+class TimeSeriesEngine:
+    """
+    Daily, weekly, monthly and rolling totals from one pass over the rows.
+
+    Args:
+        df (pd.DataFrame): DataFrame with at least ["date", "amount"];
+            a "category" column enables the per-category views.
+
+    Results use a DatetimeIndex named "date" and a "total_amount" column,
+    or one column per category when ``by_category=True``.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        if df is None or df.empty:
+            raise AnalysisError("Input DataFrame is empty or None.")
+        if "date" not in df.columns or not has_amount(df):
+            raise AnalysisError("Missing required columns: date or amount")
+
+        self.has_category = "category" in df.columns
+        if self.has_category:
+            sums = sum_amounts(df, [_day(df), df["category"]])
+            daily = sums.unstack(fill_value=0)
+            daily.columns = daily.columns.astype(str)
+        else:
+            daily = sum_amounts(df, _day(df)).to_frame("total_amount")
+        if daily.empty:
+            raise AnalysisError("No valid dates to build a time series from.")
+
+        # Dense, date-sorted daily index: every later view is a resample of it.
+        daily = daily.sort_index().asfreq("D", fill_value=0).astype("float64")
+        daily.index.name = "date"
+        daily.columns.name = None
+        self._daily = daily
+        self._cache: dict[tuple[Any, ...], pd.DataFrame] = {}
+
+    def _cached(self, key: tuple[Any, ...], build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        result = self._cache.get(key)
+        if result is None:
+            result = self._cache[key] = build()
+        return result.copy()
+
+    def _base(self, by_category: bool) -> pd.DataFrame:
+        if by_category:
+            if not self.has_category:
+                raise AnalysisError("Missing required column: category")
+            return self._daily
+        if self.has_category:
+            return self._daily.sum(axis=1).to_frame("total_amount")
+        return self._daily
+
+    def clear_cache(self) -> None:
+        """Drop every cached view (the daily base table is kept)."""
+        self._cache.clear()
+
+    def totals(self, freq: str = "D", *, by_category: bool = False) -> pd.DataFrame:
+        """Totals per ``freq`` bucket ("D", "W", "M" or any pandas offset alias)."""
+        rule = GRANULARITIES.get(freq, freq)
+
+        def build() -> pd.DataFrame:
+            base = self._base(by_category)
+            return base if rule == "D" else base.resample(rule).sum()
+
+        return self._cached(("totals", rule, by_category), build)
+
+    def rolling(
+        self,
+        window: int | str,
+        *,
+        freq: str = "D",
+        agg: str = "sum",
+        by_category: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Rolling ``agg`` over ``window`` buckets of the ``freq`` totals.
+
+        ``window`` is a number of buckets (e.g. 3 months with freq="M") or,
+        for daily totals, a time span such as "30D".
+        """
+        if agg not in _AGGREGATIONS:
+            raise AnalysisError(f"Unsupported rolling aggregation: {agg}")
+        rule = GRANULARITIES.get(freq, freq)
+
+        def build() -> pd.DataFrame:
+            buckets = self.totals(freq, by_category=by_category)
+            return getattr(buckets.rolling(window, min_periods=1), agg)()
+
+        return self._cached(("rolling", window, rule, agg, by_category), build)
+
+    def period_over_period(self, freq: str = "M", *, by_category: bool = False) -> pd.DataFrame:
+        """
+        Change of each ``freq`` total against the previous bucket.
+
+        Without ``by_category`` the result has total_amount, change and
+        pct_change columns; with it, one change column per category.
+        """
+        rule = GRANULARITIES.get(freq, freq)
+
+        def build() -> pd.DataFrame:
+            buckets = self.totals(freq, by_category=by_category)
+            if by_category:
+                return buckets.diff()
+            previous = buckets["total_amount"].shift()
+            return buckets.assign(
+                change=buckets["total_amount"] - previous,
+                pct_change=(buckets["total_amount"] - previous) / previous.abs(),
+            )
+
+        return self._cached(("pop", rule, by_category), build)
+
+    def month_over_month(self, *, by_category: bool = False) -> pd.DataFrame:
+        """period_over_period() with monthly buckets."""
+        return self.period_over_period("M", by_category=by_category)
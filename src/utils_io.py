@@ -2,21 +2,159 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
 import pandas as pd
 
+from .categorize import categorize_transactions
+from .dedup import deduplicate
+from .preprocessing import load_csv
+from .utils_logging import log_error, log_info
+
+try:
+    # Columnar formats (Parquet/Feather) are handled by pyarrow.
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+COLUMNAR_SUFFIXES = {".feather", ".parquet"}
+SOURCE_COLUMN = "source_file"
+
+
+@dataclass
+class IngestResult:
+    """Outcome of a batch ingestion: the combined frame plus per-file failures."""
+
+    frame: pd.DataFrame
+    failures: dict[str, str] = field(default_factory=dict)
+    files_loaded: int = 0
+    duplicates_removed: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+def _require_pyarrow(path: Path) -> None:
+    if not _PYARROW_AVAILABLE:
+        raise ImportError(
+            f"Reading or writing {path.suffix} files requires the 'pyarrow' package. "
+            "Install it via 'pip install pyarrow'."
+        )
+
+
+def read_dataframe(path: Path) -> pd.DataFrame:
+    """Read a CSV, Parquet or Feather file.
+
+    Columnar files are memory-mapped, and columns whose dtype allows it
+    (numbers, dates without NaT, strings) become zero-copy, read-only views
+    of the table; ``copy()`` the frame before editing values in place.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in COLUMNAR_SUFFIXES:
+        return pd.read_csv(path)
+
+    _require_pyarrow(path)
+    if suffix == ".feather":
+        table = feather.read_table(path, memory_map=True)
+    else:
+        table = parquet.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
 
 def load_csv_files(paths: Iterable[Path]) -> list[pd.DataFrame]:
-    """Load multiple CSV files into a list of data frames."""
+    """Load multiple CSV (or Parquet/Feather) files into a list of data frames."""
     dataframes: list[pd.DataFrame] = []
     for path in paths:
-        dataframes.append(pd.read_csv(path))
+        dataframes.append(read_dataframe(path))
     return dataframes
 
 
 def export_dataframe(df: pd.DataFrame, path: Path) -> None:
-    """Persist a data frame to disk using UTF-8 encoding."""
+    """Persist a data frame to disk.
+
+    The format follows the file suffix: ``.parquet`` and ``.feather`` keep
+    column types in a columnar binary file (Feather uncompressed, so
+    ``read_dataframe`` can memory-map it), anything else is written as
+    UTF-8 CSV.
+    """
+    path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False)
+    suffix = path.suffix.lower()
+    if suffix not in COLUMNAR_SUFFIXES:
+        df.to_csv(path, index=False)
+        return
+
+    _require_pyarrow(path)
+    if suffix == ".feather":
+        df.reset_index(drop=True).to_feather(path, compression="uncompressed")
+    else:
+        df.to_parquet(path, index=False)
+
+
+def _ingest_file(path: str) -> pd.DataFrame:
+    df = categorize_transactions(load_csv(path))
+    df[SOURCE_COLUMN] = path
+    return df
+
+
+def ingest_csv_files(
+    paths: Iterable[Path],
+    *,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    drop_duplicates: bool = False,
+    window_days: int | None = None,
+) -> IngestResult:
+    """Load, clean and categorize many CSV files in parallel.
+
+    Args:
+        paths: CSV files to ingest.
+        max_workers: Pool size; ``None`` lets the executor pick a default.
+        use_processes: Use a process pool instead of a thread pool.
+        drop_duplicates: Drop rows that overlapping exports repeat across
+            files (see dedup.deduplicate); repeats within one file are kept.
+            Only for exports of the same account: statements of different
+            accounts legitimately share rent, subscriptions and fares.
+        window_days: Near-duplicate window passed to deduplicate().
+
+    Returns:
+        An IngestResult whose frame concatenates every file that loaded (in
+        input order) with a "source_file" column, and whose ``failures`` map
+        each file that could not be loaded to its error message.
+    """
+    sources = [str(path) for path in paths]
+    pool: type[Executor] = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    frames: list[pd.DataFrame] = []
+    failures: dict[str, str] = {}
+
+    log_info(f"Ingesting {len(sources)} CSV files")
+    with pool(max_workers=max_workers) as executor:
+        futures = [executor.submit(_ingest_file, source) for source in sources]
+        for source, future in zip(sources, futures):
+            try:
+                frames.append(future.result())
+            except Exception as exc:
+                log_error(f"Skipping {source}: {exc}")
+                failures[source] = str(exc)
+
+    duplicates = 0
+    if frames:
+        frame = pd.concat(frames, ignore_index=True)
+        if drop_duplicates and len(frames) > 1:
+            deduped = deduplicate(frame, window_days=window_days, source_column=SOURCE_COLUMN)
+            frame = deduped.frame.reset_index(drop=True)
+            duplicates = deduped.removed
+    else:
+        frame = pd.DataFrame(columns=["date", "description", "amount", "category", SOURCE_COLUMN])
+    log_info(f"Ingested {len(frame)} rows from {len(frames)} files ({len(failures)} failed)")
+    return IngestResult(
+        frame=frame, failures=failures, files_loaded=len(frames), duplicates_removed=duplicates
+    )
@@ -1,41 +1,204 @@
-"""Lightweight logging helpers for the Finance Expense Analyzer."""
+"""Lightweight logging helpers for the Finance Expense Analyzer.
+
+Records go to ``<log_dir>/app.log`` and to stderr. By default the calling
+thread only puts each record on a queue; a background listener thread does
+the file and console I/O, so logging never blocks a request on disk writes.
+Call ``shutdown_logging()`` (also registered with ``atexit``) to flush it.
+
+Settings come from ``DEFAULT_CONFIG`` and can be overridden with
+``configure_logging()``:
+
+- ``log_dir``: directory of ``app.log``; created on the first log call.
+- ``log_queue``: write through the background listener (True) or inline.
+- ``log_json``: one JSON object per line instead of plain text.
+- ``log_sample_every``: keep 1 in N records of messages logged with
+  ``hot=True`` (counted per call site).
+"""
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import threading
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-_LOG_DIR = Path("logs")
-_LOG_DIR.mkdir(parents=True, exist_ok=True)
-_LOG_FILE = _LOG_DIR / "app.log"
+from .config import DEFAULT_CONFIG
+
+LOGGER_NAME = "finance_analyzer"
+_LOG_FILE_NAME = "app.log"
+_TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(message)s"
 
+_LOGGER = logging.getLogger(LOGGER_NAME)
+_LOCK = threading.RLock()
 _CONFIGURED = False
+_LISTENER: logging.handlers.QueueListener | None = None
+_HANDLERS: list[logging.Handler] = []
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        sampled = getattr(record, "sampled", None)
+        if sampled:
+            payload["sampled"] = sampled
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep 1 in ``every`` records marked ``hot``, counted per call site.
+
+    The kept record carries ``sampled=N`` (records it stands for).
+    """
+
+    def __init__(self, every: int) -> None:
+        super().__init__()
+        self.every = max(int(every), 1)
+        self._seen: Counter[tuple[str, int]] = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "hot", False) or self.every == 1:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            seen = self._seen[key]
+            self._seen[key] = seen + 1
+        if seen % self.every:
+            return False
+        record.sampled = self.every
+        return True
+
+
+def _setting(overrides: dict[str, Any], key: str) -> Any:
+    value = overrides.get(key)
+    return DEFAULT_CONFIG[key] if value is None else value
+
+
+def configure_logging(
+    *,
+    log_dir: str | Path | None = None,
+    use_queue: bool | None = None,
+    json_format: bool | None = None,
+    sample_every: int | None = None,
+    level: int = logging.INFO,
+) -> None:
+    """(Re)configure the shared logger; unset arguments fall back to DEFAULT_CONFIG."""
+    global _CONFIGURED, _LISTENER
+    overrides = {
+        "log_dir": log_dir,
+        "log_queue": use_queue,
+        "log_json": json_format,
+        "log_sample_every": sample_every,
+    }
+    with _LOCK:
+        _shutdown()
+
+        directory = Path(_setting(overrides, "log_dir"))
+        directory.mkdir(parents=True, exist_ok=True)
+        formatter = JsonFormatter() if _setting(overrides, "log_json") else logging.Formatter(_TEXT_FORMAT)
+        outputs: list[logging.Handler] = [
+            logging.FileHandler(directory / _LOG_FILE_NAME, mode="a", encoding="utf-8"),
+            logging.StreamHandler(),
+        ]
+        for handler in outputs:
+            handler.setFormatter(formatter)
+
+        if _setting(overrides, "log_queue"):
+            records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            _LISTENER = logging.handlers.QueueListener(records, *outputs, respect_handler_level=True)
+            _LISTENER.start()
+            _HANDLERS[:] = [logging.handlers.QueueHandler(records)]
+        else:
+            _HANDLERS[:] = outputs
+
+        _LOGGER.setLevel(level)
+        _LOGGER.propagate = False
+        # Sample on the calling thread so dropped records never reach the queue.
+        _LOGGER.filters.clear()
+        _LOGGER.addFilter(SamplingFilter(_setting(overrides, "log_sample_every")))
+        for handler in _HANDLERS:
+            _LOGGER.addHandler(handler)
+        _CONFIGURED = True
+
+    if multiprocessing.parent_process() is not None:
+        # Pool workers leave through os._exit, which skips atexit handlers.
+        multiprocessing.util.Finalize(None, shutdown_logging, exitpriority=10)
+
+
+def _shutdown() -> None:
+    global _CONFIGURED, _LISTENER
+    if _LISTENER is not None:
+        # stop() drains every queued record before returning.
+        _LISTENER.stop()
+        for handler in _LISTENER.handlers:
+            handler.close()
+        _LISTENER = None
+    for handler in _HANDLERS:
+        _LOGGER.removeHandler(handler)
+        handler.close()
+    _HANDLERS.clear()
+    _CONFIGURED = False
+
+
+def shutdown_logging() -> None:
+    """Flush pending records and close the log file; the next log call reconfigures."""
+    with _LOCK:
+        _shutdown()
+
+
+def _forget_after_fork() -> None:
+    # The listener thread does not survive fork(); the child configures afresh.
+    global _CONFIGURED, _LISTENER, _LOCK
+    _LOCK = threading.RLock()
+    for handler in _HANDLERS:
+        _LOGGER.removeHandler(handler)
+    _HANDLERS.clear()
+    _LISTENER = None
+    _CONFIGURED = False
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
 
 
 def _configure_logging() -> None:
-    global _CONFIGURED
     if _CONFIGURED:
         return
+    with _LOCK:
+        if not _CONFIGURED:
+            configure_logging()
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)s | %(message)s",
-        handlers=[
-            logging.FileHandler(_LOG_FILE, mode="a", encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
-    )
-    _CONFIGURED = True
 
+def log_info(message: Any, *, hot: bool = False) -> None:
+    """Log an informational message to the shared log file.
 
-def log_info(message: Any) -> None:
-    """Log an informational message to the shared log file."""
+    ``hot`` marks high-frequency messages that are sampled (see module docs).
+    """
     _configure_logging()
-    logging.info(message)
+    _LOGGER.info(message, extra={"hot": hot}, stacklevel=2)
 
 
 def log_error(message: Any) -> None:
     """Log an error message to the shared log file."""
     _configure_logging()
-    logging.error(message)
+    _LOGGER.error(message, stacklevel=2)
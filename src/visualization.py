@@ -2,42 +2,97 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Union
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objs as go
-from plotly.io import write_image
 
-try:
-    # Attempting to render static images requires the kaleido engine.
-    import kaleido  # noqa: F401
+from .analysis import AnalysisError
+from .compact import AMOUNT_CENTS
+from .config import DEFAULT_CONFIG
+from .downsample import downsample
+from .instrumentation import instrument
+from .preprocessing import parse_dates
+from .rollup import category_sums, rollup
+from .timeseries import TimeSeriesEngine
+from .utils_logging import log_info
 
-    _KALEIDO_AVAILABLE = True
-except ImportError:
-    _KALEIDO_AVAILABLE = False
+if TYPE_CHECKING:
+    import plotly.graph_objs as go
 
-if _KALEIDO_AVAILABLE:
-    try:
-        _test_fig = px.scatter(x=[0], y=[0])
-        _test_path = RESULTS_DIR / "__kaleido_probe__.png"
-        write_image(_test_fig, _test_path)
-        _test_path.unlink(missing_ok=True)
-    except Exception:
-        _KALEIDO_AVAILABLE = False
+    ImageReturn = Union[go.Figure, Path]
+
+# Plotly and kaleido are imported on first use so that importing this module
+# (and everything that imports it) stays cheap for workers that never plot.
 
 class VisualizationError(Exception):
     """Raised when visualization cannot be generated."""
 
 RESULTS_DIR = Path("results")
-RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+RENDER_MANIFEST = ".render-manifest.json"
+
+CATEGORY_IMAGE_SIZE = {"width": 800, "height": 600, "scale": 2}
+MONTHLY_IMAGE_SIZE = {"width": 900, "height": 600, "scale": 2}
+TIMELINE_IMAGE_SIZE = {"width": 1200, "height": 500, "scale": 2}
+
+
+def _plotly_express() -> Any:
+    import plotly.express as px
+
+    return px
+
+
+@functools.lru_cache(maxsize=None)
+def _kaleido_available() -> bool:
+    """Whether static export works; probed once, on first use."""
+    try:
+        # Attempting to render static images requires the kaleido engine.
+        import kaleido  # noqa: F401
+        from plotly.io import write_image
+    except ImportError:
+        return False
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            probe = _plotly_express().scatter(x=[0], y=[0])
+            write_image(probe, Path(directory) / "__kaleido_probe__.png")
+    except Exception:
+        return False
+    return True
+
+
+def __getattr__(name: str) -> Any:
+    # Kept as a module attribute for callers that check it up front.
+    if name == "_KALEIDO_AVAILABLE":
+        return _kaleido_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _write_figure(fig: Any, filename: str, **options: Any) -> Path:
+    if not _kaleido_available():
+        raise VisualizationError(
+            "Static image export requires the 'kaleido' package. Install it via 'pip install kaleido'."
+        )
+    from plotly.io import write_image
 
-ImageReturn = Union[go.Figure, Path]
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / filename
+    write_image(fig, output, **options)
+    return output
 
 
 def _validate_columns(df: pd.DataFrame, required: set[str]) -> None:
-    missing = required.difference(df.columns)
+    columns = set(df.columns)
+    if AMOUNT_CENTS in columns:
+        columns.add("amount")
+    missing = required.difference(columns)
     if missing:
         raise VisualizationError(f"Missing required columns: {missing}")
 
@@ -47,7 +102,7 @@ def _category_totals(df: pd.DataFrame) -> pd.DataFrame:
         raise VisualizationError("Input DataFrame is empty or None.")
     _validate_columns(df, {"category", "amount"})
 
-    totals = df.groupby("category")["amount"].sum().abs()
+    totals = category_sums(df).abs()
     totals = totals[totals > 0]
     if totals.empty:
         raise VisualizationError("No expense values available for category plot.")
@@ -60,9 +115,7 @@ def _monthly_totals(df: pd.DataFrame) -> pd.DataFrame:
         raise VisualizationError("Input DataFrame is empty or None.")
     _validate_columns(df, {"date", "amount"})
 
-    data = df.copy()
-    data["month"] = pd.to_datetime(data["date"]).dt.to_period("M").astype(str)
-    totals = data.groupby("month")["amount"].sum().abs()
+    totals = rollup(df).monthly_totals().abs()
     totals = totals[totals > 0]
     if totals.empty:
         raise VisualizationError("No expense values available for monthly trend plot.")
@@ -70,13 +123,8 @@ def _monthly_totals(df: pd.DataFrame) -> pd.DataFrame:
     return totals.reset_index().rename(columns={"amount": "total"})
 
 
-def plot_expenses_by_category(
-    df: pd.DataFrame,
-    *,
-    filename: str = "expenses_by_category.png",
-    to_file: bool = False,
-) -> ImageReturn:
-    data = _category_totals(df)
+def _category_figure(data: pd.DataFrame) -> go.Figure:
+    px = _plotly_express()
     fig = px.pie(
         data,
         names="category",
@@ -85,44 +133,303 @@ def plot_expenses_by_category(
         color_discrete_sequence=px.colors.qualitative.Set2,
     )
     fig.update_traces(textinfo="percent+label")
+    return fig
+
+
+def _monthly_figure(data: pd.DataFrame) -> go.Figure:
+    fig = _plotly_express().bar(
+        data,
+        x="month",
+        y="total",
+        title="Monthly Expense Trend",
+        labels={"month": "Month", "total": "Amount (€)"},
+        color="total",
+        color_continuous_scale="Blues",
+    )
+    fig.update_layout(coloraxis_showscale=False)
+    return fig
+
+
+@instrument()
+def plot_expenses_by_category(
+    df: pd.DataFrame,
+    *,
+    filename: str = "expenses_by_category.png",
+    to_file: bool = False,
+) -> ImageReturn:
+    fig = _category_figure(_category_totals(df))
 
     if to_file:
-        if not _KALEIDO_AVAILABLE:
-            raise VisualizationError(
-                "Static image export requires the 'kaleido' package. Install it via 'pip install kaleido'."
-            )
-        output = RESULTS_DIR / filename
-        write_image(fig, output, width=800, height=600, scale=2)
-        return output
+        return _write_figure(fig, filename, **CATEGORY_IMAGE_SIZE)
 
     return fig
 
 
+@instrument()
 def plot_monthly_trend(
     df: pd.DataFrame,
     *,
     filename: str = "monthly_trend.png",
     to_file: bool = False,
 ) -> ImageReturn:
-    data = _monthly_totals(df)
-    fig = px.bar(
+    fig = _monthly_figure(_monthly_totals(df))
+
+    if to_file:
+        return _write_figure(fig, filename, **MONTHLY_IMAGE_SIZE)
+
+    return fig
+
+
+# ----------------------------
+# LARGE SERIES
+# ----------------------------
+# Daily and per-transaction charts grow with the data, so they are reduced to
+# at most ``max_points`` points (DEFAULT_CONFIG["chart_max_points"]) before a
+# figure is built; the browser never receives more than that.
+
+
+def _reduce(data: pd.DataFrame, x: str, y: str, max_points: int | None, method: str) -> pd.DataFrame:
+    points = int(DEFAULT_CONFIG["chart_max_points"] if max_points is None else max_points)
+    try:
+        keep = downsample(data[x].to_numpy("int64"), data[y].to_numpy("float64"), points, method)
+    except ValueError as exc:
+        raise VisualizationError(str(exc)) from exc
+    return data.iloc[keep]
+
+
+def _timeline_title(title: str, shown: int, total: int, unit: str) -> str:
+    if shown == total:
+        return title
+    return f"{title} ({shown:,} of {total:,} {unit} shown)"
+
+
+def _daily_totals(df: pd.DataFrame) -> pd.DataFrame:
+    if df is None or df.empty:
+        raise VisualizationError("Input DataFrame is empty or None.")
+    _validate_columns(df, {"date", "amount"})
+
+    try:
+        daily = TimeSeriesEngine(df).totals("D")["total_amount"].abs()
+    except AnalysisError as exc:
+        raise VisualizationError(str(exc)) from exc
+    return daily.rename("total").reset_index()
+
+
+def _transaction_points(df: pd.DataFrame) -> pd.DataFrame:
+    if df is None or df.empty:
+        raise VisualizationError("Input DataFrame is empty or None.")
+    _validate_columns(df, {"date", "amount"})
+
+    amounts = df[AMOUNT_CENTS] / 100 if AMOUNT_CENTS in df.columns else df["amount"]
+    points = pd.DataFrame({"date": parse_dates(df["date"]), "amount": amounts.astype("float64")})
+    if "category" in df.columns:
+        points["category"] = df["category"].astype(str)
+    points = points.dropna(subset=["date", "amount"])
+    if points.empty:
+        raise VisualizationError("No dated transactions available for the transaction plot.")
+    if not points["date"].is_monotonic_increasing:
+        points = points.iloc[np.argsort(points["date"].to_numpy(), kind="stable")]
+    return points
+
+
+@instrument()
+def plot_daily_trend(
+    df: pd.DataFrame,
+    *,
+    max_points: int | None = None,
+    method: str = "lttb",
+    filename: str = "daily_trend.png",
+    to_file: bool = False,
+) -> ImageReturn:
+    """Line of daily totals, downsampled to ``max_points`` ("lttb" or "minmax")."""
+    daily = _daily_totals(df)
+    data = _reduce(daily, "date", "total", max_points, method)
+    fig = _plotly_express().line(
         data,
-        x="month",
+        x="date",
         y="total",
-        title="Monthly Expense Trend",
-        labels={"month": "Month", "total": "Amount (€)"},
-        color="total",
-        color_continuous_scale="Blues",
+        title=_timeline_title("Daily Expense Trend", len(data), len(daily), "days"),
+        labels={"date": "Day", "total": "Amount (€)"},
     )
-    fig.update_layout(coloraxis_showscale=False)
 
     if to_file:
-        if not _KALEIDO_AVAILABLE:
+        return _write_figure(fig, filename, **TIMELINE_IMAGE_SIZE)
+
+    return fig
+
+
+@instrument()
+def plot_transactions(
+    df: pd.DataFrame,
+    *,
+    max_points: int | None = None,
+    method: str = "minmax",
+    filename: str = "transactions.png",
+    to_file: bool = False,
+) -> ImageReturn:
+    """Scatter of individual transactions over time, downsampled to ``max_points``.
+
+    The default "minmax" method keeps the largest and smallest amount of every
+    time bucket, so unusual transactions stay visible.
+    """
+    points = _transaction_points(df)
+    data = _reduce(points, "date", "amount", max_points, method)
+    fig = _plotly_express().scatter(
+        data,
+        x="date",
+        y="amount",
+        color="category" if "category" in data.columns else None,
+        title=_timeline_title("Transactions", len(data), len(points), "transactions"),
+        labels={"date": "Date", "amount": "Amount (€)"},
+        render_mode="webgl",
+    )
+
+    if to_file:
+        return _write_figure(fig, filename, **TIMELINE_IMAGE_SIZE)
+
+    return fig
+
+
+# ----------------------------
+# BATCH RENDERING
+# ----------------------------
+
+
+@dataclass
+class ChartJob:
+    """One static image to render.
+
+    ``build`` is only called when the image is stale, i.e. when ``data``
+    (what the chart is drawn from) hashes differently than at the last render
+    or the file is missing.
+    """
+
+    filename: str
+    build: Callable[[], go.Figure]
+    data: pd.DataFrame
+    width: int = 800
+    height: int = 600
+    scale: float = 2
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(pd.util.hash_pandas_object(self.data, index=True).to_numpy().tobytes())
+        digest.update(json.dumps([list(map(str, self.data.columns)), self.width, self.height, self.scale]).encode())
+        return digest.hexdigest()
+
+
+@dataclass
+class RenderReport:
+    """What a render_charts() call wrote and skipped."""
+
+    rendered: list[Path] = field(default_factory=list)
+    skipped: list[Path] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        return len(self.rendered) / self.seconds if self.seconds > 0 else 0.0
+
+
+def category_chart_job(df: pd.DataFrame, filename: str) -> ChartJob:
+    """ChartJob for plot_expenses_by_category(df)."""
+    data = _category_totals(df)
+    return ChartJob(filename, functools.partial(_category_figure, data), data, **CATEGORY_IMAGE_SIZE)
+
+
+def monthly_chart_job(df: pd.DataFrame, filename: str) -> ChartJob:
+    """ChartJob for plot_monthly_trend(df)."""
+    data = _monthly_totals(df)
+    return ChartJob(filename, functools.partial(_monthly_figure, data), data, **MONTHLY_IMAGE_SIZE)
+
+
+def _read_manifest(path: Path) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_images(figures: list[Any], paths: list[Path], jobs: list[ChartJob]) -> None:
+    import plotly.io as pio
+
+    options = {
+        "width": [job.width for job in jobs],
+        "height": [job.height for job in jobs],
+        "scale": [job.scale for job in jobs],
+    }
+    if hasattr(pio, "write_images"):
+        # One kaleido browser session for the whole batch.
+        pio.write_images(figures, paths, **options)
+        return
+    for index, (figure, path) in enumerate(zip(figures, paths)):
+        pio.write_image(figure, path, **{key: values[index] for key, values in options.items()})
+
+
+@instrument()
+def render_charts(
+    jobs: Iterable[ChartJob],
+    output_dir: Path | None = None,
+    *,
+    force: bool = False,
+) -> RenderReport:
+    """
+    Render many charts to static images in one export session.
+
+    Images whose input data is unchanged since the last render (tracked in
+    a manifest file in ``output_dir``) are skipped unless ``force`` is set.
+
+    Returns:
+        RenderReport with the written and skipped paths and images/second.
+    """
+    output_dir = Path(RESULTS_DIR if output_dir is None else output_dir)
+    manifest_path = output_dir / RENDER_MANIFEST
+    manifest = {} if force else _read_manifest(manifest_path)
+    report = RenderReport()
+
+    stale: list[tuple[ChartJob, Path, str]] = []
+    for job in jobs:
+        path = output_dir / job.filename
+        fingerprint = job.fingerprint()
+        if manifest.get(job.filename) == fingerprint and path.exists():
+            report.skipped.append(path)
+        else:
+            stale.append((job, path, fingerprint))
+
+    if stale:
+        if not _kaleido_available():
             raise VisualizationError(
                 "Static image export requires the 'kaleido' package. Install it via 'pip install kaleido'."
             )
-        output = RESULTS_DIR / filename
-        write_image(fig, output, width=900, height=600, scale=2)
-        return output
+        output_dir.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        _write_images(
+            [job.build() for job, _, _ in stale],
+            [path for _, path, _ in stale],
+            [job for job, _, _ in stale],
+        )
+        report.seconds = time.perf_counter() - start
+        report.rendered = [path for _, path, _ in stale]
+        manifest.update({job.filename: fingerprint for job, _, fingerprint in stale})
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
 
-    return fig
+    log_info(
+        f"Rendered {len(report.rendered)} charts ({report.images_per_second:.1f} images/s), "
+        f"skipped {len(report.skipped)} unchanged"
+    )
+    return report
+
+
+@instrument()
+def render_dataset_charts(
+    datasets: Mapping[str, pd.DataFrame],
+    output_dir: Path | None = None,
+    *,
+    force: bool = False,
+) -> RenderReport:
+    """Render the category and monthly charts of every dataset as "<name>-category.png" and "<name>-monthly.png"."""
+    jobs: list[ChartJob] = []
+    for name, df in datasets.items():
+        jobs.append(category_chart_job(df, f"{name}-category.png"))
+        jobs.append(monthly_chart_job(df, f"{name}-monthly.png"))
+    return render_charts(jobs, output_dir, force=force)
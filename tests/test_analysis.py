@@ -1,6 +1,12 @@
 import pandas as pd
 import pytest
-from src.analysis import monthly_totals, category_totals, net_balance, AnalysisError
+from src.analysis import (
+    AnalysisError,
+    TotalsAccumulator,
+    category_totals,
+    monthly_totals,
+    net_balance,
+)
 
 def sample_df():
     return pd.DataFrame({
@@ -33,4 +39,23 @@ def test_net_balance():
 def test_empty_dataframe():
     df = pd.DataFrame()
     with pytest.raises(AnalysisError):
-        monthly_totals(df)
\ No newline at end of file
+        monthly_totals(df)
+
+def test_accumulator_matches_one_shot_functions():
+    df = sample_df()
+    chunked = TotalsAccumulator().update(df.iloc[:1]).update(df.iloc[1:])
+    pd.testing.assert_frame_equal(chunked.monthly_totals(), monthly_totals(df.copy()))
+    pd.testing.assert_frame_equal(chunked.category_totals(), category_totals(df))
+    assert chunked.net_balance() == net_balance(df)
+
+def test_accumulator_merge_partitions():
+    df = sample_df()
+    left = TotalsAccumulator().update(df.iloc[:2])
+    right = TotalsAccumulator().update(df.iloc[2:])
+    merged = left.merge(right)
+    assert merged.rows == 3
+    pd.testing.assert_frame_equal(merged.category_totals(), category_totals(df))
+
+def test_accumulator_without_rows_raises():
+    with pytest.raises(AnalysisError):
+        TotalsAccumulator().net_balance()
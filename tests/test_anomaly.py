@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.anomaly import AnomalyError, AnomalyStats, score_anomalies
+from src.compact import compact_frame
+
+
+def sample_df():
+    return pd.DataFrame({
+        "date": pd.date_range("2025-01-01", periods=12).strftime("%Y-%m-%d"),
+        "amount": [-50, -52, -48, -51, -49, -400, -800, -800, -800, -800, -20, 1000],
+        "category": ["Groceries"] * 6 + ["Housing"] * 4 + ["Transport", "Income"],
+    })
+
+
+def test_robust_scores_flag_outliers_per_category():
+    df = score_anomalies(sample_df())
+    assert df.loc[df["is_anomaly"]].index.tolist() == [5]
+    assert df.loc[5, "anomaly_score"] > 100
+    # Constant categories and single rows score 0.
+    assert df.loc[6:, "anomaly_score"].eq(0).all()
+
+
+def test_scores_match_for_compact_frames():
+    plain = score_anomalies(sample_df())
+    compact = score_anomalies(compact_frame(sample_df()))
+    np.testing.assert_allclose(plain["anomaly_score"], compact["anomaly_score"])
+
+
+def test_streamed_moments_match_full_history():
+    history = sample_df().iloc[:10]
+    full = AnomalyStats().update(history)
+    chunked = AnomalyStats().update(history.iloc[:4]).merge(AnomalyStats().update(history.iloc[4:]))
+    pd.testing.assert_frame_equal(chunked.moments, full.moments)
+
+    groceries = history.loc[history["category"] == "Groceries", "amount"]
+    assert chunked.std()["Groceries"] == pytest.approx(groceries.std())
+
+    new_month = pd.DataFrame({"amount": [-51, -2000, -5], "category": ["Groceries", "Housing", "Unknown"]})
+    scored = chunked.score(new_month, threshold=1)
+    assert scored["is_anomaly"].tolist() == [False, True, False]
+    assert scored.loc[2, "anomaly_score"] == 0
+
+
+def test_anomaly_validation():
+    with pytest.raises(AnomalyError):
+        score_anomalies(pd.DataFrame())
+    with pytest.raises(AnomalyError):
+        AnomalyStats().score(sample_df())
@@ -1,6 +1,12 @@
 import pandas as pd
 import pytest
-from src.budget import check_budget, BudgetError
+from src.budget import (
+    BudgetError,
+    check_budget,
+    evaluate_budget,
+    evaluate_budgets_batch,
+    iter_budget_alerts,
+)
 
 def sample_df():
     return pd.DataFrame({
@@ -28,4 +34,56 @@ def test_empty_dataframe():
 def test_empty_budget_dict():
     df = sample_df()
     with pytest.raises(BudgetError):
-        check_budget(df, {})
\ No newline at end of file
+        check_budget(df, {})
+
+
+def test_evaluate_budget_structured_result():
+    df = sample_df()
+    result = evaluate_budget(df, {"Groceries": 300, "Transport": 100, "Travel": 0})
+    assert list(result.columns) == ["category", "spent", "budget", "remaining", "utilisation", "exceeded"]
+    rows = result.set_index("category")
+    assert rows.loc["Groceries", "spent"] == 350
+    assert rows.loc["Groceries", "remaining"] == -50
+    assert rows.loc["Transport", "utilisation"] == pytest.approx(0.8)
+    assert rows["exceeded"].tolist() == [True, False, False]
+    assert rows.loc["Travel", "utilisation"] == 0
+
+def test_evaluate_budget_accepts_budget_table():
+    df = sample_df()
+    table = pd.DataFrame({"category": ["Housing", "Groceries"], "budget": [400, 500]})
+    result = evaluate_budget(df, table)
+    assert result["exceeded"].tolist() == [True, False]
+    with pytest.raises(BudgetError):
+        evaluate_budget(df, table.assign(budget=["abc", 1]))
+
+def test_batch_budgets_per_user_and_period():
+    transactions = pd.DataFrame({
+        "user_id": ["ann", "ann", "ann", "bob"],
+        "date": pd.to_datetime(["2025-01-03", "2025-01-20", "2025-02-01", "2025-01-05"]),
+        "category": ["Groceries", "Groceries", "Groceries", "Transport"],
+        "amount": [-200, -150, -50, -80],
+    })
+    budgets = pd.DataFrame({
+        "user_id": ["ann", "bob", "bob"],
+        "category": ["Groceries", "Transport", "Housing"],
+        "budget": [300, 50, 900],
+    })
+    result = evaluate_budgets_batch(transactions, budgets)
+    rows = result.set_index(["user_id", "period", "category"])
+    assert rows.loc[("ann", "2025-01", "Groceries"), "spent"] == 350
+    assert rows.loc[("ann", "2025-02", "Groceries"), "exceeded"] == False  # noqa: E712
+    assert rows.loc[("bob", "2025-01", "Housing"), "spent"] == 0
+
+    alerts = list(iter_budget_alerts(transactions, budgets))
+    assert [(a["user_id"], a["period"], a["category"]) for a in alerts] == [
+        ("ann", "2025-01", "Groceries"),
+        ("bob", "2025-01", "Transport"),
+    ]
+    assert "exceeded budget" in alerts[0]["message"]
+
+def test_batch_budgets_reuse_validation():
+    transactions = pd.DataFrame({"user_id": ["ann"], "period": ["2025-01"], "category": ["Groceries"], "amount": [-1]})
+    with pytest.raises(BudgetError):
+        evaluate_budgets_batch(transactions, pd.DataFrame({"user_id": ["ann"], "category": ["Groceries"], "budget": [-5]}))
+    with pytest.raises(BudgetError):
+        evaluate_budgets_batch(transactions.drop(columns="user_id"), pd.DataFrame({"user_id": ["ann"], "category": ["Groceries"], "budget": [5]}))
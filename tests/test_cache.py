@@ -0,0 +1,64 @@
+import time
+
+import pandas as pd
+import pytest
+
+from src.cache import FrameCache, content_hash, load_transactions, transactions_key
+from src.config import DEFAULT_CONFIG
+
+pytest.importorskip("pyarrow")
+
+
+def write_ledger(path, rows):
+    lines = ["date,description,amount"] + [f"2025-01-{day:02d},Supermarket {day},-{day}" for day in range(1, rows + 1)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_load_transactions_reuses_cached_frame(tmp_path, monkeypatch):
+    source = tmp_path / "ledger.csv"
+    write_ledger(source, 3)
+    cache = FrameCache(tmp_path / "cache")
+
+    first = load_transactions(source, cache=cache)
+    assert len(list(cache.directory.glob("*.feather"))) == 1
+
+    monkeypatch.setattr("src.cache.load_csv", lambda source: pytest.fail("cache was bypassed"))
+    second = load_transactions(source, cache=cache)
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+    assert pd.api.types.is_datetime64_any_dtype(second["date"])
+    assert second["category"].tolist() == ["Groceries"] * 3
+
+
+def test_date_format_changes_the_cache_key(tmp_path, monkeypatch):
+    source = tmp_path / "ledger.csv"
+    source.write_text("date,description,amount\n01/02/2025,Supermarket,-5\n")
+    cache = FrameCache(tmp_path / "cache")
+    key = transactions_key(content_hash(source))
+
+    monkeypatch.setitem(DEFAULT_CONFIG, "date_format", "%m/%d/%Y")
+    assert transactions_key(content_hash(source)) != key
+    assert load_transactions(source, cache=cache)["date"].dt.month.tolist() == [1]
+
+    monkeypatch.setitem(DEFAULT_CONFIG, "date_format", "%d/%m/%Y")
+    assert load_transactions(source, cache=cache)["date"].dt.month.tolist() == [2]
+
+
+def test_content_hash_matches_for_path_and_file_like(tmp_path):
+    source = tmp_path / "ledger.csv"
+    write_ledger(source, 2)
+    with open(source, "rb") as handle:
+        assert content_hash(handle) == content_hash(source)
+        assert handle.tell() == 0
+
+
+def test_cache_evicts_oldest_entries_first(tmp_path):
+    cache = FrameCache(tmp_path / "cache", max_bytes=10**9)
+    frame = pd.DataFrame({"amount": range(1000)})
+    first = cache.put("first", frame)
+    time.sleep(0.01)
+    cache.put("second", frame)
+
+    cache.max_bytes = first.stat().st_size
+    assert cache.evict() == 1
+    assert cache.get("first") is None
+    assert cache.get("second") is not None
@@ -1,6 +1,12 @@
 import pandas as pd
 import pytest
-from src.categorize import categorize_transactions, CategorizationError
+from src.categorize import (
+    CATEGORY_RULES,
+    CategorizationError,
+    categorize_transactions,
+    category_cache_info,
+    clear_category_cache,
+)
 
 def test_empty_dataframe():
     df = pd.DataFrame()
@@ -31,4 +37,67 @@ def test_uncategorized_goes_to_other():
         "amount": [10]
     })
     df = categorize_transactions(df)
-    assert df.iloc[0]["category"] == "Other"
\ No newline at end of file
+    assert df.iloc[0]["category"] == "Other"
+
+def test_first_matching_rule_wins():
+    df = pd.DataFrame({
+        "date": ["2025-01-05", "2025-01-06"],
+        "description": ["Netflix via Uber Gift", "CINEMARKET Plaza"],
+        "amount": [12, 30]
+    })
+    df = categorize_transactions(df)
+    # "uber" is declared before "netflix", "market" before "cinema"
+    assert df.iloc[0]["category"] == "Transport"
+    assert df.iloc[1]["category"] == "Groceries"
+
+
+def test_repeated_descriptions_are_served_from_cache():
+    clear_category_cache()
+    df = pd.DataFrame({
+        "date": ["2025-01-01"] * 4,
+        "description": ["Netflix Subscription", "NETFLIX SUBSCRIPTION", "Home Rent", "Home Rent"],
+        "amount": [10, 10, 500, 500]
+    })
+    categorize_transactions(df.copy())
+    info = category_cache_info()
+    assert (info.hits, info.misses) == (0, 2)
+
+    df = categorize_transactions(df)
+    info = category_cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    assert list(df["category"]) == ["Entertainment", "Entertainment", "Housing", "Housing"]
+
+
+def test_cache_invalidated_when_rules_change(monkeypatch):
+    df = pd.DataFrame({"date": ["2025-01-01"], "description": ["Gym Membership"], "amount": [40]})
+    assert categorize_transactions(df.copy()).iloc[0]["category"] == "Other"
+
+    monkeypatch.setitem(CATEGORY_RULES, "gym", "Health")
+    assert categorize_transactions(df.copy()).iloc[0]["category"] == "Health"
+
+
+def test_missing_descriptions_go_to_other():
+    df = pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-02", "2025-01-03"],
+        "description": ["Netflix", None, float("nan")],
+        "amount": [10, 20, 30],
+    })
+    df = categorize_transactions(df)
+    assert list(df["category"]) == ["Entertainment", "Other", "Other"]
+
+
+def test_matching_runs_outside_the_cache_lock(monkeypatch):
+    from src import categorize
+
+    clear_category_cache()
+    original = categorize.KeywordMatcher.categorize
+    held = []
+
+    def spy(self, descriptions):
+        held.append(categorize._CATEGORY_CACHE._lock.locked())
+        return original(self, descriptions)
+
+    monkeypatch.setattr(categorize.KeywordMatcher, "categorize", spy)
+    df = pd.DataFrame({"date": ["2025-01-01"], "description": ["Uber Ride"], "amount": [20]})
+    assert categorize_transactions(df).iloc[0]["category"] == "Transport"
+    assert held == [False]
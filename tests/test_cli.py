@@ -0,0 +1,111 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from src.cli import (
+    EXIT_BUDGET,
+    EXIT_NO_RESULTS,
+    EXIT_OK,
+    EXIT_PARTIAL,
+    EXIT_USAGE,
+    main,
+    output_names,
+    resolve_inputs,
+    run_batch,
+)
+
+
+def write_exports(directory):
+    directory.mkdir()
+    (directory / "january.csv").write_text(
+        "date,description,amount\n2025-01-01,Supermarket,-50\n2025-01-02,Uber,-20\n"
+    )
+    (directory / "february.csv").write_text("date,description,amount\n2025-02-01,Rent,-500\n")
+    return directory
+
+
+def test_resolve_inputs_expands_directories_and_globs(tmp_path):
+    ledger = write_exports(tmp_path / "ledger")
+    paths = resolve_inputs([str(ledger), str(ledger / "jan*.csv"), str(tmp_path / "none*.csv")])
+    assert [p.name for p in paths] == ["february.csv", "january.csv"]
+
+
+def test_run_batch_streams_results_and_summary(tmp_path):
+    ledger = write_exports(tmp_path / "ledger")
+    stream = io.StringIO()
+    summary = run_batch(
+        resolve_inputs([str(ledger)]),
+        tmp_path / "out",
+        fmt="csv",
+        budgets={"Housing": 400},
+        workers=2,
+        use_threads=True,
+        stream=stream,
+    )
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [e["event"] for e in events].count("file_done") == 2
+    assert events[-1] == json.loads(json.dumps(summary))
+    assert summary["rows"] == 3
+    assert summary["net_balance"] == -570
+    assert summary["budget_exceeded"] == ["Housing"]
+    assert {"load", "categorize", "aggregate", "export", "budget"} <= set(summary["stage_seconds"])
+
+    totals = pd.read_csv(tmp_path / "out" / "category_totals.csv")
+    assert totals.set_index("category")["total_amount"].to_dict() == {
+        "Groceries": -50, "Housing": -500, "Transport": -20,
+    }
+    assert (tmp_path / "out" / "transactions" / "january.csv").exists()
+
+
+def test_main_exit_codes(tmp_path, capsys):
+    ledger = write_exports(tmp_path / "ledger")
+    out = str(tmp_path / "out")
+    budgets = tmp_path / "budgets.json"
+    budgets.write_text(json.dumps({"Housing": 400}))
+
+    assert main([str(ledger), "-o", out, "--format", "csv", "--threads"]) == EXIT_OK
+    assert main([str(ledger), "-o", out, "--format", "csv", "--threads",
+                 "--budgets", str(budgets), "--fail-on-budget"]) == EXIT_BUDGET
+
+    (ledger / "broken.csv").write_text("date,description\n2025-01-01,Rent\n")
+    summary_path = tmp_path / "summary.json"
+    code = main([str(ledger), "-o", out, "--format", "csv", "--summary", str(summary_path)])
+    assert code == EXIT_PARTIAL
+    assert json.loads(summary_path.read_text())["files_failed"] == 1
+
+    assert main([str(tmp_path / "missing" / "*.csv"), "-o", out]) == EXIT_NO_RESULTS
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(ledger), "-o", out, "--budgets", str(tmp_path / "nope.json")])
+    assert excinfo.value.code == 2
+
+
+def test_same_file_names_in_different_directories_get_separate_outputs(tmp_path):
+    first = write_exports(tmp_path / "a")
+    second = write_exports(tmp_path / "b")
+    (second / "january.csv").write_text("date,description,amount\n2025-01-05,Cinema,-12\n")
+    inputs = resolve_inputs([str(first / "january.csv"), str(second / "january.csv")])
+    assert list(output_names(inputs).values()) == ["a/january", "b/january"]
+
+    summary = run_batch(inputs, tmp_path / "out", fmt="csv", use_threads=True, stream=io.StringIO())
+    assert summary["files_processed"] == 2
+    exported = sorted((tmp_path / "out" / "transactions").rglob("*.csv"))
+    assert [path.relative_to(tmp_path / "out" / "transactions").as_posix() for path in exported] == [
+        "a/january.csv",
+        "b/january.csv",
+    ]
+    assert len(pd.read_csv(exported[1])) == 1
+
+
+def test_inputs_that_would_share_an_output_are_rejected(tmp_path):
+    ledger = write_exports(tmp_path / "ledger")
+    (ledger / "january.txt").write_text((ledger / "january.csv").read_text())
+    inputs = [ledger / "january.csv", ledger / "january.txt"]
+    with pytest.raises(ValueError, match="january"):
+        run_batch(inputs, tmp_path / "out", fmt="csv", use_threads=True, stream=io.StringIO())
+    assert not (tmp_path / "out").exists()
+
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(path) for path in inputs] + ["-o", str(tmp_path / "out"), "--format", "csv"])
+    assert excinfo.value.code == EXIT_USAGE
@@ -0,0 +1,44 @@
+import io
+
+import pandas as pd
+
+from src.analysis import category_totals, monthly_totals, net_balance
+from src.budget import check_budget
+from src.categorize import categorize_transactions
+from src.compact import compact_frame, memory_report
+from src.preprocessing import load_csv
+
+
+def sample_csv():
+    rows = ["date,description,amount"]
+    for day in range(1, 29):
+        rows.append(f"2025-01-{day:02d},Fresh Mart Supermarket,-0.1")
+        rows.append(f"2025-02-{day:02d},Netflix Subscription,-0.2")
+    return io.StringIO("\n".join(rows) + "\n")
+
+
+def test_compact_load_keeps_cents_and_dictionary_encoding():
+    df = categorize_transactions(load_csv(sample_csv(), compact=True))
+    assert "amount" not in df.columns
+    assert df["amount_cents"].dtype == "int64"
+    assert isinstance(df["description"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["category"].dtype, pd.CategoricalDtype)
+    assert set(df["category"]) == {"Groceries", "Entertainment"}
+
+
+def test_compact_totals_are_exact():
+    df = categorize_transactions(load_csv(sample_csv(), compact=True))
+    assert net_balance(df) == -8.4
+    totals = category_totals(df).set_index("category")["total_amount"]
+    assert totals["Groceries"] == -2.8
+    assert monthly_totals(df)["total_amount"].tolist() == [-2.8, -5.6]
+    assert any("Groceries exceeded" in alert for alert in check_budget(df, {"Groceries": 1}))
+
+
+def test_memory_report_shows_savings():
+    df = categorize_transactions(load_csv(sample_csv()))
+    report = memory_report(df)
+    assert list(report.columns) == ["before_bytes", "after_bytes", "saved_pct"]
+    assert report.loc["total", "after_bytes"] < report.loc["total", "before_bytes"]
+    assert report.loc["amount", "after_bytes"] == report.loc["amount", "before_bytes"]
+    assert compact_frame(df)["amount_cents"].sum() == -840
@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+
+from src.compact import compact_frame
+from src.dedup import DeduplicationError, deduplicate
+from src.utils_io import ingest_csv_files
+
+
+def sample_df():
+    return pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-01", "2025-01-02", "2025-01-05", "2025-01-01"],
+        "description": ["Coffee Bar", "coffee  bar", "COFFEE BAR", "Coffee Bar", "Rent"],
+        "amount": [-3.5, -3.5, -3.5, -3.5, -3.5],
+    })
+
+
+def test_exact_duplicates_are_normalized_and_counted():
+    result = deduplicate(sample_df())
+    assert result.exact_duplicates == 1
+    assert result.near_duplicates == 0
+    assert result.frame.index.tolist() == [0, 2, 3, 4]
+
+
+def test_near_duplicates_within_window_anchor_on_kept_rows():
+    df = sample_df()
+    result = deduplicate(df, window_days=1)
+    assert result.removed == 2
+    assert result.frame.index.tolist() == [0, 3, 4]
+
+    chained = pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-02", "2025-01-03"],
+        "description": ["Gym"] * 3,
+        "amount": [-10.0] * 3,
+    })
+    # Day 3 is two days from the kept day-1 row, so it survives.
+    assert deduplicate(chained, window_days=1).frame.index.tolist() == [0, 2]
+
+
+def test_long_runs_keep_one_row_per_window():
+    days = pd.date_range("2025-01-01", periods=60, freq="D")
+    df = pd.DataFrame({
+        "date": days.strftime("%Y-%m-%d").tolist() * 2,
+        "description": ["Metro"] * 60 + ["Bakery"] * 60,
+        "amount": [-2.8] * 60 + [-1.5] * 60,
+        "source_file": (["a.csv", "b.csv"] * 30) + (["a.csv"] * 60),
+    })
+    result = deduplicate(df, window_days=2)
+    assert result.frame.index.tolist() == list(range(0, 60, 3)) + list(range(60, 120, 3))
+
+    # Within one file every day is kept; alternating files chain on the kept row.
+    by_source = deduplicate(df, window_days=2, source_column="source_file")
+    assert by_source.frame.index.tolist() == list(range(0, 60, 2)) + list(range(60, 120))
+
+
+def test_compact_frames_use_cents():
+    assert deduplicate(compact_frame(sample_df())).exact_duplicates == 1
+
+
+def test_source_column_keeps_repeats_within_one_file():
+    df = pd.DataFrame({
+        "date": ["2025-01-01"] * 4 + ["2025-01-02"],
+        "description": ["Coffee"] * 5,
+        "amount": [-3.0] * 5,
+        "source_file": ["a.csv", "a.csv", "b.csv", "b.csv", "b.csv"],
+    })
+    result = deduplicate(df, source_column="source_file", window_days=1)
+    assert result.exact_duplicates == 2
+    assert result.near_duplicates == 1
+    assert result.frame.index.tolist() == [0, 1]
+
+
+def test_deduplicate_validation():
+    with pytest.raises(DeduplicationError):
+        deduplicate(pd.DataFrame({"date": [], "amount": []}))
+    with pytest.raises(DeduplicationError):
+        deduplicate(sample_df(), window_days=-1)
+
+
+def test_ingest_drops_overlapping_exports(tmp_path):
+    january = tmp_path / "january.csv"
+    january.write_text("date,description,amount\n2025-01-01,Supermarket,-50\n2025-01-31,Uber,-20\n")
+    overlap = tmp_path / "overlap.csv"
+    overlap.write_text("date,description,amount\n2025-01-31,Uber,-20\n2025-02-01,Rent,-500\n")
+
+    result = ingest_csv_files([january, overlap], drop_duplicates=True)
+    assert result.duplicates_removed == 1
+    assert result.frame["amount"].sum() == -570
+
+    # Off by default: the files may be different accounts.
+    kept = ingest_csv_files([january, overlap])
+    assert kept.duplicates_removed == 0
+    assert len(kept.frame) == 4
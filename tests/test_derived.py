@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.core.internals import BlockManager
+
+from src.analysis import category_totals, monthly_totals, net_balance
+from src.budget import check_budget
+from src.categorize import categorize_transactions
+from src.derived import derived_column, invalidate, month_period, normalized_description
+from src.visualization import plot_expenses_by_category, plot_monthly_trend
+
+
+def large_df(rows=50_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        "description": rng.choice(["Fresh Mart Supermarket", "Home Rent", "Netflix", "Coffee"], rows),
+        "amount": rng.normal(-20, 5, rows).round(2),
+    })
+
+
+def test_derived_columns_are_cached_until_source_is_replaced():
+    df = large_df(10)
+    first = month_period(df)
+    assert month_period(df) is first
+
+    df["date"] = df["date"] + pd.Timedelta(days=31)
+    assert month_period(df) is not first
+    assert (month_period(df) == first + 1).all()
+
+
+def test_hits_are_checked_by_buffer_and_invalidate_forces_a_rebuild():
+    df = large_df(10)
+    builds = []
+
+    def build(frame):
+        builds.append(1)
+        return frame["amount"].sum()
+
+    assert derived_column(df, "total", ("amount",), build) == derived_column(df, "total", ("amount",), build)
+    assert len(builds) == 1
+    df.loc[0, "amount"] = 1_000.0
+    assert derived_column(df, "total", ("amount",), build) == df["amount"].sum()
+    assert len(builds) == 2
+
+    invalidate(df)
+    derived_column(df, "total", ("amount",), build)
+    assert len(builds) == 3
+
+
+def test_categorize_leaves_description_untouched():
+    df = pd.DataFrame({"date": ["2025-01-01"], "description": ["Fresh MART"], "amount": [-3]})
+    categorize_transactions(df)
+    assert df.iloc[0]["description"] == "Fresh MART"
+    assert normalized_description(df).iloc[0] == "fresh mart"
+
+
+def test_hot_path_makes_no_full_frame_copy_and_no_mutation(monkeypatch):
+    df = categorize_transactions(large_df())
+    snapshot = df.copy()
+
+    copies = []
+    original_copy = BlockManager.copy
+
+    def tracking_copy(self, deep=True):
+        if deep and self.shape[-1] == len(df):
+            copies.append(self.shape)
+        return original_copy(self, deep=deep)
+
+    monkeypatch.setattr(BlockManager, "copy", tracking_copy)
+    categorize_transactions(df)
+    monthly_totals(df)
+    category_totals(df)
+    net_balance(df)
+    check_budget(df, {"Groceries": 100})
+    plot_monthly_trend(df)
+    plot_expenses_by_category(df)
+    monkeypatch.undo()
+
+    assert copies == []
+    pd.testing.assert_frame_equal(df, snapshot)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_monthly_totals_do_not_add_columns(compact):
+    df = large_df(100)
+    if compact:
+        from src.compact import compact_frame
+        df = compact_frame(df)
+    columns = list(df.columns)
+    monthly_totals(df)
+    assert list(df.columns) == columns
+
+
+def test_arrow_backed_columns_are_supported(tmp_path):
+    pytest.importorskip("pyarrow")
+    from src.utils_io import export_dataframe, read_dataframe
+
+    path = tmp_path / "frame.feather"
+    export_dataframe(pd.DataFrame({"date": pd.to_datetime(["2025-01-03", "2025-02-01"]), "amount": [1, 2]}), path)
+    df = read_dataframe(path)
+    assert month_period(df) is month_period(df)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from src.downsample import downsample, lttb, minmax
+
+
+def series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(n, dtype="float64"), np.cumsum(rng.normal(size=n))
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_budget_ends_and_order(method):
+    x, y = series(10_000)
+    keep = downsample(x, y, 300, method)
+    assert len(keep) <= 300
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+    assert np.all(np.diff(keep) > 0)
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_short_series_are_kept_whole(method):
+    x, y = series(50)
+    assert downsample(x, y, 50, method).tolist() == list(range(50))
+
+
+@pytest.mark.parametrize("reducer", [lttb, minmax])
+def test_spikes_survive(reducer):
+    x, y = series(100_000)
+    y[54_321] = 1e6
+    y[12_345] = -1e6
+    keep = reducer(x, y, 200)
+    assert 54_321 in keep and 12_345 in keep
+
+
+def test_lttb_follows_a_straight_line():
+    x = np.arange(1_000, dtype="float64")
+    keep = lttb(x, 2 * x, 10)
+    assert len(keep) == 10
+    assert np.array_equal(2 * x[keep], (2 * x)[keep])
+
+
+def test_minmax_keeps_bucket_extremes():
+    y = np.array([5, 1, 9, 3, 7, 2, 8, 0, 6, 4], dtype="float64")
+    keep = minmax(None, y, 6)
+    # Two buckets of five: (1, 9) and (0, 8), plus both ends.
+    assert keep.tolist() == [0, 1, 2, 6, 7, 9]
+
+
+def test_invalid_arguments():
+    x, y = series(100)
+    with pytest.raises(ValueError):
+        downsample(x, y, 3)
+    with pytest.raises(ValueError):
+        downsample(x, y, 10, "median")
@@ -0,0 +1,68 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src import instrumentation
+from src.analysis import monthly_totals
+from src.categorize import categorize_transactions
+from src.preprocessing import load_csv
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def write_csv(tmp_path):
+    path = tmp_path / "expenses.csv"
+    path.write_text("date,description,amount\n2025-01-01,Supermarket,-50\n2025-02-01,Rent,-500\n")
+    return path
+
+
+def test_disabled_instrumentation_records_nothing(tmp_path):
+    categorize_transactions(load_csv(write_csv(tmp_path)))
+    assert instrumentation.snapshot() == {}
+
+
+def test_public_functions_record_time_and_rows(tmp_path):
+    instrumentation.enable(memory=True)
+    df = categorize_transactions(load_csv(write_csv(tmp_path)))
+    monthly_totals(df)
+    monthly_totals(df)
+
+    stats = instrumentation.snapshot()
+    assert {"preprocessing.load_csv", "categorize.categorize_transactions", "analysis.monthly_totals"} <= set(stats)
+    assert stats["preprocessing.load_csv"]["rows"] == 2
+    assert stats["analysis.monthly_totals"]["calls"] == 2
+    assert stats["analysis.monthly_totals"]["rows"] == 4
+    assert stats["preprocessing.load_csv"]["seconds"] > 0
+    assert stats["preprocessing.load_csv"]["rows_per_second"] > 0
+
+
+def test_stage_context_tracks_nested_peak_memory():
+    instrumentation.enable(memory=True)
+    with instrumentation.stage("outer", rows=3):
+        with instrumentation.stage("inner") as record:
+            block = bytearray(4_000_000)
+            record.rows = 1
+            del block
+
+    stats = instrumentation.snapshot()
+    assert stats["inner"]["peak_memory_bytes"] >= 4_000_000
+    assert stats["outer"]["peak_memory_bytes"] >= stats["inner"]["peak_memory_bytes"]
+    assert stats["outer"]["rows"] == 3
+
+
+def test_exports():
+    instrumentation.enable()
+    monthly_totals(pd.DataFrame({"date": ["2025-01-01"], "amount": [-1.0]}))
+
+    exported = json.loads(instrumentation.to_json())
+    assert exported["analysis.monthly_totals"]["rows"] == 1
+    prometheus = instrumentation.to_prometheus()
+    assert "# TYPE finance_analyzer_stage_seconds_total counter" in prometheus
+    assert 'finance_analyzer_stage_rows_total{stage="analysis.monthly_totals"} 1' in prometheus
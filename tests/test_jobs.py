@@ -0,0 +1,76 @@
+import io
+
+import pandas as pd
+import pytest
+
+from src import jobs
+from src.categorize import categorize_transactions
+from src.jobs import JobCancelled, UploadJob
+from src.preprocessing import load_csv
+from src.synthetic import generate_transactions
+
+
+def ledger_bytes(rows):
+    return generate_transactions(rows, seed=5).to_csv(index=False).encode()
+
+
+def test_job_matches_the_one_shot_pipeline():
+    data = ledger_bytes(2_500)
+    job = UploadJob(io.BytesIO(data), chunksize=1_000, cache=False).start()
+    df = job.result(timeout=30)
+
+    expected = categorize_transactions(load_csv(io.BytesIO(data)))
+    pd.testing.assert_frame_equal(df, expected)
+    progress = job.progress()
+    assert progress.state == jobs.DONE
+    assert (progress.rows_parsed, progress.rows_categorized, progress.chunks) == (2_500, 2_500, 3)
+    assert progress.fraction == 1.0
+    summary = job.partial_summary()
+    assert summary["transactions"] == 2_500
+    assert summary["net_balance"] == pytest.approx(expected["amount"].sum())
+
+
+def test_job_leaves_the_callers_buffer_untouched():
+    upload = io.BytesIO(ledger_bytes(100))
+    upload.seek(10)
+    UploadJob(upload, cache=False).start().result(timeout=30)
+    assert upload.tell() == 10
+
+
+def test_cancel_stops_before_the_next_chunk(monkeypatch):
+    job = UploadJob(io.BytesIO(ledger_bytes(3_000)), chunksize=1_000, cache=False)
+
+    def categorize_then_cancel(chunk):
+        job.cancel()
+        return categorize_transactions(chunk)
+
+    monkeypatch.setattr(jobs, "categorize_transactions", categorize_then_cancel)
+    job.start()
+    with pytest.raises(JobCancelled):
+        job.result(timeout=30)
+    assert job.state == jobs.CANCELLED
+    assert job.progress().rows_categorized == 1_000
+    assert job.partial_summary()["transactions"] == 1_000
+
+
+def test_failures_surface_from_result():
+    job = UploadJob(io.BytesIO(b"when,what\n1,2\n"), cache=False).start()
+    with pytest.raises(ValueError):
+        job.result(timeout=30)
+    assert job.state == jobs.FAILED
+
+
+def test_second_job_is_served_from_the_cache(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from src.cache import FrameCache
+
+    cache = FrameCache(tmp_path / "cache")
+    data = ledger_bytes(500)
+    first = UploadJob(io.BytesIO(data), cache=cache).start().result(timeout=30)
+
+    monkeypatch.setattr(jobs, "load_csv_chunks", lambda *args, **kwargs: pytest.fail("cache was bypassed"))
+    job = UploadJob(io.BytesIO(data), cache=cache).start()
+    second = job.result(timeout=30)
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+    assert job.progress().from_cache
+    assert job.partial_summary()["transactions"] == 500
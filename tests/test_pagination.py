@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from src.pagination import page_count, paginate
+
+
+def frame(rows):
+    return pd.DataFrame({"amount": range(rows)}, index=range(100, 100 + rows))
+
+
+def test_paginate_slices_the_requested_page():
+    page = paginate(frame(25), page=2, page_size=10)
+    assert page.frame["amount"].tolist() == list(range(10, 20))
+    assert (page.number, page.pages, page.total_rows, page.start, page.stop) == (2, 3, 25, 10, 20)
+
+
+def test_last_page_is_partial_and_out_of_range_pages_are_clamped():
+    assert len(paginate(frame(25), page=3, page_size=10).frame) == 5
+    assert paginate(frame(25), page=99, page_size=10).number == 3
+    assert paginate(frame(25), page=0, page_size=10).number == 1
+
+
+def test_empty_frame_has_one_empty_page():
+    page = paginate(frame(0), page_size=10)
+    assert (page.number, page.pages, len(page.frame)) == (1, 1, 0)
+
+
+def test_page_count_and_default_size():
+    assert page_count(0, 10) == 1
+    assert page_count(30, 10) == 3
+    assert page_count(31, 10) == 4
+    assert len(paginate(frame(1_000)).frame) == 200
+    with pytest.raises(ValueError):
+        page_count(10, 0)
@@ -1,8 +1,9 @@
 import io
 
+import pandas as pd
 import pytest
 
-from src.preprocessing import DatasetNotFoundError, load_csv
+from src.preprocessing import DatasetNotFoundError, load_csv, load_csv_chunks, parse_dates
 
 def test_load_csv_file_not_found():
     with pytest.raises(DatasetNotFoundError):
@@ -25,3 +26,45 @@ def test_load_csv_from_file_like():
     df = load_csv(buffer)
     assert not df.empty
     assert list(df.columns) == ["date", "description", "amount"]
+
+
+def test_load_csv_chunks_matches_load_csv(tmp_path):
+    file = tmp_path / "ledger.csv"
+    file.write_text(
+        "Date,Description,Amount\n"
+        "2025-01-01,Supermarket,-50\n"
+        "not-a-date,Broken,-1\n"
+        "2025-01-03,Uber,-20\n"
+        "2025-01-04,Salary,2000\n"
+        "2025-01-05,Rent,-700\n"
+    )
+
+    chunks = list(load_csv_chunks(file, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [1, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), load_csv(file))
+
+
+def test_load_csv_chunks_detects_latin1_from_sample():
+    buffer = io.BytesIO("date,description,amount\n2025-01-01,Café Rent,-700\n".encode("latin1"))
+
+    chunks = list(load_csv_chunks(buffer, chunksize=10))
+    assert chunks[0].iloc[0]["description"] == "Café Rent"
+
+
+def test_load_csv_chunks_missing_columns():
+    with pytest.raises(ValueError):
+        list(load_csv_chunks(io.StringIO("date,description\n2025-01-01,Rent\n")))
+
+
+def test_parse_dates_uses_configured_format_with_fallback():
+    values = pd.Series(["03/01/2025", "03/01/2025", "2025-02-10", "garbage", None])
+    parsed = parse_dates(values, "%d/%m/%Y")
+    assert parsed.iloc[0] == pd.Timestamp("2025-01-03")
+    assert parsed.iloc[1] == parsed.iloc[0]
+    assert parsed.iloc[2] == pd.Timestamp("2025-02-10")
+    assert parsed.iloc[3:].isna().all()
+
+
+def test_parse_dates_returns_typed_column_untouched():
+    dates = pd.Series(pd.to_datetime(["2025-01-01", "2025-02-01"]))
+    assert parse_dates(dates) is dates
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis import AnalysisError
+from src.compact import compact_frame
+from src.recurring import RECURRING_COLUMNS, detect_recurring
+
+
+def history():
+    months = pd.date_range("2025-01-03", periods=6, freq="MS") + pd.Timedelta(days=2)
+    weeks = pd.date_range("2025-01-06", periods=8, freq="7D")
+    rows = (
+        [(d, f"NETFLIX.COM {i:04d}", -15.99) for i, d in enumerate(months)]
+        + [(d, "Gym Club", -9.5 - (i % 2) * 0.25) for i, d in enumerate(weeks)]
+        + [(pd.Timestamp("2025-01-10"), "Fresh Mart", -42.0),
+           (pd.Timestamp("2025-02-27"), "Fresh Mart", -8.0),
+           (pd.Timestamp("2025-03-02"), "Fresh Mart", -120.0)]
+    )
+    df = pd.DataFrame(rows, columns=["date", "description", "amount"])
+    df["date"] = df["date"].dt.strftime("%Y-%m-%d")
+    df["category"] = np.where(df["description"].str.contains("NETFLIX"), "Entertainment", "Other")
+    return df
+
+
+def test_detects_cadence_amount_and_next_date():
+    result = detect_recurring(history()).set_index("merchant")
+    assert list(result.reset_index().columns) == RECURRING_COLUMNS
+    assert set(result.index) == {"netflix com", "gym club"}
+
+    netflix = result.loc["netflix com"]
+    assert netflix["cadence"] == "monthly"
+    assert netflix["typical_amount"] == -15.99
+    assert netflix["occurrences"] == 6
+    assert netflix["category"] == "Entertainment"
+    assert netflix["next_expected_date"] == netflix["last_date"] + pd.DateOffset(months=1)
+
+    gym = result.loc["gym club"]
+    assert gym["cadence"] == "weekly"
+    assert gym["next_expected_date"] == pd.Timestamp("2025-03-03")
+
+
+def test_irregular_amounts_and_compact_frames():
+    strict = detect_recurring(history(), amount_tolerance=0.01)
+    assert strict["merchant"].tolist() == ["netflix com"]
+    pd.testing.assert_frame_equal(detect_recurring(compact_frame(history())), detect_recurring(history()))
+
+
+def test_detect_recurring_validation():
+    with pytest.raises(AnalysisError):
+        detect_recurring(pd.DataFrame())
+    with pytest.raises(AnalysisError):
+        detect_recurring(history().drop(columns="description"))
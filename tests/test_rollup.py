@@ -0,0 +1,123 @@
+import pandas as pd
+import pytest
+
+from src.analysis import (
+    TotalsAccumulator,
+    category_totals,
+    monthly_category_totals,
+    monthly_totals,
+    net_balance,
+)
+from src.budget import check_budget
+from src.compact import compact_frame
+from src.rollup import RollupCube, cached_rollup, category_sums, rollup
+
+
+def sample_df():
+    return pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-15", "2025-02-01", "not a date"],
+        "description": ["Supermarket", "Uber Ride", "Rent", "Refund"],
+        "amount": [-50.0, -20.0, -500.0, 10.0],
+        "category": ["Groceries", "Transport", "Housing", None],
+    })
+
+
+def test_cube_answers_every_aggregate():
+    df = sample_df()
+    cube = RollupCube.from_frame(df)
+    assert cube.rows == 4
+    assert cube.net_balance() == -560
+    assert cube.monthly_totals().to_dict() == {"2025-01": -70, "2025-02": -500}
+    assert cube.category_totals().to_dict() == {"Groceries": -50, "Housing": -500, "Transport": -20}
+    assert cube.counts("month").to_dict() == {"2025-01": 2, "2025-02": 1}
+    table = cube.month_category_totals()
+    assert table.loc["2025-01", "Groceries"] == -50
+    assert table.loc["2025-02", "Groceries"] == 0
+
+
+def test_analysis_reads_from_the_cached_cube():
+    df = sample_df()
+    cube = rollup(df)
+    assert rollup(df) is cube
+    assert net_balance(df) == -560
+    assert monthly_totals(df)["total_amount"].tolist() == [-70, -500]
+    assert category_totals(df)["category"].tolist() == ["Groceries", "Housing", "Transport"]
+    assert monthly_category_totals(df).shape == (2, 3)
+
+    df["amount"] = df["amount"] * 2  # replacing a column rebuilds the cube
+    assert rollup(df) is not cube
+    assert net_balance(df) == -1120
+
+
+def test_totals_without_a_cube_use_a_direct_reduction():
+    df = sample_df()
+    assert net_balance(df) == -560
+    direct = category_sums(df)
+    assert cached_rollup(df) is None
+
+    cube = rollup(df)
+    assert cached_rollup(df) is cube
+    pd.testing.assert_series_equal(direct, cube.category_totals(), check_index_type=False)
+
+
+def test_in_place_edits_invalidate_the_cached_cube():
+    df = sample_df().iloc[:2].copy()
+    rollup(df)
+    assert net_balance(df) == -70
+    assert "within budget" in check_budget(df, {"Groceries": 100})[0]
+
+    df.loc[0, "amount"] = -500.0
+    assert net_balance(df) == -520
+    assert "exceeded" in check_budget(df, {"Groceries": 100})[0]
+
+    df.iloc[1, df.columns.get_loc("amount")] = -1.0
+    assert net_balance(df) == -501
+
+    df.loc[1, "category"] = "Groceries"
+    assert category_totals(df)["total_amount"].tolist() == [-501]
+
+    df.loc[1, "date"] = "2025-02-03"
+    assert monthly_totals(df)["month"].tolist() == ["2025-01", "2025-02"]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_in_place_edits_of_compact_frames_are_detected(compact):
+    df = compact_frame(sample_df()) if compact else sample_df()
+    amount = "amount_cents" if compact else "amount"
+    before = net_balance(df)
+    df.loc[0, amount] = df.loc[0, amount] * 3
+    assert net_balance(df) == before + 2 * -50
+
+
+def test_append_and_merge_match_a_full_build():
+    df = sample_df()
+    full = RollupCube.from_frame(df)
+    appended = RollupCube.from_frame(df.iloc[:2]).append(df.iloc[2:])
+    merged = RollupCube.from_frame(df.iloc[:1]).merge(RollupCube.from_frame(df.iloc[1:]))
+    for cube in (appended, merged):
+        pd.testing.assert_series_equal(cube.monthly_totals(), full.monthly_totals())
+        pd.testing.assert_series_equal(cube.category_totals(), full.category_totals())
+        assert cube.net_balance() == full.net_balance()
+
+
+def test_compact_cubes_stay_in_cents_until_mixed():
+    df = sample_df().assign(amount=[-0.1, -0.2, -0.3, 0.0])
+    cube = RollupCube.from_frame(compact_frame(df))
+    cube.append(compact_frame(df))
+    assert cube.net_balance() == -1.2
+    cube.append(df)
+    assert round(cube.net_balance(), 10) == -1.8
+
+    accumulator = TotalsAccumulator().update(compact_frame(df)).update(compact_frame(df))
+    assert accumulator.net_balance() == -1.2
+
+
+def test_merging_into_an_empty_cube_leaves_the_source_untouched():
+    df = sample_df()
+    compact = compact_frame(df)
+    shared = rollup(compact)
+
+    cube = RollupCube().merge(shared).append(df)
+    assert cube.net_balance() == -1120
+    assert shared.net_balance() == -560
+    assert net_balance(compact) == -560
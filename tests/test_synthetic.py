@@ -0,0 +1,46 @@
+import pandas as pd
+
+from src.categorize import categorize_transactions
+from src.preprocessing import load_csv
+from src.synthetic import RECURRING, generate_transactions, write_ledger_csv
+
+
+def test_same_seed_gives_same_ledger():
+    first = generate_transactions(2_000, seed=7)
+    assert first.equals(generate_transactions(2_000, seed=7))
+    assert not first.equals(generate_transactions(2_000, seed=8))
+
+
+def test_ledger_shape_dates_and_amounts():
+    df = generate_transactions(5_000, seed=1, start="2024-01-01", months=6)
+    assert list(df.columns) == ["date", "description", "amount"]
+    assert len(df) == 5_000
+    dates = pd.to_datetime(df["date"], format="%Y-%m-%d")
+    assert dates.is_monotonic_increasing
+    assert dates.min() >= pd.Timestamp("2024-01-01")
+    assert dates.max() < pd.Timestamp("2024-07-01")
+    assert (df["amount"] < 0).mean() > 0.9
+    assert df["amount"].round(2).equals(df["amount"])
+
+
+def test_recurring_charges_repeat_on_the_same_day():
+    df = generate_transactions(20_000, seed=2)
+    rent = df[df["description"].str.startswith(RECURRING[0].description)]
+    assert not rent.empty
+    assert set(rent["amount"]) == {RECURRING[0].amount}
+    assert set(pd.to_datetime(rent["date"]).dt.day) == {RECURRING[0].day}
+
+
+def test_ledger_is_categorized():
+    df = categorize_transactions(generate_transactions(5_000, seed=3))
+    shares = df["category"].value_counts(normalize=True)
+    assert shares.get("Groceries", 0) > 0.2
+    assert shares.get("Other", 0) < 0.5
+
+
+def test_write_ledger_csv_in_chunks_loads_back(tmp_path):
+    path = write_ledger_csv(tmp_path / "ledger.csv", 2_500, seed=4, chunk_rows=1_000)
+    df = load_csv(path)
+    assert len(df) == 2_500
+    head = generate_transactions(1_000, seed=4)
+    assert df["description"].iloc[:1_000].tolist() == head["description"].tolist()
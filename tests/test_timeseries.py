@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis import AnalysisError, monthly_totals
+from src.compact import compact_frame
+from src.timeseries import TimeSeriesEngine
+
+
+def sample_df():
+    return pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-03", "2025-01-15", "2025-02-01", "2025-03-10"],
+        "description": ["Supermarket", "Uber Ride", "Salary", "Rent", "Supermarket"],
+        "amount": [-50, -20, 1000, -500, -30],
+        "category": ["Groceries", "Transport", "Income", "Housing", "Groceries"],
+    })
+
+
+def test_daily_base_is_dense_and_sorted():
+    daily = TimeSeriesEngine(sample_df()).totals("D")
+    assert daily.index.is_monotonic_increasing
+    assert len(daily) == (pd.Timestamp("2025-03-10") - pd.Timestamp("2025-01-01")).days + 1
+    assert daily.loc["2025-01-02", "total_amount"] == 0
+
+
+def test_monthly_totals_match_analysis():
+    df = sample_df()
+    monthly = TimeSeriesEngine(df).totals("M")
+    expected = monthly_totals(df)["total_amount"].to_numpy()
+    np.testing.assert_allclose(monthly["total_amount"].to_numpy(), expected)
+
+
+def test_per_category_and_compact_frames_agree():
+    df = sample_df()
+    plain = TimeSeriesEngine(df).totals("W", by_category=True)
+    compact = TimeSeriesEngine(compact_frame(df)).totals("W", by_category=True)
+    pd.testing.assert_frame_equal(plain, compact)
+    assert plain["Groceries"].sum() == -80
+
+
+def test_rolling_and_month_over_month():
+    engine = TimeSeriesEngine(sample_df())
+    rolling = engine.rolling(2, freq="M")
+    assert rolling["total_amount"].tolist() == [930, 430, -530]
+
+    mom = engine.month_over_month()
+    assert mom["change"].tolist()[1:] == [-1430, 470]
+    assert np.isnan(mom["change"].iloc[0])
+
+    by_day = engine.rolling("7D", agg="mean", by_category=True)
+    assert list(by_day.columns) == list(engine.totals(by_category=True).columns)
+
+
+def test_views_are_cached_per_spec():
+    engine = TimeSeriesEngine(sample_df())
+    engine.totals("M")
+    key = ("totals", "MS", False)
+    cached = engine._cache[key]
+    first = engine.totals("M")
+    first.iloc[0, 0] = 0  # callers get copies
+    assert engine._cache[key] is cached
+    assert engine.totals("M").iloc[0, 0] == 930
+
+
+def test_engine_validation():
+    with pytest.raises(AnalysisError):
+        TimeSeriesEngine(pd.DataFrame())
+    without_category = sample_df().drop(columns="category")
+    engine = TimeSeriesEngine(without_category)
+    assert engine.totals("M")["total_amount"].sum() == 400
+    with pytest.raises(AnalysisError):
+        engine.totals(by_category=True)
+    with pytest.raises(AnalysisError):
+        engine.rolling(3, agg="median")
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from src.utils_io import export_dataframe, ingest_csv_files, load_csv_files
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".feather"])
+def test_export_and_load_round_trip(tmp_path, suffix):
+    if suffix != ".csv":
+        pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+        "amount": [-50.0, -20.5],
+    })
+    path = tmp_path / "out" / f"expenses{suffix}"
+    export_dataframe(df, path)
+
+    [loaded] = load_csv_files([path])
+    assert loaded["amount"].tolist() == [-50.0, -20.5]
+    if suffix != ".csv":
+        assert pd.api.types.is_datetime64_any_dtype(loaded["date"])
+
+
+def test_feather_columns_are_zero_copy_views(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "expenses.feather"
+    export_dataframe(pd.DataFrame({"amount": [-50.0, -20.5], "month": [1, 2]}), path)
+
+    [loaded] = load_csv_files([path])
+    assert not loaded["amount"].to_numpy().flags.writeable
+    edited = loaded.copy()
+    edited.loc[0, "amount"] = -1.0
+    assert edited["amount"].tolist() == [-1.0, -20.5]
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_ingest_csv_files_collects_failures(tmp_path, use_processes):
+    good = tmp_path / "january.csv"
+    good.write_text("date,description,amount\n2025-01-01,Supermarket,-50\n2025-01-02,Uber,-20\n")
+    bad = tmp_path / "broken.csv"
+    bad.write_text("date,description\n2025-01-01,Rent\n")
+    missing = tmp_path / "missing.csv"
+
+    result = ingest_csv_files([good, bad, missing], max_workers=2, use_processes=use_processes)
+    assert result.files_loaded == 1
+    assert set(result.failures) == {str(bad), str(missing)}
+    assert result.frame["category"].tolist() == ["Groceries", "Transport"]
+    assert set(result.frame["source_file"]) == {str(good)}
@@ -0,0 +1,58 @@
+import json
+import threading
+
+import pytest
+
+from src import utils_logging
+from src.utils_logging import configure_logging, log_error, log_info, shutdown_logging
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    directory = tmp_path / "logs"
+    yield directory
+    shutdown_logging()
+
+
+def read_records(directory):
+    return [json.loads(line) for line in (directory / "app.log").read_text().splitlines()]
+
+
+def test_queue_mode_writes_json_in_background_and_flushes(log_dir):
+    configure_logging(log_dir=log_dir, use_queue=True, json_format=True, sample_every=1)
+    assert utils_logging._LISTENER is not None
+
+    threads = [threading.Thread(target=log_info, args=(f"message {i}",)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log_error("boom")
+    shutdown_logging()
+
+    records = read_records(log_dir)
+    assert len(records) == 21
+    assert records[-1]["level"] == "ERROR" and records[-1]["message"] == "boom"
+    assert {"time", "level", "logger", "message", "thread"} <= set(records[0])
+
+
+def test_hot_messages_are_sampled_per_call_site(log_dir):
+    configure_logging(log_dir=log_dir, use_queue=False, json_format=True, sample_every=5)
+    for i in range(12):
+        log_info(f"hot {i}", hot=True)
+    log_info("cold")
+    shutdown_logging()
+
+    records = read_records(log_dir)
+    assert [r["message"] for r in records] == ["hot 0", "hot 5", "hot 10", "cold"]
+    assert records[0]["sampled"] == 5
+
+
+def test_log_dir_is_created_on_first_use(tmp_path, monkeypatch):
+    directory = tmp_path / "lazy-logs"
+    monkeypatch.setitem(utils_logging.DEFAULT_CONFIG, "log_dir", str(directory))
+    shutdown_logging()
+    assert not directory.exists()
+    log_info("first")
+    shutdown_logging()
+    assert "first" in (directory / "app.log").read_text()
@@ -1,11 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pandas as pd
 import plotly.graph_objs as go
 import pytest
 
+import src.visualization as visualization
 from src.visualization import (
     VisualizationError,
+    plot_daily_trend,
     plot_expenses_by_category,
     plot_monthly_trend,
+    plot_transactions,
+    render_dataset_charts,
 )
 
 from src.visualization import _KALEIDO_AVAILABLE
@@ -47,7 +55,82 @@ def test_plot_monthly_trend_to_file(tmp_path):
     assert output.exists()
 
 
+def test_daily_trend_keeps_small_series_whole():
+    fig = plot_daily_trend(sample_df())
+    assert len(fig.data[0].x) == 32
+    assert fig.layout.title.text == "Daily Expense Trend"
+
+
+def test_large_series_are_downsampled_to_the_point_budget():
+    from src.categorize import categorize_transactions
+    from src.synthetic import generate_transactions
+
+    df = categorize_transactions(generate_transactions(20_000, seed=9))
+    daily = plot_daily_trend(df, max_points=100)
+    assert len(daily.data[0].x) == 100
+    assert "100 of 731 days" in daily.layout.title.text
+
+    scatter = plot_transactions(df, max_points=500)
+    assert sum(len(trace.x) for trace in scatter.data) <= 500
+    assert {trace.name for trace in scatter.data} <= set(df["category"])
+    # min/max buckets keep the extremes.
+    amounts = [value for trace in scatter.data for value in trace.y]
+    assert min(amounts) == df["amount"].min()
+    assert max(amounts) == df["amount"].max()
+
+
+def test_downsampling_rejects_unknown_methods():
+    with pytest.raises(VisualizationError):
+        plot_daily_trend(sample_df(), method="average")
+
+
 def test_empty_dataframe():
     df = pd.DataFrame()
     with pytest.raises(VisualizationError):
         plot_expenses_by_category(df)
+
+
+def test_import_is_lazy_and_side_effect_free(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    code = (
+        "import sys; sys.path.insert(0, %r); "
+        "import src, src.visualization, src.analysis, src.budget, src.utils_io; "
+        "print(sorted(m for m in ('plotly.express', 'kaleido') if m in sys.modules))"
+    ) % str(root)
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == "[]"
+    assert list(tmp_path.iterdir()) == []  # no logs/ or results/ directories
+
+
+def test_render_charts_skips_unchanged_data(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_write_images(figures, paths, jobs):
+        calls.append([path.name for path in paths])
+        for path in paths:
+            path.write_bytes(b"png")
+
+    monkeypatch.setattr(visualization, "_kaleido_available", lambda: True)
+    monkeypatch.setattr(visualization, "_write_images", fake_write_images)
+
+    datasets = {"alice": sample_df(), "bob": sample_df().assign(amount=[-5, -5, -5])}
+    first = render_dataset_charts(datasets, tmp_path)
+    assert len(first.rendered) == 4 and not first.skipped
+    assert calls == [["alice-category.png", "alice-monthly.png", "bob-category.png", "bob-monthly.png"]]
+
+    datasets["bob"] = sample_df().assign(amount=[-7, -5, -5])
+    second = render_dataset_charts(datasets, tmp_path)
+    assert [p.name for p in second.rendered] == ["bob-category.png", "bob-monthly.png"]
+    assert len(second.skipped) == 2
+
+    forced = render_dataset_charts(datasets, tmp_path, force=True)
+    assert len(forced.rendered) == 4
+
+
+@pytest.mark.skipif(not _KALEIDO_AVAILABLE, reason="kaleido is required for static export")
+def test_render_dataset_charts_to_file(tmp_path):
+    report = render_dataset_charts({"sample": sample_df()}, tmp_path)
+    assert all(path.exists() for path in report.rendered)
+    assert report.images_per_second > 0